@@ -9,12 +9,21 @@ echo ================================================================
 echo.
 
 REM Clean previous builds
-echo [1/3] Cleaning previous builds...
+echo [1/4] Cleaning previous builds...
 if exist build rmdir /s /q build
 if exist dist rmdir /s /q dist
 if exist __pycache__ rmdir /s /q __pycache__
 
-echo [2/3] Building with PyInstaller (onedir mode)...
+echo [2/4] Precompiling the startup bundle...
+python tools\build_startup_bundle.py --output build\startup.bundle
+if errorlevel 1 (
+    echo.
+    echo [ERROR] Startup bundle build failed!
+    pause
+    exit /b 1
+)
+
+echo [3/4] Building with PyInstaller (onedir mode)...
 echo.
 
 REM Build with PyInstaller using onedir mode for faster startup
@@ -26,11 +35,14 @@ pyinstaller ^
   --strip ^
   --noconfirm ^
   --add-data "src;src" ^
+  --add-data "build\startup.bundle;." ^
   --hidden-import=PySide6.QtCore ^
   --hidden-import=PySide6.QtGui ^
   --hidden-import=PySide6.QtWidgets ^
   --hidden-import=PySide6.QtWebEngineCore ^
   --hidden-import=PySide6.QtWebEngineWidgets ^
+  --hidden-import=PySide6.QtWebChannel ^
+  --hidden-import=PySide6.QtNetwork ^
   --exclude-module=tkinter ^
   --exclude-module=test ^
   --exclude-module=unittest ^
@@ -57,7 +69,7 @@ if errorlevel 1 (
 )
 
 echo.
-echo [3/3] Build complete!
+echo [4/4] Build complete!
 echo.
 echo ================================================================
 echo  Output: dist\ChatGPT_Sidebar\
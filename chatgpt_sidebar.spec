@@ -105,31 +105,73 @@ def remove_unnecessary_files(binaries, datas):
     
     return binaries, filtered_datas
 
+# Precompiled startup bundle (tools/build_startup_bundle.py), served before the PYZ archive
+startup_bundle = os.path.join(current_dir, 'build', 'startup.bundle')
+bundle_datas = [(startup_bundle, '.')] if os.path.exists(startup_bundle) else []
+
 # Define the analysis
 a = Analysis(
     ['main.py'],  # Use standalone entry point
     pathex=[current_dir, os.path.join(current_dir, 'src')],  # Add src directory to path
     binaries=[],
-    datas=[],  # Don't collect all PySide6 data - only what's needed will be auto-detected
+    datas=bundle_datas,  # Don't collect all PySide6 data - only what's needed will be auto-detected
     hiddenimports=[
         'PySide6.QtCore',
         'PySide6.QtGui', 
         'PySide6.QtWidgets',
         'PySide6.QtWebEngineCore',
         'PySide6.QtWebEngineWidgets',
+        'PySide6.QtWebChannel',
+        'PySide6.QtNetwork',
         # Add refactored package modules
         'chatgpt_sidebar.app',
         'chatgpt_sidebar.main_window',
+        'chatgpt_sidebar.startup_bundle',
         'chatgpt_sidebar.ui.topbar',
         'chatgpt_sidebar.ui.sidebar',
+        'chatgpt_sidebar.ui.settings_view',
         'chatgpt_sidebar.ui.theme',
+        'chatgpt_sidebar.ui.stylesheet',
+        'chatgpt_sidebar.ui.icon_cache',
+        'chatgpt_sidebar.ui.splash',
+        'chatgpt_sidebar.ui.tabbar',
+        'chatgpt_sidebar.ui.diagnostics_view',
+        'chatgpt_sidebar.ui.tray',
         'chatgpt_sidebar.web.engine_qtwebengine',
+        'chatgpt_sidebar.web.page',
+        'chatgpt_sidebar.web.tabs',
+        'chatgpt_sidebar.web.js_queue',
+        'chatgpt_sidebar.web.bridge',
+        'chatgpt_sidebar.web.page_scripts',
+        'chatgpt_sidebar.ipc.protocol',
+        'chatgpt_sidebar.ipc.server',
+        'chatgpt_sidebar.ipc.client',
+        'chatgpt_sidebar.ipc.instance',
+        'chatgpt_sidebar.ipc.commands',
+        'chatgpt_sidebar.ipc.responses',
+        'chatgpt_sidebar.ipc.batches',
+        'chatgpt_sidebar.ipc.diag',
         'chatgpt_sidebar.platform.appbar_win',
+        'chatgpt_sidebar.platform.memory_win',
+        'chatgpt_sidebar.platform.idle_win',
+        'chatgpt_sidebar.platform.hotkey_win',
         'chatgpt_sidebar.features.screenshot',
         'chatgpt_sidebar.features.paste_js',
+        'chatgpt_sidebar.features.transfer',
+        'chatgpt_sidebar.features.batch',
+        'chatgpt_sidebar.features.memory_watchdog',
         'chatgpt_sidebar.settings.config',
         'chatgpt_sidebar.utils.logging',
         'chatgpt_sidebar.utils.paths',
+        'chatgpt_sidebar.utils.milestones',
+        'chatgpt_sidebar.utils.stats',
+        'chatgpt_sidebar.utils.diagnostics',
+        'chatgpt_sidebar.utils.perf_monitor',
+        'chatgpt_sidebar.utils.memory_sampler',
+        'chatgpt_sidebar.utils.stall_detector',
+        'chatgpt_sidebar.utils.tracing',
+        'chatgpt_sidebar.utils.idle_scheduler',
+        'chatgpt_sidebar.utils.cache_pruner',
     ],
     hookspath=[],
     hooksconfig={},
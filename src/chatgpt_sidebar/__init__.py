@@ -1,3 +1,8 @@
 """ChatGPT Sidebar - A Windows sidebar application for ChatGPT."""
 
 __version__ = "1.0.0"
+
+# Serve the package's modules from the precompiled startup bundle when there is one
+from .startup_bundle import install_default as _install_startup_bundle
+
+_install_startup_bundle()
@@ -1,11 +1,14 @@
 """Application bootstrap and main entry point."""
 
+import os
 import sys
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication, QMessageBox
 
-from .constants import DEFAULT_WIDTH, DEFAULT_URL
-from .main_window import MainWindow
+from .constants import DEFAULT_WIDTH, DEFAULT_URL, TRACE_FILE_NAME
 from .utils.logging import setup_logging, get_logger
+from .utils import diagnostics, milestones, tracing
+from . import startup_bundle
 
 
 logger = get_logger(__name__)
@@ -31,21 +34,78 @@ def main() -> None:
     )
     parser.add_argument(
         "--url",
-        default=DEFAULT_URL,
+        default=None,
         help="URL to load in embedded webview (default: https://chat.openai.com/)"
     )
+    parser.add_argument(
+        "--attach",
+        action="append",
+        default=[],
+        metavar="FILE",
+        help="Attach a file to the chat (can be repeated)"
+    )
+    parser.add_argument(
+        "--no-single-instance",
+        action="store_true",
+        help="Start a new instance even if one is already running for this profile"
+    )
     parser.add_argument(
         "--enable-logging",
         action="store_true",
         help="Enable logging to console and file (disabled by default)"
     )
+    parser.add_argument(
+        "--trace-startup",
+        nargs="?",
+        const=TRACE_FILE_NAME,
+        default=None,
+        metavar="FILE",
+        help=f"Write a Chrome trace of startup phases and handlers (default file: {TRACE_FILE_NAME})"
+    )
     args = parser.parse_args()
     
     # Setup logging
     setup_logging(args.enable_logging)
     
+    # Report modules served from the precompiled startup bundle
+    bundle = startup_bundle.installed()
+    if bundle is not None:
+        logger.info(f"Startup bundle in use: {bundle.path}")
+        diagnostics.register("startup_bundle", bundle.get_diagnostics)
+    
+    # Enable tracing before the instrumented modules are imported
+    if args.trace_startup:
+        tracing.enable(os.path.abspath(args.trace_startup))
+    
+    # Hand the launch over to a running instance if there is one
+    instance = None
+    if not args.no_single_instance:
+        # Lazy import IPC (only needed in single-instance mode)
+        from .ipc.instance import SingleInstance
+        from .ipc.protocol import CMD_ACTIVATE, CMD_DIAGNOSTICS
+        
+        instance = SingleInstance()
+        if not instance.acquire():
+            logger.info("Another instance is running; forwarding arguments")
+            forwarded = instance.forward({
+                "cmd": CMD_ACTIVATE,
+                "url": args.url,
+                "attach": [os.path.abspath(path) for path in args.attach],
+            })
+            sys.exit(0 if forwarded else 1)
+    
     # Create QApplication
-    app = QApplication(sys.argv)
+    with tracing.span("QApplication"):
+        app = QApplication(sys.argv)
+    milestones.mark("qapplication")
+    
+    # Watch the GUI thread once the event loop runs (the heartbeat can't beat before
+    # that, so building the window would otherwise be recorded as a stall)
+    from .utils.stall_detector import StallDetector
+    stall_detector = StallDetector(parent=app)
+    QTimer.singleShot(0, stall_detector.start)
+    diagnostics.register("stalls", stall_detector.get_diagnostics)
+    app.aboutToQuit.connect(stall_detector.stop)
     
     # Lazy import signal (only needed for signal handlers)
     import signal
@@ -60,15 +120,37 @@ def main() -> None:
     signal.signal(signal.SIGTERM, signal_handler)
     
     try:
+        # Lazy import MainWindow (not needed when forwarding to a running instance)
+        with tracing.span("import main_window"):
+            from .main_window import MainWindow
+        
         # Create main window
         # Note: MainWindow handles its own show() after proper initialization
         window = MainWindow(
             desired_width=args.width,
-            url=args.url
+            url=args.url or DEFAULT_URL
         )
+        for path in args.attach:
+            window.attach_file(os.path.abspath(path))
         
-        logger.info("Application started successfully")
+        # Accept launches forwarded by later instances and the command API
+        if instance is not None:
+            from .ipc.batches import BatchApi
+            from .ipc.commands import CommandApi
+            from .ipc.responses import ResponseStream
+            from .ipc.server import IpcServer
+            
+            server = IpcServer(app)
+            server.register(CMD_ACTIVATE, lambda conn, message: _on_activate(window, conn, message))
+            server.register(CMD_DIAGNOSTICS, lambda conn, message: conn.reply(message, **diagnostics.collect()))
+            CommandApi(server, window)
+            ResponseStream(server, window)
+            BatchApi(server, window)
+            server.listen()
         
+        app.aboutToQuit.connect(tracing.write)
+        logger.info("Application started successfully")
+    
     except Exception as e:
         logger.error(f"Application startup failed: {e}")
         QMessageBox.critical(
@@ -82,6 +164,21 @@ def main() -> None:
     sys.exit(app.exec())
 
 
+def _on_activate(window, conn, message: dict) -> None:
+    """Apply arguments forwarded by a second launch.
+    
+    Args:
+        window: Main window
+        conn: IPC connection to acknowledge
+        message: Activate request
+    """
+    logger.info("Activated by another launch")
+    window.activate(url=message.get("url"))
+    for path in message.get("attach") or []:
+        window.attach_file(path)
+    conn.reply(message)
+
+
 if __name__ == "__main__":
     main()
 
@@ -13,6 +13,8 @@ WEB_ENGINE_INIT_DELAY_MS = 100  # Delay before initializing web engine to show U
 TOAST_DURATION_MS = 3000  # Standard toast notification duration
 SCREENSHOT_TOAST_DURATION_MS = 1500  # Quick toast for screenshot feedback
 SETTINGS_SAVE_DELAY_MS = 500  # Debounce delay for auto-saving settings
+SPLASH_FADE_DELAY_MS = 150  # Grace period after load for the web view's first paint
+SPLASH_FADE_MS = 250  # Cross-fade from the snapshot splash to the live page
 
 # UI dimensions
 TOPBAR_HEIGHT_PX = 34  # Height of the top control bar
@@ -20,6 +22,123 @@ BUTTON_SIZE_PX = 26  # Size of control buttons
 BUTTON_PADDING_PX = 4  # Padding inside buttons
 BUTTON_SPACING_PX = 4  # Spacing between buttons
 LAYOUT_MARGIN_PX = 6  # Margin around layout
+ICON_SIZE_PX = 20  # Logical size of drawn control icons
+
+# Session snapshot (startup splash)
+SNAPSHOT_SCALE = 0.5  # Downscale factor applied before saving
+SNAPSHOT_JPEG_QUALITY = 70  # JPEG quality (0-100) of the saved snapshot
+
+# ChatGPT page integration
+COMPOSER_SELECTOR = (
+    '[data-testid="composer"] textarea, '
+    '[contenteditable="true"][data-testid="textbox"], '
+    'div[contenteditable="true"]'
+)
+ASSISTANT_MESSAGE_SELECTOR = '[data-message-author-role="assistant"]'
+CONVERSATION_TURN_SELECTOR = 'article[data-testid^="conversation-turn-"]'  # One user or assistant turn
+STOP_BUTTON_SELECTOR = '[data-testid="stop-button"]'  # Present while a response is streaming
+SEND_BUTTON_SELECTOR = '[data-testid="send-button"]'  # Submits the composer's contents
+JS_QUEUE_TIMEOUT_MS = 10000  # Default time allowed for a queued script from when it starts running
+JS_QUEUE_READY_TIMEOUT_MS = 60000  # Time a queued script may wait for the page to load (or the composer to render)
+JS_QUEUE_LATENCY_SAMPLES = 200  # Recent calls kept for queue latency statistics
+
+# Renderer crash/hang recovery
+RECOVERY_RESTORE = "restore"  # Rebuild the page and reopen the last URL
+RECOVERY_HOME = "home"  # Rebuild the page and open the start URL
+RECOVERY_OFF = "off"  # Leave a crashed page as is
+RENDERER_HEARTBEAT_MS = 2000  # Interval between renderer liveness checks
+RENDERER_HANG_TIMEOUT_MS = 15000  # Default time without a heartbeat reply before the renderer counts as hung
+RECOVERY_LOOP_WINDOW_MS = 30000  # A second recovery within this window reopens the start URL
+
+# Warm standby page for new chats
+STANDBY_BUILD_DELAY_MS = 5000  # Wait after startup or a swap before preloading the next standby page
+STANDBY_MAX_AGE_MS = 30 * 60 * 1000  # Older standby pages are rebuilt instead of shown (stale session state)
+STANDBY_MIN_TOTAL_MEMORY_MB = 6 * 1024  # No standby page on machines with less physical memory
+STANDBY_MIN_AVAILABLE_MEMORY_MB = 1536  # No standby page while less memory is available
+
+# Long conversation rendering
+LONG_CHAT_OFF = "off"  # Leave the page's rendering alone
+LONG_CHAT_CONTAIN = "contain"  # content-visibility: auto on conversation turns
+LONG_CHAT_COLLAPSE = "collapse"  # Also collapse turns far above the viewport into placeholders
+LONG_CHAT_INTRINSIC_HEIGHT_PX = 400  # Height assumed for a turn that has never been rendered
+LONG_CHAT_COLLAPSE_VIEWPORTS = 3  # Turns further than this many viewport heights above are collapsed
+LONG_CHAT_COLLAPSE_MIN_TURNS = 40  # Conversations shorter than this are never collapsed
+LONG_CHAT_SCAN_MS = 1000  # Delay between DOM changes and the rescan for new turns
+
+# Performance monitor (page long tasks, JS heap, event-loop delay)
+PERF_REPORT_MS = 5000  # Default interval between page reports (0 disables the monitor)
+PERF_LAG_SAMPLE_MS = 250  # Interval of the event-loop delay probes in the page and in Qt
+PERF_HISTORY = 60  # Page reports kept for diagnostics
+PERF_QT_SAMPLES = 1200  # Qt event-loop delay samples kept for diagnostics
+PERF_STALL_MS = 50  # Qt event-loop delays above this count as stalls
+DIAGNOSTICS_REFRESH_MS = 2000  # Refresh interval of the diagnostics view while it is shown
+
+# GUI thread stall detector
+STALL_HEARTBEAT_MS = 100  # Interval of the GUI thread heartbeat and of the watchdog checks
+STALL_THRESHOLD_MS = 500  # Heartbeat age that counts as a stall (the GUI stack is captured)
+STALL_HISTORY = 200  # Stall events kept for diagnostics
+STALL_MAX_STACKS = 50  # Distinct stall stacks kept (least recently seen dropped first)
+
+# Idle-time task scheduler
+IDLE_TICK_MS = 50  # Interval of idle checks while tasks are queued
+IDLE_BUDGET_MS = 8  # Task time per tick (checked between slices)
+IDLE_HISTORY = 50  # Completed tasks kept for diagnostics
+IDLE_PRIORITY_HIGH = 0
+IDLE_PRIORITY_NORMAL = 1
+IDLE_PRIORITY_LOW = 2
+IDLE_WORK_DELAY_MS = 5000  # Time after the composer is ready before startup idle work is queued
+
+# App cache maintenance (idle task)
+CACHE_MAX_AGE_DAYS = 30  # Files not modified for this long are deleted
+CACHE_MAX_MB = 64  # Oldest files are deleted beyond this total size
+CACHE_SCAN_BATCH = 32  # Directory entries examined per idle slice
+ICON_CACHE_VERSION = 1  # Bump when icon drawing changes (ignores PNGs rendered by older versions)
+
+# Tray resident mode
+CLOSE_EXIT = "exit"  # Closing the sidebar quits the process
+CLOSE_TRAY = "tray"  # Closing hides to the tray; the page is frozen and reshown instantly
+DEFAULT_HOTKEY = "Ctrl+Alt+Space"  # Global show/hide hotkey in resident mode
+RESIDENT_SHOW_SAMPLES = 100  # Show latencies kept for diagnostics
+RESIDENT_MEMORY_DELAY_MS = 10000  # Time after hiding before the resident memory cost is read
+
+# Live window placement (edge, width, dock mode, always on top)
+FRAME_BUDGET_MS = 16  # One frame at 60 Hz; placement changes should complete within it
+PLACEMENT_HISTORY = 50  # Placement changes kept for diagnostics
+
+# Memory sampler and renderer watchdog
+MEMORY_SAMPLE_MS = 15000  # Interval between samples of the process tree (sampler thread)
+MEMORY_HISTORY = 24 * 60 * 4  # Samples kept in the rolling series (24 hours at 15 s)
+MEMORY_WATCHDOG_CHECK_MS = 5000  # Interval of idle checks while a reload is pending
+MEMORY_WATCHDOG_IDLE_MS = 60000  # User input idle time that counts as idle while the sidebar is active
+MEMORY_WATCHDOG_COOLDOWN_MS = 30 * 60 * 1000  # Minimum time between watchdog reloads
+
+# Chat tabs
+TABBAR_HEIGHT_PX = 28  # Height of the tab strip
+MAX_LIVE_TABS = 3  # Default number of tabs that keep a live page (renderer)
+MAX_SAVED_TABS = 20  # Tabs remembered for the next launch
+TAB_SCROLL_CAPTURE_TIMEOUT_MS = 1000  # How long to wait for a tab's page to report its scroll position
+
+# Local IPC (single instance and command API)
+IPC_CONNECT_TIMEOUT_MS = 200  # Per-attempt connection timeout of the IPC client
+IPC_FORWARD_TIMEOUT_MS = 5000  # How long a second launch waits for the running instance
+IPC_MAX_MESSAGE_BYTES = 4 * 1024 * 1024  # Clients sending longer lines are disconnected
+TRANSFER_CHUNK_BYTES = 192 * 1024  # Payload bytes per chunk pushed into the page (multiple of 3 for base64)
+TRANSFER_WINDOW = 4  # Unacknowledged chunks a client keeps in flight
+
+# Streaming response observer
+RESPONSE_FLUSH_MS = 50  # Delay between a DOM change and the delta it produces
+RESPONSE_FLUSH_MAX_MS = 800  # Longest flush delay when backing off to stay within budget
+RESPONSE_CPU_BUDGET_PCT = 2.0  # Share of page main-thread time the observer may use
+RESPONSE_HISTORY = 8  # Recent messages kept in Python to resync lagging subscribers
+RESPONSE_SUBSCRIBER_MAX_PENDING = 1024 * 1024  # Unsent bytes before a subscriber counts as lagging
+
+# Batch prompt runner
+BATCH_WORKERS = 2  # Default number of hidden pages working in parallel
+BATCH_MAX_WORKERS = 6  # Upper bound on hidden pages (each one is a renderer process)
+BATCH_RETRIES = 2  # Extra attempts for a prompt that failed or timed out
+BATCH_PROMPT_TIMEOUT_MS = 180000  # Time allowed per attempt, from opening a new chat to the finished reply
+BATCH_SUBMIT_ATTEMPTS = 20  # Tries to click the send button (it is disabled until the text registers)
+BATCH_SUBMIT_RETRY_MS = 250  # Delay between send button tries
 
 # Appearance defaults
 THEME_SYSTEM = "system"
@@ -48,4 +167,5 @@ OPACITY_MAX = 1.0
 APP_ORGANIZATION = "ChatGPTSidebar"
 APP_NAME = "App"
 LOG_FILE_NAME = "chatgpt_sidebar.log"
+TRACE_FILE_NAME = "chatgpt_sidebar_trace.json"  # Default output of --trace-startup
 
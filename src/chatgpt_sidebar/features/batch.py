@@ -0,0 +1,349 @@
+"""Batch prompt runner on a pool of hidden pages.
+
+Each worker owns a hidden ``SidebarPage`` on the engine's persistent
+profile (so it shares the visible view's login) and its own ``JsQueue``.
+For every prompt it opens a new chat, inserts the prompt with a chunked
+transfer, clicks send and collects the reply from the response observer
+until its ``done`` event. Prompts are handed out from a single queue, so
+no more than the configured number of pages work at once. Failed or
+timed-out attempts go to the back of the queue until their retries are
+used up.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
+from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEngineScript
+
+from .transfer import send_text
+from ..constants import (
+    JS_QUEUE_TIMEOUT_MS,
+    BATCH_PROMPT_TIMEOUT_MS,
+    BATCH_SUBMIT_ATTEMPTS,
+    BATCH_SUBMIT_RETRY_MS,
+)
+from ..utils.logging import get_logger
+from ..utils.stats import summarize_latencies
+from ..web.js_queue import JsQueue, WAIT_COMPOSER, WAIT_LOAD
+from ..web.page import SidebarPage
+
+
+logger = get_logger(__name__)
+
+
+class BatchJob:
+    """One prompt and the outcome of its attempts."""
+    
+    def __init__(self, index: int, job_id: Any, prompt: str) -> None:
+        self.index = index
+        self.id = job_id
+        self.prompt = prompt
+        self.attempts = 0
+        self.errors: List[str] = []
+        self.first_started: Optional[float] = None
+
+
+class _BatchWorker(QObject):
+    """Runs prompts one at a time on its own hidden page."""
+    
+    # Emitted with the job, whether it succeeded, and the reply text or error
+    finished = Signal(object, bool, str)
+    
+    def __init__(self, profile: QWebEngineProfile, url: str, timeout_ms: int,
+                 parent: Optional[QObject] = None) -> None:
+        """Create the worker's page.
+        
+        Args:
+            profile: Profile shared with the visible web view
+            url: Page that starts a new chat
+            timeout_ms: Time allowed per attempt
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._url = url
+        self._job: Optional[BatchJob] = None
+        self._stage = None
+        self._attempt = 0
+        self._message = None
+        self._text = ""
+        
+        self._page = SidebarPage(profile, self)
+        # Pages without a view count as hidden, and Chromium throttles timers in hidden pages
+        self._page.setVisible(True)
+        self._page.composer_ready.connect(self._on_composer_ready)
+        self._page.bridge.response_event.connect(self._on_response_event)
+        self._page.renderProcessTerminated.connect(lambda *args: self._fail("renderer terminated"))
+        self._queue = JsQueue(self._page, self)
+        
+        self._timeout_ms = timeout_ms
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(lambda: self._fail(f"timed out after {self._timeout_ms} ms"))
+    
+    def evaluate_js(self, js: str, callback: Optional[Callable[[Any], None]] = None,
+                    wait_for: str = WAIT_LOAD, timeout_ms: int = JS_QUEUE_TIMEOUT_MS,
+                    isolated: bool = False, coalesce: bool = False) -> None:
+        """Queue JavaScript on the worker's page (same signature as the engine's).
+        
+        Args:
+            js: JavaScript code to evaluate
+            callback: Optional callback to receive result (None on timeout)
+            wait_for: Readiness level to wait for (see web/js_queue.py)
+            timeout_ms: Time allowed from when the script starts running until the result arrives
+            isolated: Run in the isolated world shared with the injected page scripts
+            coalesce: Merge with an identical pending call (scripts without side effects only)
+        """
+        world_id = QWebEngineScript.ApplicationWorld if isolated else QWebEngineScript.MainWorld
+        self._queue.submit(js, callback, wait_for, timeout_ms, int(world_id), coalesce)
+    
+    def start(self, job: BatchJob) -> None:
+        """Run one attempt of a prompt in a new chat.
+        
+        Args:
+            job: Prompt to run
+        """
+        self._job = job
+        self._attempt += 1
+        self._stage = "loading"
+        self._message = None
+        self._text = ""
+        job.attempts += 1
+        if job.first_started is None:
+            job.first_started = time.perf_counter()
+        self._timer.start(self._timeout_ms)
+        self._page.load(QUrl(self._url))
+    
+    def stop(self) -> None:
+        """Abandon the current prompt and release the page's renderer."""
+        self._timer.stop()
+        self._job = None
+        self._stage = None
+        self.deleteLater()
+    
+    def _on_composer_ready(self) -> None:
+        """Insert the prompt once the new chat accepts input."""
+        if self._stage != "loading":
+            return
+        self._stage = "inserting"
+        attempt = self._attempt
+        self.evaluate_js("window.__sidebar.responses.enable(true)", wait_for=WAIT_COMPOSER, isolated=True)
+        send_text(self, self._job.prompt, lambda ok: self._on_inserted(attempt, ok))
+    
+    def _on_inserted(self, attempt: int, ok: bool) -> None:
+        """Submit the prompt after it has been inserted.
+        
+        Args:
+            attempt: Attempt the insert belongs to
+            ok: Whether the text reached the composer
+        """
+        if attempt != self._attempt or self._stage != "inserting":
+            return
+        if not ok:
+            self._fail("couldn't insert the prompt")
+            return
+        self._stage = "submitting"
+        self._submit(attempt, BATCH_SUBMIT_ATTEMPTS)
+    
+    def _submit(self, attempt: int, tries_left: int) -> None:
+        """Click the send button, retrying while it is still disabled.
+        
+        Args:
+            attempt: Attempt the click belongs to
+            tries_left: Remaining tries
+        """
+        # A retry may come after the attempt timed out, finished or was stopped
+        if attempt != self._attempt or self._stage != "submitting":
+            return
+        
+        def on_result(clicked) -> None:
+            if attempt != self._attempt or self._stage != "submitting":
+                return
+            if clicked:
+                self._stage = "waiting"
+            elif tries_left > 1:
+                QTimer.singleShot(BATCH_SUBMIT_RETRY_MS, self, lambda: self._submit(attempt, tries_left - 1))
+            else:
+                self._fail("send button stayed disabled")
+        
+        self.evaluate_js("window.__sidebar.prompt.submit()", on_result, wait_for=WAIT_COMPOSER, isolated=True)
+    
+    def _on_response_event(self, event: Dict[str, Any]) -> None:
+        """Collect the reply to the submitted prompt.
+        
+        Args:
+            event: Event from the page's response observer
+        """
+        if self._stage != "waiting":
+            return
+        kind = event.get("type")
+        if self._message is None:
+            self._message = event.get("message")
+        elif event.get("message") != self._message:
+            return
+        
+        if kind == "delta":
+            self._text += event.get("delta", "")
+        elif kind == "reset":
+            self._text = event.get("text", "")
+        elif kind == "done":
+            self._complete(True, self._text)
+    
+    def _fail(self, reason: str) -> None:
+        """End the current attempt with an error.
+        
+        Args:
+            reason: Error description
+        """
+        if self._job is not None:
+            logger.warning(f"Batch prompt {self._job.id} attempt {self._job.attempts} failed: {reason}")
+            self._complete(False, reason)
+    
+    def _complete(self, ok: bool, value: str) -> None:
+        """Report the attempt and become idle.
+        
+        Args:
+            ok: Whether a reply was received
+            value: Reply text or error
+        """
+        job = self._job
+        self._timer.stop()
+        self._job = None
+        self._stage = None
+        self.finished.emit(job, ok, value)
+
+
+class BatchRunner(QObject):
+    """Fans a list of prompts out across a bounded pool of hidden pages."""
+    
+    # Emitted with each prompt's final result
+    result = Signal(dict)
+    
+    # Emitted once with the run summary (also after cancel())
+    finished = Signal(dict)
+    
+    def __init__(self, profile: QWebEngineProfile, prompts: List[Dict[str, Any]], url: str,
+                 workers: int, retries: int, timeout_ms: int = BATCH_PROMPT_TIMEOUT_MS,
+                 parent: Optional[QObject] = None) -> None:
+        """Initialize the runner (call start() to begin).
+        
+        Args:
+            profile: Profile shared with the visible web view
+            prompts: Prompts as {"id": ..., "prompt": ...}
+            url: Page that starts a new chat
+            workers: Maximum pages working at once
+            retries: Extra attempts per prompt
+            timeout_ms: Time allowed per attempt
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._jobs: Deque[BatchJob] = deque(
+            BatchJob(i, p.get("id", i), p["prompt"]) for i, p in enumerate(prompts))
+        self._total = len(self._jobs)
+        self._retries = retries
+        self._workers = [_BatchWorker(profile, url, timeout_ms, self)
+                         for _ in range(max(1, min(workers, self._total)))]
+        for worker in self._workers:
+            worker.finished.connect(
+                lambda job, ok, value, worker=worker: self._on_worker_finished(worker, job, ok, value))
+        
+        self._done = 0
+        self._succeeded = 0
+        self._attempts = 0
+        self._latencies_ms: List[float] = []
+        self._started = 0.0
+        self._running = False
+    
+    def worker_count(self) -> int:
+        """Get the size of the page pool.
+        
+        Returns:
+            int: Number of hidden pages
+        """
+        return len(self._workers)
+    
+    def start(self) -> None:
+        """Hand the first prompts to the workers."""
+        self._started = time.perf_counter()
+        self._running = True
+        logger.info(f"Batch started: {self._total} prompts on {len(self._workers)} pages")
+        for worker in self._workers:
+            self._dispatch(worker)
+        if not self._total:
+            self._finish(cancelled=False)
+    
+    def cancel(self) -> None:
+        """Stop all workers and report what has finished so far."""
+        if self._running:
+            logger.info("Batch cancelled")
+            self._finish(cancelled=True)
+    
+    def _dispatch(self, worker: _BatchWorker) -> None:
+        """Give an idle worker the next prompt, if any.
+        
+        Args:
+            worker: Idle worker
+        """
+        if self._running and self._jobs:
+            worker.start(self._jobs.popleft())
+    
+    def _on_worker_finished(self, worker: _BatchWorker, job: BatchJob, ok: bool, value: str) -> None:
+        """Record an attempt and keep the worker busy.
+        
+        Args:
+            worker: Worker that ran the attempt
+            job: Prompt that was attempted
+            ok: Whether a reply was received
+            value: Reply text or error
+        """
+        if not self._running:
+            return
+        self._attempts += 1
+        if not ok and job.attempts <= self._retries:
+            job.errors.append(value)
+            self._jobs.append(job)
+        else:
+            elapsed_ms = (time.perf_counter() - job.first_started) * 1000
+            result = {"index": job.index, "id": job.id, "ok": ok, "attempts": job.attempts,
+                      "elapsed_ms": round(elapsed_ms, 1)}
+            if ok:
+                result["response"] = value
+                self._succeeded += 1
+                self._latencies_ms.append(elapsed_ms)
+            else:
+                result["error"] = value
+            if job.errors:
+                result["retried_after"] = job.errors
+            self._done += 1
+            self.result.emit(result)
+        
+        if self._done == self._total:
+            self._finish(cancelled=False)
+        else:
+            self._dispatch(worker)
+    
+    def _finish(self, cancelled: bool) -> None:
+        """Release the pages and emit the summary.
+        
+        Args:
+            cancelled: Whether the run was stopped early
+        """
+        self._running = False
+        for worker in self._workers:
+            worker.stop()
+        
+        wall_s = time.perf_counter() - self._started
+        summary = {
+            "prompts": self._total,
+            "completed": self._done,
+            "succeeded": self._succeeded,
+            "failed": self._done - self._succeeded,
+            "cancelled": cancelled,
+            "attempts": self._attempts,
+            "workers": len(self._workers),
+            "wall_ms": round(wall_s * 1000, 1),
+            "prompts_per_min": round(self._succeeded / wall_s * 60, 2) if wall_s else None,
+            "latency_ms": summarize_latencies(self._latencies_ms),
+        }
+        logger.info(f"Batch finished: {summary}")
+        self.finished.emit(summary)
@@ -0,0 +1,190 @@
+"""Renderer memory watchdog.
+
+Watches the samples of ``MemorySampler``. When the renderer of the visible
+page uses more private memory than the configured budget, a reload is
+scheduled for the next idle moment: no reply is streaming and the user
+hasn't touched the keyboard or mouse for a while (or the sidebar is
+hidden). The page is then rebuilt on a fresh renderer at the same URL and
+the composer draft is typed back in once the new page is ready.
+
+A page frozen in resident mode can't answer scripts, so it is rebuilt
+directly with the draft read just before it was frozen (remember_draft()).
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict, Optional
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from .transfer import send_text
+from ..constants import (
+    COMPOSER_SELECTOR,
+    STOP_BUTTON_SELECTOR,
+    MEMORY_WATCHDOG_CHECK_MS,
+    MEMORY_WATCHDOG_COOLDOWN_MS,
+)
+from ..utils.logging import get_logger
+from ..web.js_queue import WAIT_COMPOSER
+
+
+logger = get_logger(__name__)
+
+
+_MB = 1024 * 1024
+
+# Composer draft and streaming state, read just before reloading
+_PAGE_STATE_JS = f"""
+(function(){{
+  const composer = document.querySelector({json.dumps(COMPOSER_SELECTOR)});
+  const draft = composer ? (composer.value !== undefined ? composer.value : composer.innerText) : '';
+  return {{ draft: draft, streaming: !!document.querySelector({json.dumps(STOP_BUTTON_SELECTOR)}) }};
+}})()"""
+
+
+class MemoryWatchdog(QObject):
+    """Reloads the visible page on a fresh renderer when it outgrows its budget."""
+    
+    # Emitted with the renderer's private bytes (MB) just before a reload
+    reloading = Signal(int)
+    # Emitted once the new page's composer is ready and the draft is restored
+    reloaded = Signal()
+    
+    def __init__(self, engine: Any, is_user_active: Callable[[], bool], parent: Optional[QObject] = None) -> None:
+        """Initialize the watchdog (disabled until set_budget_mb()).
+        
+        Args:
+            engine: Web engine whose visible page is watched
+            is_user_active: Returns True while the user may be looking at the page
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._engine = engine
+        self._is_user_active = is_user_active
+        self._budget_mb = 0
+        self._pending_mb = 0
+        self._checking = False
+        self._last_reload = 0.0
+        self._reloads = 0
+        self._draft = ""
+        self._draft_connected = False
+        self._frozen_draft = ""
+        
+        self._idle_timer = QTimer(self)
+        self._idle_timer.timeout.connect(self._check_idle)
+    
+    def set_budget_mb(self, budget_mb: int) -> None:
+        """Set the renderer's private memory budget.
+        
+        Args:
+            budget_mb: Budget in MB (0 disables the watchdog)
+        """
+        self._budget_mb = max(0, budget_mb)
+        if not self._budget_mb:
+            self._pending_mb = 0
+            self._idle_timer.stop()
+        logger.info(f"Renderer memory budget: {self._budget_mb or 'off'} MB")
+    
+    def on_sample(self, sample: Dict[str, Any]) -> None:
+        """Check the visible page's renderer against the budget.
+        
+        Args:
+            sample: Sample from MemorySampler.sampled
+        """
+        if not self._budget_mb or self._pending_mb:
+            return
+        renderers = self._engine.get_renderer_pids()
+        active = [p for p in sample["processes"] if renderers.get(p["pid"]) == "active"]
+        if not active:
+            return
+        private_mb = active[0]["private"] // _MB
+        if private_mb <= self._budget_mb:
+            return
+        if self._last_reload and (time.monotonic() - self._last_reload) * 1000 < MEMORY_WATCHDOG_COOLDOWN_MS:
+            return
+        
+        logger.warning(f"Renderer uses {private_mb} MB (budget {self._budget_mb} MB); reloading when idle")
+        self._pending_mb = private_mb
+        self._idle_timer.start(MEMORY_WATCHDOG_CHECK_MS)
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Report the watchdog's state.
+        
+        Returns:
+            Dict[str, Any]: Budget, pending reload and reload count
+        """
+        return {"budget_mb": self._budget_mb, "pending_mb": self._pending_mb or None, "reloads": self._reloads}
+    
+    def remember_draft(self, callback: Callable[[], None]) -> None:
+        """Read the composer draft before the page is frozen.
+        
+        Args:
+            callback: Called once the draft is read (or the page didn't answer)
+        """
+        if not self._budget_mb:
+            callback()
+            return
+        
+        def on_state(state: Optional[Dict[str, Any]]) -> None:
+            self._frozen_draft = (state.get("draft") or "") if isinstance(state, dict) else ""
+            callback()
+        
+        self._engine.evaluate_js(_PAGE_STATE_JS, on_state, isolated=True)
+    
+    def _check_idle(self) -> None:
+        """Reload once the user and the page are idle."""
+        if not self._pending_mb or self._checking or self._is_user_active():
+            return
+        if self._engine.is_frozen():
+            # Nothing streams on a frozen page, and it can't answer scripts
+            self._on_page_state({"draft": self._frozen_draft, "streaming": False})
+            return
+        self._checking = True
+        self._engine.evaluate_js(_PAGE_STATE_JS, self._on_page_state, wait_for=WAIT_COMPOSER, isolated=True)
+    
+    def _on_page_state(self, state: Optional[Dict[str, Any]]) -> None:
+        """Reload unless a reply is streaming.
+        
+        Args:
+            state: Draft and streaming flag (None if the page didn't answer)
+        """
+        self._checking = False
+        if not self._pending_mb or not isinstance(state, dict) or state.get("streaming"):
+            return
+        
+        self._idle_timer.stop()
+        private_mb, self._pending_mb = self._pending_mb, 0
+        # Keep the draft exactly as typed; an empty composer may still report a newline
+        draft = state.get("draft") or ""
+        self._draft = draft if draft.strip() else ""
+        self._last_reload = time.monotonic()
+        self._reloads += 1
+        logger.info(f"Reloading renderer at {private_mb} MB"
+                    f"{f' (keeping a {len(self._draft)} character draft)' if self._draft else ''}")
+        
+        self.reloading.emit(private_mb)
+        # Drop the restore of an earlier reload whose composer never became ready
+        self._disconnect_draft()
+        self._engine.composer_ready.connect(self._restore_draft)
+        self._draft_connected = True
+        self._engine.rebuild_page()
+    
+    def _disconnect_draft(self) -> None:
+        """Stop waiting for a composer to restore the draft into."""
+        if self._draft_connected:
+            self._engine.composer_ready.disconnect(self._restore_draft)
+            self._draft_connected = False
+    
+    def _restore_draft(self) -> None:
+        """Type the saved draft into the new page's composer."""
+        self._disconnect_draft()
+        draft, self._draft = self._draft, ""
+        if not draft:
+            self.reloaded.emit()
+            return
+        
+        def on_sent(ok: bool) -> None:
+            if not ok:
+                logger.warning("Couldn't restore the composer draft after reload")
+            self.reloaded.emit()
+        
+        send_text(self._engine, draft, on_sent)
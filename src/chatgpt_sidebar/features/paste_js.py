@@ -2,22 +2,27 @@
 
 import json
 
+from ..constants import COMPOSER_SELECTOR
 
-def build_paste_js(b64_image: str) -> str:
-    """Build JavaScript to inject image via synthetic paste event.
+
+def build_paste_js(b64_data: str, mime_type: str = "image/png", file_name: str = "screenshot.png") -> str:
+    """Build JavaScript to inject a file via synthetic paste event.
     
     Args:
-        b64_image: Base64-encoded image data
+        b64_data: Base64-encoded file data
+        mime_type: MIME type of the file
+        file_name: File name shown in the chat
         
     Returns:
-        str: JavaScript code to paste the image
+        str: JavaScript code to paste the file
     """
-    b64q = json.dumps(b64_image)  # Safe string literal
+    b64q = json.dumps(b64_data)  # Safe string literal
+    mime = json.dumps(mime_type)
+    name = json.dumps(file_name)
+    selector = json.dumps(COMPOSER_SELECTOR)
     return f"""
     (function(){{
-      const composer = document.querySelector(
-        '[data-testid="composer"] textarea, [contenteditable="true"][data-testid="textbox"], div[contenteditable="true"]'
-      );
+      const composer = document.querySelector({selector});
       if (!composer) return false;
       
       function base64ToUint8Array(b64){{
@@ -29,8 +34,8 @@ def build_paste_js(b64_image: str) -> str:
       }}
       
       const bytes = base64ToUint8Array({b64q});
-      const blob = new Blob([bytes], {{ type: 'image/png' }});
-      const file = new File([blob], 'screenshot.png', {{ type: 'image/png' }});
+      const blob = new Blob([bytes], {{ type: {mime} }});
+      const file = new File([blob], {name}, {{ type: {mime} }});
       const dt = new DataTransfer();
       dt.items.add(file);
       
@@ -52,3 +57,4 @@ def build_paste_js(b64_image: str) -> str:
       return composer.dispatchEvent(evt);
     }})();"""
 
+
@@ -0,0 +1,192 @@
+"""Chunked text and file transfers into the chat composer.
+
+Drives the ``window.__sidebar.transfers`` page script (see
+web/page_scripts.py) through the engine's JS queue, so large payloads are
+sent as a series of small scripts instead of one giant string.
+
+At most ``TRANSFER_WINDOW`` chunks are queued at a time. The next chunk is
+read (and encoded) only when an earlier one has been stored by the page,
+so a large file is never held in memory at once and each event on the GUI
+thread handles a single chunk. Every chunk's timeout runs from when the
+queue dispatches it, so waiting for the composer doesn't use it up.
+"""
+
+import base64
+import itertools
+import json
+import os
+from typing import Any, Callable, Iterator, Optional
+
+from ..constants import TRANSFER_CHUNK_BYTES, TRANSFER_WINDOW
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+_transfer_ids = itertools.count(1)
+
+
+def next_transfer_id() -> int:
+    """Allocate a transfer id that is unique within this process.
+    
+    Returns:
+        int: New transfer id
+    """
+    return next(_transfer_ids)
+
+
+def run_transfer_call(engine, call: str, *args,
+                      callback: Optional[Callable[[Any], None]] = None) -> None:
+    """Call a ``window.__sidebar.transfers`` function once the composer is ready.
+    
+    Args:
+        engine: Web engine to run the call on
+        call: Function name ("begin", "append", "end" or "abort")
+        *args: JSON-serializable arguments
+        callback: Receives the function's result (None on timeout)
+    """
+    # Lazy import WAIT_COMPOSER (keeps QtWebEngine out of this module's imports)
+    from ..web.js_queue import WAIT_COMPOSER
+    
+    js = f"window.__sidebar.transfers.{call}({', '.join(json.dumps(a) for a in args)})"
+    engine.evaluate_js(js, callback, wait_for=WAIT_COMPOSER, isolated=True)
+
+
+class _Transfer:
+    """One transfer into the page, sent a window of chunks at a time."""
+    
+    def __init__(self, engine, kind: str, name: str, mime_type: str,
+                 chunks: Iterator[str], callback: Callable[[bool], None]) -> None:
+        """Start the transfer.
+        
+        Args:
+            engine: Web engine (or anything with a compatible evaluate_js) to send through
+            kind: "text" or "file"
+            name: Name of the payload
+            mime_type: MIME type of the payload
+            chunks: Yields the chunk data (text, or base64 for files) on demand
+            callback: Receives True once the payload has been inserted
+        """
+        self._engine = engine
+        self._id = next_transfer_id()
+        self._chunks = chunks
+        self._callback = callback
+        self._seq = 0
+        self._in_flight = 0
+        self._exhausted = False
+        self._finished = False
+        run_transfer_call(engine, "begin", self._id, kind, name, mime_type, callback=self._on_begin)
+    
+    def _on_begin(self, ok: Any) -> None:
+        """Start sending chunks once the page has opened the transfer."""
+        if ok:
+            self._fill()
+        else:
+            self._finish(False)
+    
+    def _on_append(self, ok: Any) -> None:
+        """Send the next chunk once the page has stored one."""
+        self._in_flight -= 1
+        if self._finished:
+            return
+        if ok:
+            self._fill()
+        else:
+            self._abort()
+    
+    def _fill(self) -> None:
+        """Queue chunks until the window is full, then end the transfer after the last one."""
+        while not self._exhausted and self._in_flight < TRANSFER_WINDOW:
+            try:
+                data = next(self._chunks)
+            except StopIteration:
+                self._exhausted = True
+                break
+            except OSError as e:
+                logger.error(f"Transfer {self._id} failed to read: {e}")
+                self._abort()
+                return
+            run_transfer_call(self._engine, "append", self._id, self._seq, data, callback=self._on_append)
+            self._seq += 1
+            self._in_flight += 1
+        
+        if self._exhausted and self._in_flight == 0:
+            self._finished = True
+            run_transfer_call(self._engine, "end", self._id, callback=lambda ok: self._finish(bool(ok)))
+    
+    def _abort(self) -> None:
+        """Discard the transfer in the page and report failure."""
+        run_transfer_call(self._engine, "abort", self._id)
+        self._finish(False)
+    
+    def _finish(self, ok: bool) -> None:
+        """Release the chunk source and report the result.
+        
+        Args:
+            ok: Whether the payload was inserted
+        """
+        self._finished = True
+        self._chunks.close()
+        self._callback(ok)
+
+
+def _file_chunks(f) -> Iterator[str]:
+    """Read and encode a file one chunk at a time.
+    
+    Args:
+        f: File opened in binary mode
+        
+    Yields:
+        str: Base64 of the next chunk
+    """
+    while True:
+        chunk = f.read(TRANSFER_CHUNK_BYTES)
+        if not chunk:
+            return
+        yield base64.b64encode(chunk).decode("ascii")
+
+
+def _text_chunks(text: str) -> Iterator[str]:
+    """Split text into chunks.
+    
+    Args:
+        text: Text to split
+        
+    Yields:
+        str: Next chunk
+    """
+    for start in range(0, len(text), TRANSFER_CHUNK_BYTES):
+        yield text[start:start + TRANSFER_CHUNK_BYTES]
+
+
+def send_file(engine, path: str, mime_type: str, callback: Callable[[bool], None]) -> None:
+    """Attach a local file to the composer in chunks.
+    
+    Args:
+        engine: Web engine to send through
+        path: File to attach
+        mime_type: MIME type of the file
+        callback: Receives True once the file has been pasted
+        
+    Raises:
+        OSError: If the file cannot be opened
+    """
+    f = open(path, "rb")
+    
+    def on_done(ok: bool) -> None:
+        f.close()
+        callback(ok)
+    
+    _Transfer(engine, "file", os.path.basename(path), mime_type, _file_chunks(f), on_done)
+
+
+def send_text(engine, text: str, callback: Callable[[bool], None]) -> None:
+    """Insert text into the composer in chunks.
+    
+    Args:
+        engine: Web engine (or anything with a compatible evaluate_js) to send through
+        text: Text to insert
+        callback: Receives True once the text has been inserted
+    """
+    _Transfer(engine, "text", "message.txt", "text/plain", _text_chunks(text), callback)
@@ -0,0 +1 @@
+"""Local IPC between sidebar instances and external tools."""
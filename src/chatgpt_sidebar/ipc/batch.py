@@ -0,0 +1,156 @@
+"""Command-line client that runs a file of prompts through the sidebar.
+
+Usage:
+    python -m chatgpt_sidebar.ipc.batch prompts.jsonl -o results.jsonl --workers 3
+
+Each input line is a JSON object with a ``prompt`` and an optional ``id``
+(the line number is used otherwise). Prompts run in parallel on hidden
+pages of the running sidebar, each in a new chat; one result line is
+written per prompt as soon as it finishes, and a throughput summary is
+printed at the end.
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List
+
+from . import protocol
+from .client import IpcClient, IpcError
+from ..constants import (
+    DEFAULT_URL,
+    IPC_CONNECT_TIMEOUT_MS,
+    IPC_MAX_MESSAGE_BYTES,
+    BATCH_WORKERS,
+    BATCH_MAX_WORKERS,
+    BATCH_RETRIES,
+    BATCH_PROMPT_TIMEOUT_MS,
+)
+
+
+REPLY_TIMEOUT_MS = 10000
+POLL_TIMEOUT_MS = 1000
+
+
+def load_prompts(path: str) -> List[Dict[str, Any]]:
+    """Read prompts from a JSONL file.
+    
+    Args:
+        path: Input file ('-' reads stdin)
+        
+    Returns:
+        List[Dict[str, Any]]: Prompts as {"id": ..., "prompt": ...}
+        
+    Raises:
+        ValueError: If a line is not an object with a non-empty "prompt"
+    """
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        prompts = []
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if not isinstance(entry, dict) or not isinstance(entry.get("prompt"), str) or not entry["prompt"]:
+                raise ValueError(f"line {line_no}: expected an object with a non-empty \"prompt\"")
+            prompts.append({"id": entry.get("id", line_no), "prompt": entry["prompt"]})
+        return prompts
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Run a JSONL file of prompts through a running ChatGPT Sidebar")
+    parser.add_argument("prompts", help="JSONL file with one {\"prompt\": ...} per line ('-' reads stdin)")
+    parser.add_argument("-o", "--output", help="JSONL file for the results (default: stdout)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS,
+                        help=f"Hidden pages working in parallel (default: {BATCH_WORKERS}, max {BATCH_MAX_WORKERS})")
+    parser.add_argument("--retries", type=int, default=BATCH_RETRIES,
+                        help=f"Extra attempts per failed prompt (default: {BATCH_RETRIES})")
+    parser.add_argument("--timeout", type=float, default=BATCH_PROMPT_TIMEOUT_MS / 1000,
+                        help=f"Seconds allowed per attempt (default: {BATCH_PROMPT_TIMEOUT_MS // 1000})")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"Page that starts a new chat (default: {DEFAULT_URL})")
+    args = parser.parse_args()
+    
+    try:
+        prompts = load_prompts(args.prompts)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if not prompts:
+        parser.error("no prompts to run")
+    
+    request = {
+        "cmd": protocol.CMD_BATCH_RUN,
+        "prompts": prompts,
+        "workers": args.workers,
+        "retries": args.retries,
+        "timeout_ms": int(args.timeout * 1000),
+        "url": args.url,
+    }
+    if len(protocol.encode(request)) > IPC_MAX_MESSAGE_BYTES:
+        parser.error("prompt file is too large for one batch; split it into smaller files")
+    
+    client = IpcClient()
+    if not client.connect(IPC_CONNECT_TIMEOUT_MS * 5):
+        print("ChatGPT Sidebar is not running.", file=sys.stderr)
+        sys.exit(2)
+    
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    failed = 0
+    try:
+        reply = client.request(request, REPLY_TIMEOUT_MS)
+        print(f"Running {reply['prompts']} prompts on {reply['workers']} pages...", file=sys.stderr)
+        
+        done = 0
+        while True:
+            try:
+                event = client.receive(POLL_TIMEOUT_MS)
+            except KeyboardInterrupt:
+                client.send({"cmd": protocol.CMD_BATCH_CANCEL})
+                client.flush(REPLY_TIMEOUT_MS)
+                continue
+            if event is None or "event" not in event:
+                continue
+            if event["event"] == "batch_result":
+                done += 1
+                failed += 0 if event["ok"] else 1
+                event.pop("event")
+                out.write(json.dumps(event, ensure_ascii=False) + "\n")
+                out.flush()
+                status = "ok" if event["ok"] else f"failed: {event['error']}"
+                print(f"[{done}/{len(prompts)}] {event['id']}: {status} "
+                      f"({event['elapsed_ms'] / 1000:.1f} s, {event['attempts']} attempt(s))", file=sys.stderr)
+            elif event["event"] == "batch_done":
+                _print_summary(event)
+                break
+    except IpcError as e:
+        print(f"Failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        client.close()
+        if out is not sys.stdout:
+            out.close()
+    
+    if failed:
+        sys.exit(1)
+
+
+def _print_summary(summary: Dict[str, Any]) -> None:
+    """Print the run summary.
+    
+    Args:
+        summary: batch_done event
+    """
+    latency = summary.get("latency_ms") or {}
+    print(f"{'Cancelled' if summary['cancelled'] else 'Finished'}: "
+          f"{summary['succeeded']}/{summary['prompts']} succeeded, {summary['failed']} failed, "
+          f"{summary['attempts']} attempts on {summary['workers']} pages in {summary['wall_ms'] / 1000:.1f} s "
+          f"({summary.get('prompts_per_min') or 0:.1f} prompts/min), "
+          f"latency p50 {latency.get('p50', 0) / 1000:.1f} s / p95 {latency.get('p95', 0) / 1000:.1f} s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
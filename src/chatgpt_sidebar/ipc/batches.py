@@ -0,0 +1,106 @@
+"""IPC command handlers for the batch prompt runner.
+
+``batch_run`` starts a run of ``features.batch.BatchRunner`` on the main
+window's profile and replies with the pool size. Each finished prompt is
+sent to the requesting connection as a ``batch_result`` event, followed by
+one ``batch_done`` event with the throughput summary. Only one batch runs
+at a time; it is cancelled if its client disconnects.
+"""
+
+from typing import Any, Dict, Optional
+from PySide6.QtCore import QObject
+
+from . import protocol
+from .server import IpcConnection, IpcServer
+from ..constants import (
+    DEFAULT_URL,
+    BATCH_WORKERS,
+    BATCH_MAX_WORKERS,
+    BATCH_RETRIES,
+    BATCH_PROMPT_TIMEOUT_MS,
+)
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class BatchApi(QObject):
+    """Handles batch commands for the main window's engine."""
+    
+    def __init__(self, server: IpcServer, window) -> None:
+        """Register the batch commands.
+        
+        Args:
+            server: IPC server to register with
+            window: MainWindow whose profile the hidden pages use
+        """
+        super().__init__(server)
+        self._window = window
+        self._runner = None
+        self._owner: Optional[IpcConnection] = None
+        
+        server.register(protocol.CMD_BATCH_RUN, self._on_run)
+        server.register(protocol.CMD_BATCH_CANCEL, self._on_cancel)
+    
+    def _on_run(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Validate the prompts and start the runner.
+        
+        Args:
+            conn: Client connection
+            message: Run request
+        """
+        if self._runner is not None:
+            conn.fail(message, "a batch is already running")
+            return
+        if self._window.engine is None:
+            conn.fail(message, "sidebar is still starting")
+            return
+        
+        prompts = message.get("prompts")
+        if not isinstance(prompts, list) or not all(
+                isinstance(p, dict) and isinstance(p.get("prompt"), str) and p["prompt"] for p in prompts):
+            conn.fail(message, "prompts must be a list of objects with a non-empty \"prompt\"")
+            return
+        workers = max(1, min(int(message.get("workers") or BATCH_WORKERS), BATCH_MAX_WORKERS))
+        retries = max(0, int(message.get("retries", BATCH_RETRIES)))
+        timeout_ms = int(message.get("timeout_ms") or BATCH_PROMPT_TIMEOUT_MS)
+        
+        # Lazy import BatchRunner (keeps QtWebEngine out of the IPC import chain)
+        from ..features.batch import BatchRunner
+        
+        runner = BatchRunner(self._window.engine.get_profile(), prompts, message.get("url") or DEFAULT_URL,
+                             workers, retries, timeout_ms, self)
+        runner.result.connect(lambda result: conn.send({"event": "batch_result", **result}))
+        runner.finished.connect(lambda summary: self._on_finished(conn, summary))
+        conn.closed.connect(runner.cancel)
+        self._runner = runner
+        self._owner = conn
+        
+        conn.reply(message, prompts=len(prompts), workers=runner.worker_count())
+        runner.start()
+    
+    def _on_cancel(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Cancel the running batch.
+        
+        Args:
+            conn: Client connection
+            message: Cancel request
+        """
+        if self._runner is None or self._owner is not conn:
+            conn.fail(message, "no batch running on this connection")
+            return
+        conn.reply(message)
+        self._runner.cancel()
+    
+    def _on_finished(self, conn: IpcConnection, summary: Dict[str, Any]) -> None:
+        """Send the summary and allow the next batch.
+        
+        Args:
+            conn: Connection that started the batch
+            summary: Run summary
+        """
+        conn.send({"event": "batch_done", **summary})
+        self._runner.deleteLater()
+        self._runner = None
+        self._owner = None
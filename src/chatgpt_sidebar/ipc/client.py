@@ -0,0 +1,114 @@
+"""Blocking client for the sidebar's local IPC endpoint.
+
+Works without a running Qt event loop, so launchers and command-line tools
+can talk to the sidebar without creating a QApplication.
+"""
+
+from typing import Any, Dict, Optional
+from PySide6.QtNetwork import QLocalSocket
+
+from . import protocol
+
+
+class IpcError(Exception):
+    """Raised when the sidebar cannot be reached or rejects a request."""
+
+
+class IpcClient:
+    """Connection to a running sidebar instance."""
+    
+    def __init__(self) -> None:
+        """Initialize the client (call connect() before sending)."""
+        self._socket = QLocalSocket()
+        self._buffer = b""
+        self._next_id = 0
+    
+    def connect(self, timeout_ms: int) -> bool:
+        """Connect to the sidebar for this profile.
+        
+        Args:
+            timeout_ms: Connection timeout in milliseconds
+            
+        Returns:
+            bool: True if connected
+        """
+        self._socket.connectToServer(protocol.server_name())
+        return self._socket.waitForConnected(timeout_ms)
+    
+    def close(self) -> None:
+        """Disconnect from the sidebar."""
+        self._socket.disconnectFromServer()
+    
+    def send(self, message: Dict[str, Any]) -> int:
+        """Send a request without waiting for its reply.
+        
+        Args:
+            message: Request (an ``id`` is assigned if missing)
+            
+        Returns:
+            int: Request id
+        """
+        if "id" not in message:
+            self._next_id += 1
+            message = {**message, "id": self._next_id}
+        self._socket.write(protocol.encode(message))
+        return message["id"]
+    
+    def flush(self, timeout_ms: int) -> None:
+        """Wait until buffered requests have been written.
+        
+        Args:
+            timeout_ms: Write timeout in milliseconds
+        """
+        while self._socket.bytesToWrite() > 0:
+            if not self._socket.waitForBytesWritten(timeout_ms):
+                raise IpcError(f"write failed: {self._socket.errorString()}")
+    
+    def receive(self, timeout_ms: int) -> Optional[Dict[str, Any]]:
+        """Wait for the next message from the sidebar.
+        
+        Args:
+            timeout_ms: Read timeout in milliseconds
+            
+        Returns:
+            Optional[Dict[str, Any]]: Next message, or None on timeout
+            
+        Raises:
+            IpcError: If the connection was closed
+        """
+        while b"\n" not in self._buffer:
+            if not self._socket.waitForReadyRead(timeout_ms):
+                if self._socket.state() != QLocalSocket.ConnectedState:
+                    raise IpcError("connection closed by the sidebar")
+                return None
+            self._buffer += bytes(self._socket.readAll())
+        
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        if not line.strip():
+            return self.receive(timeout_ms)
+        return protocol.decode(line)
+    
+    def request(self, message: Dict[str, Any], timeout_ms: int) -> Dict[str, Any]:
+        """Send a request and wait for its reply.
+        
+        Args:
+            message: Request
+            timeout_ms: Time to wait for the reply
+            
+        Returns:
+            Dict[str, Any]: Successful reply
+            
+        Raises:
+            IpcError: On timeout, disconnect or a failed reply
+        """
+        request_id = self.send(message)
+        self.flush(timeout_ms)
+        while True:
+            reply = self.receive(timeout_ms)
+            if reply is None:
+                raise IpcError(f"no reply to {message.get('cmd')} within {timeout_ms} ms")
+            if reply.get("id") != request_id:
+                continue  # Event or reply to an earlier request
+            if not reply.get("ok"):
+                raise IpcError(reply.get("error", "request failed"))
+            return reply
@@ -0,0 +1,186 @@
+"""IPC command handlers that push text and files into the chat.
+
+Payloads arrive as a transfer: ``transfer_begin``, any number of
+``transfer_chunk`` messages and ``transfer_end``. Every chunk is forwarded
+to the page through the engine's JS queue as its own small script and
+acknowledged once the page has stored it, so clients can keep a bounded
+number of chunks in flight. ``transfer_end`` inserts the assembled payload
+into the composer and replies with size, throughput and chunk latency.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+from PySide6.QtCore import QObject
+
+from . import protocol
+from .server import IpcConnection, IpcServer
+from ..features.transfer import next_transfer_id, run_transfer_call
+from ..utils.logging import get_logger
+from ..utils.stats import summarize_latencies
+
+
+logger = get_logger(__name__)
+
+
+class _Transfer:
+    """Progress of one transfer."""
+    
+    def __init__(self, transfer_id: int, kind: str, conn: IpcConnection) -> None:
+        self.id = transfer_id
+        self.kind = kind
+        self.conn = conn
+        self.bytes = 0
+        self.chunks = 0
+        self.started = time.perf_counter()
+        self.chunk_latencies_ms: List[float] = []
+
+
+class CommandApi(QObject):
+    """Handles transfer commands for the main window's engine."""
+    
+    def __init__(self, server: IpcServer, window) -> None:
+        """Register the transfer commands.
+        
+        Args:
+            server: IPC server to register with
+            window: MainWindow whose engine receives the payloads
+        """
+        super().__init__(server)
+        self._window = window
+        self._transfers: Dict[int, _Transfer] = {}
+        
+        server.register(protocol.CMD_TRANSFER_BEGIN, self._on_begin)
+        server.register(protocol.CMD_TRANSFER_CHUNK, self._on_chunk)
+        server.register(protocol.CMD_TRANSFER_END, self._on_end)
+        server.register(protocol.CMD_TRANSFER_ABORT, self._on_abort)
+    
+    def _run(self, call: str, *args, callback=None) -> None:
+        """Call a ``window.__sidebar.transfers`` function in the page.
+        
+        Args:
+            call: Function name
+            *args: JSON-serializable arguments
+            callback: Receives the function's result (None on timeout)
+        """
+        run_transfer_call(self._window.engine, call, *args, callback=callback)
+    
+    def _get_transfer(self, conn: IpcConnection, message: Dict[str, Any]) -> Optional[_Transfer]:
+        """Look up the transfer a message refers to.
+        
+        Args:
+            conn: Connection the message came from
+            message: Request naming a transfer
+            
+        Returns:
+            Optional[_Transfer]: The transfer, or None after failing the request
+        """
+        transfer = self._transfers.get(message.get("transfer"))
+        if transfer is None or transfer.conn is not conn:
+            conn.fail(message, f"unknown transfer: {message.get('transfer')}")
+            return None
+        return transfer
+    
+    def _on_begin(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Start a transfer.
+        
+        Args:
+            conn: Client connection
+            message: Begin request
+        """
+        kind = message.get("kind")
+        if kind not in (protocol.KIND_TEXT, protocol.KIND_FILE):
+            conn.fail(message, f"unknown transfer kind: {kind}")
+            return
+        if self._window.engine is None:
+            conn.fail(message, "sidebar is still starting")
+            return
+        
+        transfer = _Transfer(next_transfer_id(), kind, conn)
+        self._transfers[transfer.id] = transfer
+        conn.closed.connect(lambda: self._drop(transfer, abort=True))
+        
+        name = message.get("name") or ("message.txt" if kind == protocol.KIND_TEXT else "file")
+        mime = message.get("mime") or "application/octet-stream"
+        logger.info(f"Transfer {transfer.id} started ({kind}, {name})")
+        self._run("begin", transfer.id, kind, name, mime)
+        conn.reply(message, transfer=transfer.id)
+    
+    def _on_chunk(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Forward a chunk to the page and acknowledge it once stored.
+        
+        Args:
+            conn: Client connection
+            message: Chunk request
+        """
+        transfer = self._get_transfer(conn, message)
+        if transfer is None:
+            return
+        
+        data = message.get("data") or ""
+        size = len(data) * 3 // 4 if transfer.kind == protocol.KIND_FILE else len(data.encode("utf-8"))
+        submitted = time.perf_counter()
+        
+        def on_stored(ok) -> None:
+            if not ok:
+                conn.fail(message, "page rejected the chunk (reloaded or out of order)")
+                self._drop(transfer, abort=True)
+                return
+            latency_ms = (time.perf_counter() - submitted) * 1000
+            transfer.chunk_latencies_ms.append(latency_ms)
+            transfer.bytes += size
+            transfer.chunks += 1
+            conn.reply(message, seq=message.get("seq"), latency_ms=round(latency_ms, 2))
+        
+        self._run("append", transfer.id, message.get("seq"), data, callback=on_stored)
+    
+    def _on_end(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Insert the assembled payload and report transfer stats.
+        
+        Args:
+            conn: Client connection
+            message: End request
+        """
+        transfer = self._get_transfer(conn, message)
+        if transfer is None:
+            return
+        
+        def on_inserted(ok) -> None:
+            self._drop(transfer)
+            if not ok:
+                conn.fail(message, "couldn't insert into the chat (composer not found)")
+                return
+            elapsed_s = time.perf_counter() - transfer.started
+            stats = {
+                "bytes": transfer.bytes,
+                "chunks": transfer.chunks,
+                "elapsed_ms": round(elapsed_s * 1000, 1),
+                "throughput_kib_s": round(transfer.bytes / 1024 / elapsed_s, 1) if elapsed_s else None,
+                "chunk_latency_ms": summarize_latencies(transfer.chunk_latencies_ms),
+            }
+            logger.info(f"Transfer {transfer.id} finished: {stats}")
+            conn.reply(message, **stats)
+        
+        self._run("end", transfer.id, callback=on_inserted)
+    
+    def _on_abort(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Discard a transfer.
+        
+        Args:
+            conn: Client connection
+            message: Abort request
+        """
+        transfer = self._get_transfer(conn, message)
+        if transfer is not None:
+            self._drop(transfer, abort=True)
+            conn.reply(message)
+    
+    def _drop(self, transfer: _Transfer, abort: bool = False) -> None:
+        """Forget a transfer, optionally discarding its chunks in the page.
+        
+        Args:
+            transfer: Transfer to forget
+            abort: Whether to free the page-side buffer as well
+        """
+        if self._transfers.pop(transfer.id, None) is not None and abort:
+            logger.info(f"Transfer {transfer.id} aborted")
+            self._run("abort", transfer.id)
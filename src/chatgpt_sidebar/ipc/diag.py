@@ -0,0 +1,50 @@
+"""Command-line client that prints the sidebar's diagnostics as JSON.
+
+Usage:
+    python -m chatgpt_sidebar.ipc.diag
+    python -m chatgpt_sidebar.ipc.diag --section tabs
+"""
+
+import argparse
+import json
+import sys
+
+from . import protocol
+from .client import IpcClient, IpcError
+from ..constants import IPC_CONNECT_TIMEOUT_MS
+
+
+REPLY_TIMEOUT_MS = 10000
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Print diagnostics of a running ChatGPT Sidebar")
+    parser.add_argument("--section", help="Only print this section (e.g. tabs, js_queue)")
+    args = parser.parse_args()
+    
+    client = IpcClient()
+    if not client.connect(IPC_CONNECT_TIMEOUT_MS * 5):
+        print("ChatGPT Sidebar is not running.", file=sys.stderr)
+        sys.exit(2)
+    
+    try:
+        reply = client.request({"cmd": protocol.CMD_DIAGNOSTICS}, REPLY_TIMEOUT_MS)
+    except IpcError as e:
+        print(f"Failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        client.close()
+    
+    reply.pop("id", None)
+    reply.pop("ok", None)
+    if args.section:
+        if args.section not in reply:
+            print(f"Unknown section: {args.section} (available: {', '.join(sorted(reply))})", file=sys.stderr)
+            sys.exit(1)
+        reply = reply[args.section]
+    print(json.dumps(reply, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Single-instance enforcement.
+
+The first instance for a profile holds a lock file in the app data
+directory and runs the IPC server. Later launches fail to take the lock,
+forward their arguments to the running instance over IPC and exit without
+starting Qt widgets or QtWebEngine.
+"""
+
+import sys
+import time
+from typing import Any, Dict
+from PySide6.QtCore import QLockFile
+
+from .client import IpcClient, IpcError
+from ..constants import IPC_CONNECT_TIMEOUT_MS, IPC_FORWARD_TIMEOUT_MS
+from ..utils.logging import get_logger
+from ..utils.paths import get_app_data_path
+
+
+logger = get_logger(__name__)
+
+
+class SingleInstance:
+    """Lock held by the primary instance for as long as it runs."""
+    
+    def __init__(self) -> None:
+        """Initialize the instance lock (call acquire() to take it)."""
+        self._lock = QLockFile(str(get_app_data_path() / "instance.lock"))
+        
+        # Never treat a running owner's lock as stale because of its age; a
+        # crashed owner is still detected (its PID is no longer running)
+        self._lock.setStaleLockTime(0)
+    
+    def acquire(self) -> bool:
+        """Try to become the primary instance.
+        
+        Returns:
+            bool: True if this process is the primary instance
+        """
+        return self._lock.tryLock(0)
+    
+    def release(self) -> None:
+        """Give up the primary role."""
+        self._lock.unlock()
+    
+    def forward(self, message: Dict[str, Any]) -> bool:
+        """Send a command to the primary instance.
+        
+        The primary may still be starting, so connection attempts are retried
+        until IPC_FORWARD_TIMEOUT_MS has passed.
+        
+        Args:
+            message: Request to forward
+            
+        Returns:
+            bool: True if the primary acknowledged the request
+        """
+        _allow_foreground()
+        
+        deadline = time.monotonic() + IPC_FORWARD_TIMEOUT_MS / 1000
+        while True:
+            client = IpcClient()
+            if client.connect(IPC_CONNECT_TIMEOUT_MS):
+                try:
+                    client.request(message, IPC_FORWARD_TIMEOUT_MS)
+                    return True
+                except IpcError as e:
+                    logger.error(f"Running instance rejected {message.get('cmd')}: {e}")
+                    return False
+                finally:
+                    client.close()
+            if time.monotonic() >= deadline:
+                logger.error("Running instance did not accept the connection")
+                return False
+            time.sleep(IPC_CONNECT_TIMEOUT_MS / 1000)
+
+
+def _allow_foreground() -> None:
+    """Let the running instance take the foreground for this launch.
+    
+    Windows only lets the process the user just started steal focus, so the
+    launcher passes that right on before forwarding.
+    """
+    if sys.platform == "win32":
+        import ctypes
+        ASFW_ANY = -1
+        ctypes.windll.user32.AllowSetForegroundWindow(ASFW_ANY)
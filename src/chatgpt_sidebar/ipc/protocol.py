@@ -0,0 +1,92 @@
+"""Wire format and naming for the sidebar's local IPC endpoint.
+
+Messages are JSON objects, one per line (UTF-8). Requests carry a ``cmd``
+and an optional ``id``; the server answers each request with a reply that
+echoes the ``id`` and has ``ok`` set to true, or false with an ``error``.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Tuple
+
+from ..utils.paths import get_app_data_path
+
+
+# Commands
+CMD_ACTIVATE = "activate"  # Bring the window to front; optional "url" and "attach" (list of paths)
+CMD_TRANSFER_BEGIN = "transfer_begin"  # Start a transfer: "kind" ("text" or "file"), "name", "mime"
+CMD_TRANSFER_CHUNK = "transfer_chunk"  # "transfer", "seq" and "data" (text, or base64 for files)
+CMD_TRANSFER_END = "transfer_end"  # Insert the assembled payload; reply carries transfer stats
+CMD_TRANSFER_ABORT = "transfer_abort"  # Discard a transfer
+CMD_SUBSCRIBE = "subscribe"  # Receive events for a "topic" on this connection
+CMD_UNSUBSCRIBE = "unsubscribe"  # Stop receiving events for a "topic"
+CMD_RESPONSE_STATS = "response_stats"  # Observer cost in the page and forwarding counters
+CMD_BATCH_RUN = "batch_run"  # Run "prompts" on hidden pages; sends batch_result and batch_done events
+CMD_BATCH_CANCEL = "batch_cancel"  # Stop this connection's batch
+CMD_DIAGNOSTICS = "diagnostics"  # Snapshot of every registered diagnostics provider (tabs, JS queue, ...)
+
+# Subscription topics
+TOPIC_RESPONSES = "responses"  # Assistant output: response_delta/_reset/_done/_resync events
+
+# Transfer kinds
+KIND_TEXT = "text"
+KIND_FILE = "file"
+
+
+def server_name() -> str:
+    """Get the local server name for the current user's data directory.
+    
+    The name is derived from the data directory, so instances that share a
+    profile (and only those) find each other.
+    
+    Returns:
+        str: QLocalServer name (a named pipe on Windows)
+    """
+    key = str(get_app_data_path()).lower().encode("utf-8")
+    return f"chatgpt-sidebar-{hashlib.sha1(key).hexdigest()[:12]}"
+
+
+def encode(message: Dict[str, Any]) -> bytes:
+    """Encode a message as one line.
+    
+    Args:
+        message: JSON-serializable message
+        
+    Returns:
+        bytes: Encoded line including the trailing newline
+    """
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode(line: bytes) -> Dict[str, Any]:
+    """Decode one line.
+    
+    Args:
+        line: Encoded message without the trailing newline
+        
+    Returns:
+        Dict[str, Any]: Decoded message
+        
+    Raises:
+        ValueError: If the line is not a JSON object
+    """
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("IPC message must be a JSON object")
+    return message
+
+
+def decode_lines(buffer: bytes) -> Tuple[List[Dict[str, Any]], bytes]:
+    """Decode all complete lines in a buffer.
+    
+    Args:
+        buffer: Received bytes
+        
+    Returns:
+        Tuple[List[Dict[str, Any]], bytes]: Decoded messages and the unconsumed remainder
+        
+    Raises:
+        ValueError: If a complete line is not a JSON object
+    """
+    *lines, rest = buffer.split(b"\n")
+    return [decode(line) for line in lines if line.strip()], rest
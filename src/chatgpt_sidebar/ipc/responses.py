@@ -0,0 +1,206 @@
+"""Forwards streamed assistant output to IPC subscribers.
+
+The page's response observer (see web/page_scripts.py) only runs while at
+least one client is subscribed to the ``responses`` topic. Its events are
+re-sent to every subscriber as ``response_delta``, ``response_reset`` and
+``response_done`` events.
+
+Slow subscribers don't make the sidebar buffer without bound: once a
+client has more than RESPONSE_SUBSCRIBER_MAX_PENDING bytes unsent, it stops
+receiving deltas. When its queue drains it gets one ``response_resync``
+event with the full current text of the message instead. Python keeps the
+text of the last RESPONSE_HISTORY messages for that purpose.
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Set
+from PySide6.QtCore import QObject
+
+from . import protocol
+from .server import IpcConnection, IpcServer
+from ..constants import RESPONSE_HISTORY, RESPONSE_SUBSCRIBER_MAX_PENDING
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class ResponseStream(QObject):
+    """Bridges page response events to subscribed IPC clients."""
+    
+    def __init__(self, server: IpcServer, window) -> None:
+        """Register the subscription commands.
+        
+        Args:
+            server: IPC server to register with
+            window: MainWindow whose engine produces the events
+        """
+        super().__init__(server)
+        self._window = window
+        self._subscribers: List[IpcConnection] = []
+        self._lagging: Set[IpcConnection] = set()
+        self._messages: "OrderedDict[str, str]" = OrderedDict()
+        self._last_message = None
+        self._events = 0
+        self._dropped = 0
+        self._resyncs = 0
+        
+        server.register(protocol.CMD_SUBSCRIBE, self._on_subscribe)
+        server.register(protocol.CMD_UNSUBSCRIBE, self._on_unsubscribe)
+        server.register(protocol.CMD_RESPONSE_STATS, self._on_stats)
+        
+        if window.engine is not None:
+            self._attach_engine()
+        else:
+            window.engine_ready.connect(self._attach_engine)
+    
+    def _attach_engine(self) -> None:
+        """Start receiving events from the engine."""
+        engine = self._window.engine
+        engine.response_event.connect(self._on_response_event)
+        
+        # Every new document starts with a dormant observer
+        engine.composer_ready.connect(self._sync_observer)
+        self._sync_observer()
+    
+    def _sync_observer(self) -> None:
+        """Enable the page observer if anyone is subscribed, disable it otherwise."""
+        engine = self._window.engine
+        if engine is None:
+            return
+        
+        # Lazy import WAIT_COMPOSER (keeps QtWebEngine out of the IPC import chain)
+        from ..web.js_queue import WAIT_COMPOSER
+        
+        enable = "true" if self._subscribers else "false"
+        engine.evaluate_js(f"window.__sidebar.responses.enable({enable})",
+                           wait_for=WAIT_COMPOSER, isolated=True)
+    
+    def _topic_check(self, conn: IpcConnection, message: Dict[str, Any]) -> bool:
+        """Reject requests for unknown topics.
+        
+        Args:
+            conn: Client connection
+            message: Subscribe/unsubscribe request
+            
+        Returns:
+            bool: True if the topic is supported
+        """
+        if message.get("topic") != protocol.TOPIC_RESPONSES:
+            conn.fail(message, f"unknown topic: {message.get('topic')}")
+            return False
+        return True
+    
+    def _on_subscribe(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Add a subscriber.
+        
+        Args:
+            conn: Client connection
+            message: Subscribe request
+        """
+        if not self._topic_check(conn, message):
+            return
+        if conn not in self._subscribers:
+            self._subscribers.append(conn)
+            conn.closed.connect(lambda: self._remove(conn))
+            conn.drained.connect(lambda: self._on_drained(conn))
+            logger.info(f"Response subscriber added ({len(self._subscribers)} total)")
+            if len(self._subscribers) == 1:
+                self._sync_observer()
+        conn.reply(message)
+    
+    def _on_unsubscribe(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Remove a subscriber.
+        
+        Args:
+            conn: Client connection
+            message: Unsubscribe request
+        """
+        if self._topic_check(conn, message):
+            self._remove(conn)
+            conn.reply(message)
+    
+    def _remove(self, conn: IpcConnection) -> None:
+        """Forget a subscriber and stop the observer when none are left.
+        
+        Args:
+            conn: Client connection
+        """
+        if conn in self._subscribers:
+            self._subscribers.remove(conn)
+            self._lagging.discard(conn)
+            logger.info(f"Response subscriber removed ({len(self._subscribers)} left)")
+            if not self._subscribers:
+                self._sync_observer()
+    
+    def _on_stats(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Report forwarding counters and the observer's cost in the page.
+        
+        Args:
+            conn: Client connection
+            message: Stats request
+        """
+        forwarding = {
+            "subscribers": len(self._subscribers),
+            "lagging": len(self._lagging),
+            "events": self._events,
+            "dropped": self._dropped,
+            "resyncs": self._resyncs,
+        }
+        engine = self._window.engine
+        if engine is None:
+            conn.reply(message, forwarding=forwarding, page=None)
+            return
+        engine.evaluate_js("window.__sidebar.responses.stats()",
+                           lambda page: conn.reply(message, forwarding=forwarding, page=page),
+                           isolated=True, coalesce=True)
+    
+    def _on_response_event(self, event: Dict[str, Any]) -> None:
+        """Update the message history and fan the event out.
+        
+        Args:
+            event: Event from the page observer
+        """
+        message_id = event.get("message")
+        kind = event.get("type")
+        if not message_id or kind not in ("delta", "reset", "done"):
+            return
+        self._events += 1
+        
+        text = self._messages.pop(message_id, "")
+        if kind == "delta":
+            text += event.get("delta", "")
+        elif kind == "reset":
+            text = event.get("text", "")
+        self._messages[message_id] = text
+        self._last_message = message_id
+        while len(self._messages) > RESPONSE_HISTORY:
+            self._messages.popitem(last=False)
+        
+        outgoing = {"event": f"response_{kind}", **{k: v for k, v in event.items() if k != "type"}}
+        for conn in self._subscribers:
+            if conn in self._lagging:
+                self._dropped += 1
+            elif conn.pending_bytes() > RESPONSE_SUBSCRIBER_MAX_PENDING:
+                logger.warning("Response subscriber is lagging; deltas paused until it catches up")
+                self._lagging.add(conn)
+                self._dropped += 1
+            else:
+                conn.send(outgoing)
+    
+    def _on_drained(self, conn: IpcConnection) -> None:
+        """Resync a lagging subscriber once its queue is empty.
+        
+        Args:
+            conn: Client connection
+        """
+        if conn not in self._lagging:
+            return
+        self._lagging.discard(conn)
+        self._resyncs += 1
+        if self._last_message is not None:
+            conn.send({
+                "event": "response_resync",
+                "message": self._last_message,
+                "text": self._messages.get(self._last_message, ""),
+            })
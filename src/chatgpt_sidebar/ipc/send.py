@@ -0,0 +1,184 @@
+"""Command-line client that pushes text and files into a running sidebar.
+
+Usage:
+    python -m chatgpt_sidebar.ipc.send --text "Explain this log" --file app.log
+    some_command | python -m chatgpt_sidebar.ipc.send --text -
+
+Each payload is sent as a chunked transfer with a bounded number of
+unacknowledged chunks in flight. Throughput and chunk acknowledgement
+latency are printed per payload (or written as JSON with --json).
+"""
+
+import argparse
+import base64
+import json
+import mimetypes
+import os
+import sys
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from . import protocol
+from .client import IpcClient, IpcError
+from ..constants import IPC_CONNECT_TIMEOUT_MS, TRANSFER_CHUNK_BYTES, TRANSFER_WINDOW
+from ..utils.stats import summarize_latencies
+
+
+REPLY_TIMEOUT_MS = 30000
+
+
+def _text_chunks(text: str, chunk_chars: int) -> Iterator[str]:
+    """Split text into chunks.
+    
+    Args:
+        text: Text to send
+        chunk_chars: Characters per chunk
+        
+    Yields:
+        str: Chunk
+    """
+    for i in range(0, len(text), chunk_chars):
+        yield text[i:i + chunk_chars]
+
+
+def _file_chunks(path: str, chunk_bytes: int) -> Iterator[str]:
+    """Read a file as base64 chunks.
+    
+    Args:
+        path: File to send
+        chunk_bytes: Raw bytes per chunk
+        
+    Yields:
+        str: Base64-encoded chunk
+    """
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_bytes)
+            if not chunk:
+                return
+            yield base64.b64encode(chunk).decode("ascii")
+
+
+def send_transfer(client: IpcClient, kind: str, name: str, mime: str,
+                  chunks: Iterator[str], window: int) -> Tuple[Dict, List[float]]:
+    """Send one payload as a chunked transfer.
+    
+    Args:
+        client: Connected client
+        kind: protocol.KIND_TEXT or protocol.KIND_FILE
+        name: Display name of the payload
+        mime: MIME type
+        chunks: Payload chunks
+        window: Maximum unacknowledged chunks in flight
+        
+    Returns:
+        Tuple[Dict, List[float]]: Final reply with the sidebar's stats, and
+            client-side round-trip times of each chunk in ms
+            
+    Raises:
+        IpcError: If the sidebar rejects or stops acknowledging the transfer
+    """
+    begin = {"cmd": protocol.CMD_TRANSFER_BEGIN, "kind": kind, "name": name, "mime": mime}
+    transfer_id = client.request(begin, REPLY_TIMEOUT_MS)["transfer"]
+    
+    in_flight: Dict[int, float] = {}
+    round_trips: List[float] = []
+    seq = 0
+    exhausted = False
+    try:
+        while not exhausted or in_flight:
+            while not exhausted and len(in_flight) < window:
+                data = next(chunks, None)
+                if data is None:
+                    exhausted = True
+                    break
+                chunk = {"cmd": protocol.CMD_TRANSFER_CHUNK, "transfer": transfer_id, "seq": seq, "data": data}
+                in_flight[client.send(chunk)] = time.perf_counter()
+                seq += 1
+            if not in_flight:
+                break
+            
+            client.flush(REPLY_TIMEOUT_MS)
+            reply = client.receive(REPLY_TIMEOUT_MS)
+            if reply is None:
+                raise IpcError("timed out waiting for a chunk acknowledgement")
+            sent = in_flight.pop(reply.get("id"), None)
+            if sent is None:
+                continue
+            if not reply.get("ok"):
+                raise IpcError(reply.get("error", "chunk rejected"))
+            round_trips.append((time.perf_counter() - sent) * 1000)
+    except IpcError:
+        client.send({"cmd": protocol.CMD_TRANSFER_ABORT, "transfer": transfer_id})
+        client.flush(REPLY_TIMEOUT_MS)
+        raise
+    
+    end = client.request({"cmd": protocol.CMD_TRANSFER_END, "transfer": transfer_id}, REPLY_TIMEOUT_MS)
+    return end, round_trips
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Send text and files to a running ChatGPT Sidebar")
+    parser.add_argument("--text", help="Text to insert into the composer ('-' reads stdin)")
+    parser.add_argument("--file", action="append", default=[], help="File to attach (can be repeated)")
+    parser.add_argument("--chunk-kib", type=int, default=TRANSFER_CHUNK_BYTES // 1024,
+                        help=f"Chunk size in KiB (default: {TRANSFER_CHUNK_BYTES // 1024})")
+    parser.add_argument("--window", type=int, default=TRANSFER_WINDOW,
+                        help=f"Unacknowledged chunks in flight (default: {TRANSFER_WINDOW})")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+    
+    if args.text is None and not args.file:
+        parser.error("nothing to send (use --text and/or --file)")
+    
+    # Whole multiples of 3 bytes keep every base64 chunk free of padding
+    chunk_bytes = max(3, args.chunk_kib * 1024 // 3 * 3)
+    
+    payloads = []
+    if args.text is not None:
+        text = sys.stdin.read() if args.text == "-" else args.text
+        payloads.append((protocol.KIND_TEXT, "text", "text/plain", _text_chunks(text, chunk_bytes)))
+    for path in args.file:
+        mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        payloads.append((protocol.KIND_FILE, os.path.basename(path), mime, _file_chunks(path, chunk_bytes)))
+    
+    client = IpcClient()
+    if not client.connect(IPC_CONNECT_TIMEOUT_MS * 5):
+        print("ChatGPT Sidebar is not running.", file=sys.stderr)
+        sys.exit(2)
+    
+    results = []
+    try:
+        for kind, name, mime, chunks in payloads:
+            stats, round_trips = send_transfer(client, kind, name, mime, chunks, args.window)
+            stats.pop("id", None)
+            stats.pop("ok", None)
+            results.append({"name": name, **stats, "round_trip_ms": summarize_latencies(round_trips)})
+            if not args.json:
+                _print_result(results[-1])
+    except (IpcError, OSError) as e:
+        print(f"Failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        client.close()
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+
+def _print_result(result: Dict) -> None:
+    """Print one transfer summary.
+    
+    Args:
+        result: Transfer result
+    """
+    latency = result.get("chunk_latency_ms") or {}
+    print(f"{result['name']}: {result['bytes'] / 1024:.1f} KiB in {result['chunks']} chunks, "
+          f"{result['elapsed_ms']:.0f} ms ({result.get('throughput_kib_s') or 0:.0f} KiB/s), "
+          f"page ack p50 {latency.get('p50', 0):.1f} ms / p95 {latency.get('p95', 0):.1f} ms, "
+          f"round trip p50 {(result['round_trip_ms'] or {}).get('p50', 0):.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
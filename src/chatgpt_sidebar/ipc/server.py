@@ -0,0 +1,187 @@
+"""Local socket server that receives commands from other processes."""
+
+from typing import Any, Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+
+from . import protocol
+from ..constants import IPC_MAX_MESSAGE_BYTES
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class IpcConnection(QObject):
+    """One connected client."""
+    
+    # Emitted when the client disconnects
+    closed = Signal()
+    
+    # Emitted when all queued outgoing data has been written
+    drained = Signal()
+    
+    def __init__(self, socket: QLocalSocket, server: "IpcServer") -> None:
+        """Initialize the connection.
+        
+        Args:
+            socket: Accepted socket
+            server: Server dispatching this connection's messages
+        """
+        super().__init__(server)
+        self._socket = socket
+        self._server = server
+        self._buffer = b""
+        socket.setParent(self)
+        socket.readyRead.connect(self._on_ready_read)
+        socket.disconnected.connect(self._on_disconnected)
+        socket.bytesWritten.connect(self._on_bytes_written)
+    
+    def send(self, message: Dict[str, Any]) -> None:
+        """Send a message to the client.
+        
+        Args:
+            message: JSON-serializable message
+        """
+        if self._socket.state() == QLocalSocket.ConnectedState:
+            self._socket.write(protocol.encode(message))
+    
+    def reply(self, request: Dict[str, Any], **fields) -> None:
+        """Acknowledge a request.
+        
+        Args:
+            request: Request being answered
+            **fields: Extra reply fields
+        """
+        self.send({"id": request.get("id"), "ok": True, **fields})
+    
+    def fail(self, request: Dict[str, Any], error: str) -> None:
+        """Reject a request.
+        
+        Args:
+            request: Request being answered
+            error: Human-readable reason
+        """
+        self.send({"id": request.get("id"), "ok": False, "error": error})
+    
+    def pending_bytes(self) -> int:
+        """Get the amount of data not yet written to the client.
+        
+        Returns:
+            int: Queued outgoing bytes
+        """
+        return self._socket.bytesToWrite()
+    
+    def close(self) -> None:
+        """Disconnect the client."""
+        self._socket.disconnectFromServer()
+    
+    def _on_ready_read(self) -> None:
+        """Decode and dispatch complete messages."""
+        self._buffer += bytes(self._socket.readAll())
+        try:
+            messages, self._buffer = protocol.decode_lines(self._buffer)
+        except ValueError as e:
+            logger.warning(f"Dropping IPC client after malformed message: {e}")
+            self.close()
+            return
+        
+        if len(self._buffer) > IPC_MAX_MESSAGE_BYTES:
+            logger.warning("Dropping IPC client after oversized message")
+            self.close()
+            return
+        
+        for message in messages:
+            self._server._dispatch(self, message)
+    
+    def _on_bytes_written(self, count: int) -> None:
+        """Report when the outgoing queue has been flushed.
+        
+        Args:
+            count: Bytes just written
+        """
+        if self._socket.bytesToWrite() == 0:
+            self.drained.emit()
+    
+    def _on_disconnected(self) -> None:
+        """Clean up after the client goes away."""
+        self.closed.emit()
+        self.deleteLater()
+
+
+class IpcServer(QObject):
+    """QLocalServer accepting JSON-line commands from the current user."""
+    
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize the server (call listen() to start accepting clients).
+        
+        Args:
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._server = QLocalServer(self)
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._handlers: Dict[str, Callable[[IpcConnection, Dict[str, Any]], None]] = {}
+        self._connections: List[IpcConnection] = []
+    
+    def register(self, cmd: str, handler: Callable[[IpcConnection, Dict[str, Any]], None]) -> None:
+        """Register the handler for a command.
+        
+        Handlers must answer through ``conn.reply()`` or ``conn.fail()``,
+        either immediately or later.
+        
+        Args:
+            cmd: Command name
+            handler: Callable receiving the connection and the request
+        """
+        self._handlers[cmd] = handler
+    
+    def listen(self) -> bool:
+        """Start listening on this profile's server name.
+        
+        Returns:
+            bool: True if the server is listening
+        """
+        name = protocol.server_name()
+        
+        # A crashed instance can leave a stale socket file behind (Unix only)
+        QLocalServer.removeServer(name)
+        
+        if not self._server.listen(name):
+            logger.error(f"IPC server failed to listen on {name}: {self._server.errorString()}")
+            return False
+        logger.info(f"IPC server listening on {self._server.fullServerName()}")
+        return True
+    
+    def connections(self) -> List[IpcConnection]:
+        """Get the currently connected clients.
+        
+        Returns:
+            List[IpcConnection]: Open connections
+        """
+        return list(self._connections)
+    
+    def _on_new_connection(self) -> None:
+        """Accept pending clients."""
+        while self._server.hasPendingConnections():
+            conn = IpcConnection(self._server.nextPendingConnection(), self)
+            conn.closed.connect(lambda conn=conn: self._connections.remove(conn))
+            self._connections.append(conn)
+    
+    def _dispatch(self, conn: IpcConnection, message: Dict[str, Any]) -> None:
+        """Route a message to its command handler.
+        
+        Args:
+            conn: Connection the message came from
+            message: Decoded request
+        """
+        handler = self._handlers.get(message.get("cmd"))
+        if handler is None:
+            conn.fail(message, f"unknown command: {message.get('cmd')}")
+            return
+        try:
+            handler(conn, message)
+        except Exception as e:
+            logger.error(f"IPC command {message.get('cmd')} failed: {e}")
+            conn.fail(message, str(e))
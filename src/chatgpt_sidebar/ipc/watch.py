@@ -0,0 +1,65 @@
+"""Command-line client that prints assistant output as it streams in.
+
+Usage:
+    python -m chatgpt_sidebar.ipc.watch            # Text to stdout
+    python -m chatgpt_sidebar.ipc.watch --events   # Raw events as JSON lines
+    python -m chatgpt_sidebar.ipc.watch --stats    # Observer cost and counters
+"""
+
+import argparse
+import json
+import sys
+
+from . import protocol
+from .client import IpcClient, IpcError
+from ..constants import IPC_CONNECT_TIMEOUT_MS
+
+
+REPLY_TIMEOUT_MS = 10000
+POLL_TIMEOUT_MS = 1000
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Stream ChatGPT Sidebar responses to stdout")
+    parser.add_argument("--events", action="store_true", help="Print raw events as JSON lines")
+    parser.add_argument("--stats", action="store_true", help="Print observer statistics and exit")
+    args = parser.parse_args()
+    
+    client = IpcClient()
+    if not client.connect(IPC_CONNECT_TIMEOUT_MS * 5):
+        print("ChatGPT Sidebar is not running.", file=sys.stderr)
+        sys.exit(2)
+    
+    try:
+        if args.stats:
+            reply = client.request({"cmd": protocol.CMD_RESPONSE_STATS}, REPLY_TIMEOUT_MS)
+            print(json.dumps({"forwarding": reply.get("forwarding"), "page": reply.get("page")}, indent=2))
+            return
+        
+        client.request({"cmd": protocol.CMD_SUBSCRIBE, "topic": protocol.TOPIC_RESPONSES}, REPLY_TIMEOUT_MS)
+        while True:
+            event = client.receive(POLL_TIMEOUT_MS)
+            if event is None or "event" not in event:
+                continue
+            if args.events:
+                print(json.dumps(event), flush=True)
+            elif event["event"] == "response_delta":
+                sys.stdout.write(event.get("delta", ""))
+                sys.stdout.flush()
+            elif event["event"] in ("response_reset", "response_resync"):
+                sys.stdout.write(f"\n[{event['event'][9:]}]\n{event.get('text', '')}")
+                sys.stdout.flush()
+            elif event["event"] == "response_done":
+                print("\n", flush=True)
+    except IpcError as e:
+        print(f"\nDisconnected: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,26 +2,45 @@
 
 import ctypes
 import sys
-from typing import Optional, Set, Tuple
+import time
+from collections import deque
+from typing import Callable, Deque, List, Optional, Set, Tuple
 from PySide6 import QtCore, QtGui
 from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QApplication
 from PySide6.QtGui import QGuiApplication
 
 from .constants import (
+    MAX_SAVED_TABS,
     DEFAULT_WIDTH,
     DEFAULT_URL,
     DEFAULT_TITLE,
     TOAST_DURATION_MS,
     SCREENSHOT_TOAST_DURATION_MS,
+    SPLASH_FADE_DELAY_MS,
     WEB_ENGINE_INIT_DELAY_MS,
+    MEMORY_WATCHDOG_IDLE_MS,
+    IDLE_PRIORITY_NORMAL,
+    IDLE_PRIORITY_LOW,
+    IDLE_WORK_DELAY_MS,
+    CLOSE_TRAY,
+    RESIDENT_SHOW_SAMPLES,
+    RESIDENT_MEMORY_DELAY_MS,
+    FRAME_BUDGET_MS,
+    PLACEMENT_HISTORY,
 )
 from .ui.topbar import TopBar
+from .ui.tabbar import ChatTabBar
 from .ui.sidebar import Sidebar
+from .ui.icon_cache import shared_icon_cache
+from .ui.stylesheet import apply_stylesheet
 from .ui.theme import ThemeManager
-from .platform.appbar_win import AppBarWin, AppBarEdge, AppBarNotification
+from .ui.splash import SnapshotSplash
+from .platform.appbar_win import AppBarWin, AppBarEdge, AppBarNotification, set_topmost
 from .settings.config import Config
 from .utils.logging import get_logger
+from .utils import diagnostics, milestones, tracing
+from .utils.idle_scheduler import IdleScheduler
 
 
 logger = get_logger(__name__)
@@ -30,6 +49,10 @@ logger = get_logger(__name__)
 class MainWindow(QWidget):
     """Main application window that composes all components."""
     
+    # Emitted once the web engine has been created (it is deferred after startup)
+    engine_ready = QtCore.Signal()
+    
+    @tracing.traced("MainWindow.__init__", "startup")
     def __init__(
         self,
         desired_width: int = DEFAULT_WIDTH,
@@ -51,22 +74,26 @@ class MainWindow(QWidget):
         self.setWindowTitle(title)
         
         # Initialize configuration
-        self.config = Config()
+        with tracing.span("Config"):
+            self.config = Config()
         
         # Calculate width from percentage
-        screen = QGuiApplication.primaryScreen().availableGeometry()
-        width_percent = self.config.get_width_percent()
-        self.desired_width = int(screen.width() * width_percent / 100)
-        
-        logger.info(f"Calculated desired width: {self.desired_width}px ({width_percent}% of {screen.width()}px screen)")
+        self.desired_width = self._get_desired_width()
         
         self.edge_str = "left" if self.config.get_edge() == AppBarEdge.LEFT else "right"
         self.is_docked = self.config.is_docked()
         
         # Theme and colors
         theme_preference = self.config.get_theme()
-        self.colors = ThemeManager.detect_theme_colors(theme_preference)
-        self.icons = ThemeManager.get_control_icons(self.colors)
+        with tracing.span("ThemeManager.detect_theme_colors"):
+            self.colors = ThemeManager.detect_theme_colors(theme_preference)
+        with tracing.span("ThemeManager.get_control_icons"):
+            self.icons = ThemeManager.get_control_icons(self.colors)
+        diagnostics.register("icons", shared_icon_cache().get_diagnostics)
+        with tracing.span("apply_stylesheet"):
+            apply_stylesheet(self.colors)
+        # Follow the system theme while the preference is "system"
+        QGuiApplication.styleHints().colorSchemeChanged.connect(self._on_color_scheme_changed)
         
         # Set up window flags for docked mode
         flags = self.windowFlags() | QtCore.Qt.FramelessWindowHint
@@ -89,27 +116,41 @@ class MainWindow(QWidget):
         self.topbar = TopBar(self.colors, self)
         self.main_layout.addWidget(self.topbar)
         
+        # Create chat tab strip (filled once the web engine exists)
+        self.tabbar = ChatTabBar(self.colors, self.icons, self)
+        self.tabbar.hide()
+        self.main_layout.addWidget(self.tabbar)
+        
         # Placeholder for web engine (initialized later)
         self.engine = None
+        self.perf_monitor = None
+        self.memory_sampler = None
+        self.memory_watchdog = None
         self._url = url
         
-        # Create sidebar with placeholder widget (web engine added later)
-        from PySide6.QtWidgets import QSizePolicy
-        self._sidebar_placeholder = QLabel("Loading...", self)
-        self._sidebar_placeholder.setAlignment(QtCore.Qt.AlignCenter)
-        self._sidebar_placeholder.setStyleSheet(f"QLabel {{ color: {self.colors['fg']}; background-color: {self.colors['bg']}; font-size: 14px; }}")
-        self._sidebar_placeholder.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        # Create sidebar with a splash of the last session (web engine added later)
+        self._splash: Optional[SnapshotSplash] = SnapshotSplash(self.colors, self)
         
-        self.sidebar = Sidebar(self._sidebar_placeholder, self.colors, self.icons, self.config, self)
+        with tracing.span("Sidebar"):
+            self.sidebar = Sidebar(self._splash, self.colors, self.icons, self.config, self)
         self.main_layout.addWidget(self.sidebar, 1)
         
         # Connect topbar signals
+        self.topbar.new_chat_clicked.connect(self.on_new_chat)
         self.topbar.screenshot_clicked.connect(self.on_screenshot_to_chat)
         self.topbar.settings_clicked.connect(self.on_show_settings)
         self.topbar.toggle_side_clicked.connect(self.on_toggle_side)
         self.topbar.toggle_dock_clicked.connect(self.on_toggle_dock)
         self.topbar.exit_clicked.connect(self.on_exit)
         
+        # Connect tab strip signals
+        self.tabbar.tab_selected.connect(self.on_tab_selected)
+        self.tabbar.tab_close_requested.connect(self.on_tab_close)
+        self.tabbar.new_tab_clicked.connect(self.on_new_tab)
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+T"), self, self.on_new_tab)
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+W"), self, self._close_active_tab)
+        QtGui.QShortcut(QtGui.QKeySequence("Ctrl+Shift+D"), self, self.sidebar.show_diagnostics)
+        
         # Connect sidebar signals
         self.sidebar.settings_changed.connect(self.on_settings_changed)
         
@@ -117,7 +158,8 @@ class MainWindow(QWidget):
         self._update_topbar_buttons()
         
         # Apply saved appearance settings
-        self._apply_initial_settings()
+        with tracing.span("apply_initial_settings"):
+            self._apply_initial_settings()
         
         # Initialize toast system
         self._toast_label: Optional[QLabel] = None
@@ -132,6 +174,32 @@ class MainWindow(QWidget):
         # Flag to enforce fixed width in docked mode
         self._enforce_fixed_width = False
         
+        # Startup milestone tracking (see utils/milestones.py)
+        self._first_paint_done = False
+        
+        # Files to attach once the web engine exists
+        self._pending_attachments: List[str] = []
+        
+        # Deferred work run in idle time (queued once startup is complete)
+        self.idle_scheduler = IdleScheduler(parent=self)
+        self._idle_work_queued = False
+        diagnostics.register("idle", self.idle_scheduler.get_diagnostics)
+        
+        # Tray resident mode (created by _apply_close_behavior when enabled)
+        self._tray = None
+        self._hotkey = None
+        self._quitting = False
+        self._in_tray = False
+        self._show_started: Optional[float] = None
+        self._show_latencies: Deque[float] = deque(maxlen=RESIDENT_SHOW_SAMPLES)
+        self._resident_memory: Optional[dict] = None
+        self._apply_close_behavior()
+        diagnostics.register("resident", self._get_resident_diagnostics)
+        
+        # Live edge, width, dock mode and always on top changes (timed)
+        self._placement_changes: Deque[dict] = deque(maxlen=PLACEMENT_HISTORY)
+        diagnostics.register("placement", self._get_placement_diagnostics)
+        
         # Register AppBar after window is shown
         if self.is_docked:
             QTimer.singleShot(0, self._register_appbar)
@@ -141,15 +209,59 @@ class MainWindow(QWidget):
         # Defer web engine initialization to speed up UI appearance
         QTimer.singleShot(WEB_ENGINE_INIT_DELAY_MS, self._init_web_engine)
     
+    @tracing.traced(cat="startup")
     def _init_web_engine(self) -> None:
         """Initialize web engine after UI is shown (deferred for fast startup)."""
-        from .web.engine_qtwebengine import QtWebEngine
+        with tracing.span("import engine_qtwebengine"):
+            from .web.engine_qtwebengine import QtWebEngine
         
         logger.info("Initializing web engine...")
         
         # Create web engine with theme colors to prevent white flash
-        self.engine = QtWebEngine(self, colors=self.colors)
-        self.engine.navigate(self._url)
+        with tracing.span("QtWebEngine"):
+            self.engine = QtWebEngine(self, colors=self.colors)
+        self.engine.composer_ready.connect(self._on_composer_ready)
+        self.engine.recovery_started.connect(self._on_renderer_recovery)
+        self.engine.set_recovery_policy(self.config.get_renderer_recovery(),
+                                        self.config.get_renderer_hang_timeout_ms())
+        self.engine.set_long_chat_mode(self.config.get_long_chat_mode())
+        milestones.mark("engine_created")
+        with tracing.span("navigate"):
+            self.engine.navigate(self._url)
+        with tracing.span("standby page"):
+            self.engine.set_standby_enabled(self.config.get_standby_page())
+        
+        # Restore the last session's tabs (pages are only created when a tab is opened)
+        self.engine.set_max_live_tabs(self.config.get_max_live_tabs())
+        if self.config.get_stay_signed_in():
+            with tracing.span("restore_tabs"):
+                self.engine.restore_tabs([tab for tab in self.config.get_open_tabs() if tab["url"] != self._url])
+        self.engine.tabs_changed.connect(self._update_tabbar)
+        self._update_tabbar()
+        self.tabbar.show()
+        
+        diagnostics.register("tabs", self.engine.get_tab_diagnostics)
+        diagnostics.register("js_queue", self.engine.get_js_metrics)
+        
+        # Lazy import monitors (created with the engine they watch)
+        from .utils.perf_monitor import PerfMonitor
+        from .utils.memory_sampler import MemorySampler
+        from .features.memory_watchdog import MemoryWatchdog
+        
+        # Page long tasks / JS heap / event-loop delay next to the Qt side's
+        self.perf_monitor = PerfMonitor(self.engine, self)
+        self.perf_monitor.set_interval(self.config.get_perf_monitor_ms())
+        diagnostics.register("performance", self.perf_monitor.get_diagnostics)
+        
+        # Process tree memory is sampled off the GUI thread; the watchdog reloads an oversized renderer
+        self.memory_sampler = MemorySampler(parent=self)
+        self.memory_watchdog = MemoryWatchdog(self.engine, self._is_user_active, self)
+        self.memory_watchdog.set_budget_mb(self.config.get_renderer_memory_budget_mb())
+        self.memory_watchdog.reloading.connect(self._on_memory_reload)
+        self.memory_watchdog.reloaded.connect(self._freeze_if_hidden)
+        self.memory_sampler.sampled.connect(self.memory_watchdog.on_sample)
+        if self.memory_sampler.start():
+            diagnostics.register("memory", self._get_memory_diagnostics)
         
         # Replace placeholder with actual web view
         web_widget = self.engine.get_widget()
@@ -161,14 +273,18 @@ class MainWindow(QWidget):
         # Prevent web widget from having a minimum size that could interfere
         web_widget.setMinimumSize(0, 0)
         
-        # Remove placeholder
-        old_widget = self.sidebar.widget(0)
-        self.sidebar.removeWidget(old_widget)
-        old_widget.deleteLater()
+        # Take the splash out of the stack and float it over the sidebar so the
+        # web view can paint underneath before the cross-fade
+        self.sidebar.removeWidget(self._splash)
         
         # Insert web widget at the same position
         self.sidebar.insertWidget(0, web_widget)
         self.sidebar.setCurrentIndex(0)
+        self._splash.overlay(self.sidebar)
+        
+        # Fade once the page is up, or immediately if the user navigates away
+        self.engine.load_finished.connect(self._on_first_load_finished)
+        self.sidebar.currentChanged.connect(self._dismiss_splash)
         
         # Force layout update
         self.main_layout.update()
@@ -181,24 +297,133 @@ class MainWindow(QWidget):
             logger.info("AppBar repositioned after web engine load")
         
         # Process events to ensure layout is complete
-        QApplication.processEvents()
+        with tracing.span("processEvents"):
+            QApplication.processEvents()
         
         # Apply zoom settings
         zoom = self.config.get_zoom()
         self.engine.set_zoom(zoom)
         
+        # Attach files requested before the engine existed
+        pending, self._pending_attachments = self._pending_attachments, []
+        for path in pending:
+            self.attach_file(path)
+        
+        self.engine_ready.emit()
+        
         # Monitor for size changes after page load and enforce correct size
+        # (the composer-ready handler covers late layout changes from the app)
         if self.is_docked and self.appbar:
-            # Connect to page load finished signal to enforce size
-            if self.engine.get_page():
-                self.engine.get_page().loadFinished.connect(self._on_page_load_finished)
-            
-            # Also use timers as backup (in case multiple loads happen)
-            QTimer.singleShot(500, self._enforce_appbar_size)
-            QTimer.singleShot(1500, self._enforce_appbar_size)
+            self.engine.load_finished.connect(self._on_page_load_finished)
         
         logger.info("Web engine initialized")
     
+    @tracing.traced()
+    def _on_first_load_finished(self, ok: bool) -> None:
+        """Schedule the splash cross-fade once the covered page has loaded.
+        
+        Args:
+            ok: Whether the page loaded successfully
+        """
+        self.engine.load_finished.disconnect(self._on_first_load_finished)
+        QTimer.singleShot(SPLASH_FADE_DELAY_MS, self._fade_splash)
+        
+        milestones.mark("load_finished")
+    
+    def _on_renderer_recovery(self, reason: str) -> None:
+        """Cover the web view with the session snapshot while the page is rebuilt.
+        
+        Args:
+            reason: "crashed" or "hung"
+        """
+        self._cover_with_splash()
+        self._show_toast("ChatGPT stopped responding. Reloading..." if reason == "hung"
+                         else "ChatGPT crashed. Reloading...")
+    
+    def _on_memory_reload(self, private_mb: int) -> None:
+        """Cover the web view while the watchdog moves the page to a fresh renderer.
+        
+        Args:
+            private_mb: Renderer private memory that triggered the reload
+        """
+        self._cover_with_splash()
+    
+    def _cover_with_splash(self) -> None:
+        """Show the session snapshot over the web view until the next page load."""
+        if self._splash is None and self.sidebar.currentIndex() == 0:
+            self._splash = SnapshotSplash(self.colors, self)
+            self._splash.overlay(self.sidebar)
+            self.engine.load_finished.connect(self._on_first_load_finished)
+            self.sidebar.currentChanged.connect(self._dismiss_splash)
+    
+    def _is_user_active(self) -> bool:
+        """Check whether the user may be looking at the page.
+        
+        Returns:
+            bool: False if the sidebar is hidden or there was no input for a while
+        """
+        if not self.isVisible() or self.isMinimized():
+            return False
+        
+        # Lazy import idle_win (Win32 only)
+        try:
+            from .platform.idle_win import get_idle_ms
+        except (ImportError, AttributeError, OSError):
+            return True
+        idle_ms = get_idle_ms()
+        return idle_ms is None or idle_ms < MEMORY_WATCHDOG_IDLE_MS
+    
+    def _get_memory_diagnostics(self) -> dict:
+        """Combine the memory sampler's series with renderer roles and watchdog state.
+        
+        Returns:
+            dict: Memory diagnostics section
+        """
+        renderers = self.engine.get_renderer_pids()
+        return {
+            **self.memory_sampler.get_diagnostics(),
+            "renderers": {str(pid): role for pid, role in renderers.items()},
+            "watchdog": self.memory_watchdog.get_diagnostics(),
+        }
+    
+    @tracing.traced()
+    def _on_composer_ready(self) -> None:
+        """Handle the chat page becoming usable."""
+        milestones.mark("composer_ready")
+        self._enforce_appbar_size()
+        
+        # Startup is complete; save the trace (again on exit, with later handlers)
+        path = tracing.write()
+        if path:
+            logger.info(f"Trace written to {path}")
+        
+        if not self._idle_work_queued:
+            self._idle_work_queued = True
+            QTimer.singleShot(IDLE_WORK_DELAY_MS, self._queue_idle_work)
+    
+    def _queue_idle_work(self) -> None:
+        """Queue work that doesn't need to happen during startup."""
+        # Lazy import cache pruner (only needed by the idle task)
+        from .utils.cache_pruner import prune_cache
+        from .utils.paths import get_app_cache_path
+        
+        self.idle_scheduler.schedule("settings_view", self.sidebar.prebuild_settings, IDLE_PRIORITY_NORMAL)
+        self.idle_scheduler.schedule("cache_prune", lambda: prune_cache(get_app_cache_path()), IDLE_PRIORITY_LOW)
+    
+    def _fade_splash(self) -> None:
+        """Cross-fade from the splash to the live web view."""
+        if self._splash:
+            self._splash.finished.connect(self._dismiss_splash)
+            self._splash.fade_out()
+    
+    def _dismiss_splash(self) -> None:
+        """Remove the splash overlay."""
+        if self._splash:
+            self.sidebar.currentChanged.disconnect(self._dismiss_splash)
+            self._splash.hide()
+            self._splash.deleteLater()
+            self._splash = None
+    
     def _on_page_load_finished(self, ok: bool) -> None:
         """Handle page load finished event.
         
@@ -236,6 +461,7 @@ class MainWindow(QWidget):
         
         logger.info(f"Applied initial settings: opacity={opacity}")
     
+    @tracing.traced(cat="startup")
     def _register_appbar(self) -> None:
         """Register the window as an AppBar."""
         # We need a valid hwnd to register AppBar, but we can get it without showing
@@ -256,9 +482,13 @@ class MainWindow(QWidget):
         # Now show the window at the correct position
         self.show()
     
+    @tracing.traced(cat="startup")
     def _start_undocked(self) -> None:
         """Start in undocked mode."""
-        self.setWindowFlags(QtCore.Qt.Window)
+        flags = QtCore.Qt.Window
+        if self.config.get_always_on_top():
+            flags |= QtCore.Qt.WindowStaysOnTopHint
+        self.setWindowFlags(flags)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground, False)
         
         # Restore geometry if available
@@ -284,6 +514,54 @@ class MainWindow(QWidget):
         self.topbar.update_dock_button(self.is_docked)
     
     # Event handlers
+    @tracing.traced()
+    def on_new_chat(self) -> None:
+        """Start a new chat (instantly when a standby page is preloaded)."""
+        if not self.engine:
+            return
+        self.sidebar.show_webview()
+        instant = self.engine.new_chat()
+        logger.info(f"New chat started ({'standby page' if instant else 'navigation'})")
+    
+    @tracing.traced()
+    def on_new_tab(self) -> None:
+        """Open a new chat in a new tab."""
+        if self.engine:
+            self.sidebar.show_webview()
+            self.engine.open_tab()
+    
+    @tracing.traced()
+    def on_tab_selected(self, tab_id: int) -> None:
+        """Switch to a tab picked in the tab strip.
+        
+        Args:
+            tab_id: Engine tab id
+        """
+        if self.engine:
+            self.sidebar.show_webview()
+            self.engine.activate_tab(tab_id)
+    
+    def on_tab_close(self, tab_id: int) -> None:
+        """Close a tab from the tab strip.
+        
+        Args:
+            tab_id: Engine tab id
+        """
+        if self.engine:
+            self.engine.close_tab(tab_id)
+    
+    def _close_active_tab(self) -> None:
+        """Close the active tab (Ctrl+W)."""
+        if self.engine:
+            active = next((tab for tab in self.engine.get_tabs() if tab["active"]), None)
+            if active:
+                self.engine.close_tab(active["id"])
+    
+    def _update_tabbar(self) -> None:
+        """Mirror the engine's tabs in the tab strip."""
+        self.tabbar.set_tabs(self.engine.get_tabs())
+    
+    @tracing.traced()
     def on_screenshot_to_chat(self) -> None:
         """Capture screenshot and paste into chat."""
         # Lazy import screenshot features (only loaded when used)
@@ -292,6 +570,7 @@ class MainWindow(QWidget):
             qimage_to_png_base64, hide_window, show_window
         )
         from .features.paste_js import build_paste_js
+        from .web.js_queue import WAIT_COMPOSER
         
         logger.info("Screenshot button clicked")
         try:
@@ -326,10 +605,11 @@ class MainWindow(QWidget):
             # Convert to base64
             b64 = qimage_to_png_base64(img)
             
-            # Paste via JavaScript
-            js = build_paste_js(b64)
-            self.engine.evaluate_js(js, self._after_paste_result)
-            
+            # Paste via JavaScript once the composer exists
+            if not self.engine.is_composer_ready():
+                self._show_toast("Waiting for ChatGPT to load...")
+            self.engine.evaluate_js(build_paste_js(b64), self._after_paste_result, wait_for=WAIT_COMPOSER)
+        
         except Exception as e:
             logger.error(f"Screenshot failed: {e}")
             self._show_toast("Screenshot failed. Please try again.")
@@ -341,10 +621,59 @@ class MainWindow(QWidget):
         else:
             self._show_toast("Screenshot attached.", duration_ms=SCREENSHOT_TOAST_DURATION_MS)
     
+    @tracing.traced()
+    def activate(self, url: Optional[str] = None) -> None:
+        """Bring the window to front, optionally opening a URL.
+        
+        Args:
+            url: URL to open (None keeps the current page)
+        """
+        if self._in_tray:
+            self._show_from_tray()
+        elif self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        
+        if url:
+            if self.engine:
+                self.engine.navigate(url)
+            else:
+                self._url = url
+    
+    @tracing.traced()
+    def attach_file(self, path: str) -> None:
+        """Attach a file to the chat composer.
+        
+        Args:
+            path: Absolute path of the file
+        """
+        if self.engine is None:
+            self._pending_attachments.append(path)
+            return
+        
+        # Lazy import attachment helpers (only needed when attaching files)
+        import mimetypes
+        import os
+        from .features.transfer import send_file
+        
+        name = os.path.basename(path)
+        mime_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        logger.info(f"Attaching {path} ({mime_type})")
+        try:
+            send_file(self.engine, path, mime_type,
+                      lambda ok: self._show_toast(f"Attached {name}." if ok else f"Couldn't attach {name}."))
+        except OSError as e:
+            logger.error(f"Failed to read attachment {path}: {e}")
+            self._show_toast(f"Couldn't read {name}")
+    
+    @tracing.traced()
     def on_show_settings(self) -> None:
         """Show settings view."""
         self.sidebar.show_settings()
     
+    @tracing.traced()
     def on_settings_changed(self, settings: dict) -> None:
         """Handle settings changes.
         
@@ -373,21 +702,16 @@ class MainWindow(QWidget):
                 self.engine.set_zoom(zoom)
             logger.info(f"Applied font size: {font_size} (zoom: {zoom})")
         
-        # Apply always on top changes
-        if 'always_on_top' in settings:
-            always_on_top = settings['always_on_top']
-            
-            # Only apply immediately in undocked mode
-            # In docked mode, it requires restart to avoid AppBar issues
-            if not self.is_docked:
-                if always_on_top:
-                    self.setWindowFlags(self.windowFlags() | QtCore.Qt.WindowStaysOnTopHint)
-                else:
-                    self.setWindowFlags(self.windowFlags() & ~QtCore.Qt.WindowStaysOnTopHint)
-                self.show()
-                logger.info(f"Applied always on top: {always_on_top}")
-            else:
-                logger.info(f"Always on top setting saved: {always_on_top} (will apply on restart)")
+        # Apply dock mode, edge, width and always on top (same window and web view)
+        self._apply_placement(settings)
+        
+        # Apply theme changes (stylesheet, icons and page background)
+        if 'theme' in settings:
+            self.apply_theme()
+        
+        # Apply close behavior (tray icon and hotkey)
+        if 'close_behavior' in settings:
+            self._apply_close_behavior()
         
         # Handle autostart (Windows registry)
         if 'autostart' in settings:
@@ -400,29 +724,175 @@ class MainWindow(QWidget):
             self._sign_out()
             return  # Don't show other messages
         
-        # Note: Theme, edge, width, docked state, and always on top (when docked)
-        # typically require an app restart to fully apply
-        requires_restart = []
-        if 'theme' in settings:
-            requires_restart.append('theme')
+        self._show_toast("Settings applied successfully")
+    
+    def _apply_placement(self, settings: dict) -> None:
+        """Apply dock mode, edge, width and always on top without restarting.
+        
+        The window keeps its web view and pages: a docked window is moved
+        through its AppBar and always on top is set on the native window,
+        so only a dock mode change recreates the native window.
+        
+        Args:
+            settings: Dictionary of changed settings
+        """
+        edge_str = self.edge_str
         if 'edge' in settings:
-            # Check if edge changed from current window state
-            current_edge = AppBarEdge.LEFT if self.edge_str == "left" else AppBarEdge.RIGHT
-            if settings['edge'] != current_edge:
-                requires_restart.append('position')
+            edge_str = "left" if settings['edge'] == AppBarEdge.LEFT else "right"
+        desired_width = self._get_desired_width() if 'width_percent' in settings else self.desired_width
+        
         if 'docked' in settings and settings['docked'] != self.is_docked:
-            requires_restart.append('dock mode')
-        if 'width_percent' in settings:
-            requires_restart.append('width')
-        if 'always_on_top' in settings and self.is_docked:
-            requires_restart.append('always on top')
-        
-        if requires_restart:
-            restart_msg = f"Some settings ({', '.join(requires_restart)}) will take effect after restarting the app"
-            self._show_toast(restart_msg, duration=5000)
-            logger.info(restart_msg)
+            # Dock at the new edge and width right away
+            self.edge_str = edge_str
+            self.desired_width = desired_width
+            start = time.perf_counter()
+            self.on_toggle_dock()
+            self._record_placement_change("dock" if self.is_docked else "undock", start)
+        elif edge_str != self.edge_str or desired_width != self.desired_width:
+            new_edge = edge_str != self.edge_str
+            self.edge_str = edge_str
+            self.desired_width = desired_width
+            self._update_topbar_buttons()
+            if self.is_docked and self.appbar:
+                self._move_appbar(new_edge)
+            # Undocked, the new edge and width are used by the next dock
+        
+        if 'always_on_top' in settings:
+            self._set_always_on_top(settings['always_on_top'])
+    
+    def _get_desired_width(self) -> int:
+        """Compute the docked width from the configured percentage of the screen.
+        
+        Returns:
+            int: Width in pixels
+        """
+        screen = QGuiApplication.primaryScreen().availableGeometry()
+        width_percent = self.config.get_width_percent()
+        desired_width = int(screen.width() * width_percent / 100)
+        logger.info(f"Calculated desired width: {desired_width}px ({width_percent}% of {screen.width()}px screen)")
+        return desired_width
+    
+    def _move_appbar(self, new_edge: bool) -> None:
+        """Move the docked window to the current edge and width.
+        
+        The AppBar renegotiates its position and the window is moved in
+        place; updates are held so the move paints once.
+        
+        Args:
+            new_edge: True if the edge changed (Windows needs the AppBar removed
+                and added again to change edges)
+        """
+        start = time.perf_counter()
+        self.setUpdatesEnabled(False)
+        try:
+            if new_edge:
+                self.appbar.undock()
+            self.appbar.dock(self.edge_str, self.desired_width)
+            x, y, w, h = self.appbar.get_last_rect()
+            self.setGeometry(x, y, w, h)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._record_placement_change("edge" if new_edge else "width", start)
+        logger.info(f"Docked to {self.edge_str} side at ({x}, {y}) {w}x{h}")
+    
+    def _set_always_on_top(self, always_on_top: bool) -> None:
+        """Keep the window above other windows, or stop doing so.
+        
+        Args:
+            always_on_top: Whether the window stays on top
+        """
+        flags = self.windowFlags()
+        if bool(flags & QtCore.Qt.WindowStaysOnTopHint) == always_on_top:
+            return
+        
+        start = time.perf_counter()
+        # setWindowFlags() would recreate the native window (losing the AppBar
+        # registration), so only Qt's record of the flag is updated and the
+        # z-order is changed on the existing window
+        if always_on_top:
+            self.overrideWindowFlags(flags | QtCore.Qt.WindowStaysOnTopHint)
         else:
-            self._show_toast("Settings applied successfully")
+            self.overrideWindowFlags(flags & ~QtCore.Qt.WindowStaysOnTopHint)
+        set_topmost(int(self.winId()), always_on_top)
+        self._record_placement_change("always_on_top", start)
+        logger.info(f"Applied always on top: {always_on_top}")
+    
+    def _record_placement_change(self, kind: str, start: float) -> None:
+        """Record how long a live placement change took.
+        
+        Args:
+            kind: Change ("dock", "undock", "edge", "width" or "always_on_top")
+            start: time.perf_counter() value when the change started
+        """
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._placement_changes.append({"kind": kind, "ms": round(elapsed_ms, 2)})
+        if elapsed_ms > FRAME_BUDGET_MS:
+            logger.info(f"Placement change ({kind}) took {elapsed_ms:.1f}ms, over the {FRAME_BUDGET_MS}ms frame budget")
+        else:
+            logger.debug(f"Placement change ({kind}) took {elapsed_ms:.1f}ms")
+    
+    def _get_placement_diagnostics(self) -> dict:
+        """Report the window placement and how long live changes took.
+        
+        Returns:
+            dict: Placement diagnostics section
+        """
+        from .utils.stats import summarize_latencies
+        return {
+            "edge": self.edge_str,
+            "docked": self.is_docked,
+            "width_px": self.desired_width,
+            "always_on_top": bool(self.windowFlags() & QtCore.Qt.WindowStaysOnTopHint),
+            "frame_budget_ms": FRAME_BUDGET_MS,
+            "change_ms": summarize_latencies(change["ms"] for change in self._placement_changes),
+            "over_budget": sum(1 for change in self._placement_changes if change["ms"] > FRAME_BUDGET_MS),
+            "recent": list(self._placement_changes)[-10:],
+        }
+    
+    @tracing.traced()
+    def apply_theme(self) -> None:
+        """Restyle the window for the configured theme without rebuilding it.
+        
+        The stylesheet and icons for a palette are compiled once and cached,
+        so a switch only swaps them in: widgets and pages stay as they are
+        and the web pages are not reloaded, just given the new background.
+        """
+        colors = ThemeManager.detect_theme_colors(self.config.get_theme())
+        if colors == self.colors:
+            return
+        
+        start = time.perf_counter()
+        self.colors = colors
+        self.icons = ThemeManager.get_control_icons(colors)
+        
+        # Repaint once after every widget has switched
+        self.setUpdatesEnabled(False)
+        try:
+            apply_stylesheet(colors)
+            self.topbar.set_theme(colors)
+            self._update_topbar_buttons()
+            self.tabbar.set_theme(colors, self.icons)
+            self.sidebar.set_theme(colors, self.icons)
+            if self._splash:
+                self._splash.set_theme(colors)
+            if self.engine:
+                self.engine.set_background_color(colors['bg'])
+                self._update_tabbar()
+        finally:
+            self.setUpdatesEnabled(True)
+        if self._tray is not None:
+            self._tray.set_theme(colors)
+        logger.info(f"Theme applied in {(time.perf_counter() - start) * 1000:.1f}ms")
+    
+    def _on_color_scheme_changed(self, scheme: QtCore.Qt.ColorScheme) -> None:
+        """Follow a system light/dark switch when the theme preference is "system".
+        
+        Args:
+            scheme: New system color scheme
+        """
+        if self.config.get_theme() == "system":
+            logger.info(f"System color scheme changed: {scheme.name}")
+            self.apply_theme()
     
     def _sign_out(self) -> None:
         """Sign out by clearing authentication cookies and reloading."""
@@ -436,18 +906,22 @@ class MainWindow(QWidget):
                     profile.cookieStore().deleteAllCookies()
                     logger.info("Cleared authentication cookies")
                 
+                # Drop the snapshot of the signed-in session
+                from .ui.splash import delete_snapshot
+                delete_snapshot()
+                
                 # Reload the page to show login screen
                 self.engine.navigate(DEFAULT_URL)
                 
-                self._show_toast("Signed out successfully", duration=2000)
+                self._show_toast("Signed out successfully", duration_ms=2000)
                 logger.info("User signed out")
             else:
-                self._show_toast("Failed to sign out", duration=3000)
+                self._show_toast("Failed to sign out", duration_ms=3000)
                 logger.error("Web engine or profile not available")
-                
+        
         except Exception as e:
             logger.error(f"Failed to sign out: {e}")
-            self._show_toast(f"Error signing out: {e}", duration=4000)
+            self._show_toast(f"Error signing out: {e}", duration_ms=4000)
     
     def _set_autostart(self, enable: bool) -> None:
         """Enable or disable autostart via Windows registry.
@@ -484,8 +958,9 @@ class MainWindow(QWidget):
             winreg.CloseKey(key)
         except Exception as e:
             logger.error(f"Failed to set autostart: {e}")
-            self._show_toast(f"Failed to set autostart: {e}", duration=4000)
+            self._show_toast(f"Failed to set autostart: {e}", duration_ms=4000)
     
+    @tracing.traced()
     def on_toggle_side(self) -> None:
         """Toggle between left and right edge."""
         if self.edge_str == "left":
@@ -499,34 +974,9 @@ class MainWindow(QWidget):
         self._update_topbar_buttons()
         
         if self.is_docked and self.appbar:
-            # When switching sides while docked, we need to undock and redock
-            # Windows AppBar requires REMOVE then NEW messages to change edges
-            
-            # Disable updates during transition to reduce flickering
-            self.setUpdatesEnabled(False)
-            
-            # Undock from current side
-            self.appbar.undock()
-            self.appbar = None
-            
-            # Process events to ensure undock completes
-            QApplication.processEvents()
-            
-            # Re-create and register AppBar with new edge
-            hwnd = int(self.winId())
-            self.appbar = AppBarWin(hwnd, self._callback_msg)
-            self.appbar.dock(self.edge_str, self.desired_width)
-            
-            # Apply the new geometry to Qt
-            x, y, w, h = self.appbar.get_last_rect()
-            self.setGeometry(x, y, w, h)
-            
-            # Re-enable updates and force repaint
-            self.setUpdatesEnabled(True)
-            self.update()
-            
-            logger.info(f"Switched to {self.edge_str} side at ({x}, {y}) {w}x{h}")
+            self._move_appbar(new_edge=True)
     
+    @tracing.traced()
     def on_toggle_dock(self) -> None:
         """Toggle between docked and undocked state."""
         if self.is_docked:
@@ -535,11 +985,157 @@ class MainWindow(QWidget):
             self._redock()
     
     def on_exit(self) -> None:
-        """Exit the application."""
+        """Exit the application (or hide to the tray in resident mode)."""
+        if self._tray is not None:
+            self._hide_to_tray()
+            return
         self._save_preferences()
         self.close()
         QApplication.quit()
     
+    def quit_app(self) -> None:
+        """Exit the application, also in resident mode."""
+        self._quitting = True
+        self._save_preferences()
+        self.close()
+        QApplication.quit()
+    
+    # Tray resident mode
+    def _apply_close_behavior(self) -> None:
+        """Create or remove the tray icon and global hotkey for the configured close behavior."""
+        resident = self.config.get_close_behavior() == CLOSE_TRAY
+        QApplication.instance().setQuitOnLastWindowClosed(not resident)
+        
+        if not resident:
+            if self._tray is not None:
+                self._tray.hide()
+                self._tray.deleteLater()
+                self._tray = None
+            if self._hotkey is not None:
+                self._hotkey.unregister()
+            return
+        
+        if self._tray is None:
+            # Lazy import tray (only needed in resident mode)
+            from .ui.tray import TrayIcon
+            self._tray = TrayIcon(self.colors, self.windowTitle(), self)
+            self._tray.toggle_requested.connect(self.toggle_resident)
+            self._tray.quit_requested.connect(self.quit_app)
+            self._tray.show()
+        
+        if self._hotkey is None:
+            # Lazy import hotkey_win (Win32 only)
+            try:
+                from .platform.hotkey_win import GlobalHotkey
+            except (ImportError, AttributeError, OSError):
+                logger.warning("Global hotkey unavailable on this platform")
+                return
+            self._hotkey = GlobalHotkey(self)
+            self._hotkey.activated.connect(self.toggle_resident)
+        
+        hotkey = self.config.get_hotkey()
+        registered = self._hotkey.register(hotkey)
+        self._tray.set_hotkey_hint(hotkey if registered else "")
+    
+    @tracing.traced()
+    def toggle_resident(self) -> None:
+        """Show the sidebar from the tray, or hide it there (tray icon and hotkey)."""
+        if self._in_tray:
+            self._show_from_tray()
+        else:
+            self._hide_to_tray()
+    
+    def _hide_to_tray(self) -> None:
+        """Hide the window but keep the page loaded (frozen) for an instant show."""
+        if self._in_tray:
+            return
+        self._save_session_snapshot()
+        if not self.is_docked:
+            self.config.set_undocked_geometry(self.saveGeometry())
+        
+        # Give the reserved screen space back while hidden (is_docked is kept)
+        if self.appbar:
+            self.appbar.undock()
+            self.appbar = None
+        
+        self._in_tray = True
+        self._show_started = None
+        self.hide()
+        
+        # Save tabs while the pages can still report their scroll, then stop page
+        # timers and rendering until shown again
+        self._save_open_tabs(done=self._freeze_if_hidden)
+        QTimer.singleShot(RESIDENT_MEMORY_DELAY_MS, self._measure_resident_memory)
+        logger.info("Hidden to tray")
+    
+    def _freeze_if_hidden(self) -> None:
+        """Freeze the pages once the window is hidden (after pending paints)."""
+        if self._in_tray and self.memory_watchdog:
+            # A frozen page can't answer, so a memory reload while hidden keeps this draft
+            self.memory_watchdog.remember_draft(self._freeze_pages)
+        else:
+            self._freeze_pages()
+    
+    def _freeze_pages(self) -> None:
+        """Freeze the pages if the window is still hidden."""
+        if self._in_tray and self.engine:
+            self.engine.set_frozen(True)
+    
+    def _show_from_tray(self) -> None:
+        """Show the window hidden by _hide_to_tray()."""
+        if not self._in_tray:
+            return
+        self._show_started = time.perf_counter()
+        self._in_tray = False
+        if self.engine:
+            self.engine.set_frozen(False)
+        
+        if self.is_docked:
+            # Reserve the screen edge again before showing (avoids a flash over other windows)
+            self._register_appbar()
+        else:
+            self.show()
+        self.raise_()
+        self.activateWindow()
+    
+    def _measure_resident_memory(self) -> None:
+        """Record the process tree's memory once the hidden page has settled."""
+        if not self._in_tray:
+            return
+        
+        # Lazy import memory_win (Win32 only)
+        try:
+            import os
+            from .platform.memory_win import get_process_memory, get_process_tree
+        except (ImportError, AttributeError, OSError):
+            return
+        pids = [os.getpid()] + [pid for pid, _, _ in get_process_tree(os.getpid())]
+        readings = [m for m in (get_process_memory(pid) for pid in pids) if m]
+        mb = 1024 * 1024
+        self._resident_memory = {
+            "processes": len(readings),
+            "private_mb": sum(m["private"] for m in readings) // mb,
+            "working_set_mb": sum(m["working_set"] for m in readings) // mb,
+        }
+        logger.info(f"Resident memory while hidden: {self._resident_memory['private_mb']} MB private "
+                    f"in {len(readings)} processes")
+    
+    def _get_resident_diagnostics(self) -> dict:
+        """Report the resident mode's state, show latency and hidden memory use.
+        
+        Returns:
+            dict: Resident diagnostics section
+        """
+        from .utils.stats import summarize_latencies
+        return {
+            "close_behavior": self.config.get_close_behavior(),
+            "hotkey": self._hotkey.sequence() if self._hotkey else None,
+            "hidden": self._in_tray,
+            "show_latency_ms": summarize_latencies(self._show_latencies),
+            "hidden_memory": self._resident_memory,
+        }
+    
+    @tracing.traced()
     def _undock(self) -> None:
         """Undock from AppBar to normal window."""
         if self.appbar:
@@ -548,7 +1144,10 @@ class MainWindow(QWidget):
         
         self.is_docked = False
         self._enforce_fixed_width = False
-        self.setWindowFlags(QtCore.Qt.Window)
+        flags = QtCore.Qt.Window
+        if self.config.get_always_on_top():
+            flags |= QtCore.Qt.WindowStaysOnTopHint
+        self.setWindowFlags(flags)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground, False)
         
         # Restore geometry
@@ -569,6 +1168,7 @@ class MainWindow(QWidget):
         self.config.set_undocked_geometry(self.saveGeometry())
         self.config.set_docked(False)
     
+    @tracing.traced()
     def _redock(self) -> None:
         """Redock to AppBar."""
         if self.isMaximized():
@@ -577,11 +1177,12 @@ class MainWindow(QWidget):
         
         self.config.set_undocked_geometry(self.saveGeometry())
         
-        self.setWindowFlags(
-            self.windowFlags()
-            | QtCore.Qt.FramelessWindowHint
-            | QtCore.Qt.WindowStaysOnTopHint
-        )
+        flags = self.windowFlags() | QtCore.Qt.FramelessWindowHint
+        if self.config.get_always_on_top():
+            flags |= QtCore.Qt.WindowStaysOnTopHint
+        else:
+            flags &= ~QtCore.Qt.WindowStaysOnTopHint
+        self.setWindowFlags(flags)
         self.setAttribute(QtCore.Qt.WA_TranslucentBackground, False)
         
         self.show()
@@ -616,6 +1217,68 @@ class MainWindow(QWidget):
         """
         pass
     
+    def _save_session_snapshot(self) -> None:
+        """Save a snapshot of the chat page for the next launch's splash."""
+        from .ui.splash import save_snapshot, delete_snapshot
+        
+        # Don't leave conversation content on disk for users who opted out of sessions
+        if not self.config.get_stay_signed_in():
+            delete_snapshot()
+            return
+        
+        # Only capture a fully painted page that is currently on screen
+        if self.engine and self._splash is None and self.sidebar.currentIndex() == 0:
+            save_snapshot(self.engine.get_widget())
+    
+    def _save_open_tabs(self, done: Optional[Callable[[], None]] = None, wait: bool = False) -> None:
+        """Remember open tabs for the next launch.
+        
+        Live pages are asked for their current scroll position first.
+        
+        Args:
+            done: Called once the tabs are saved
+            wait: Block until saved (on exit, when no later event loop turn comes)
+        """
+        def write() -> None:
+            tabs = [{"url": tab["url"], "title": tab["title"], "scroll_y": tab["scroll_y"]}
+                    for tab in self.engine.get_tabs()]
+            self.config.set_open_tabs(tabs[:MAX_SAVED_TABS])
+            if done:
+                done()
+        
+        if not self.engine:
+            if done:
+                done()
+            return
+        
+        # Conversation URLs are session data; don't keep them for users who opted out
+        if not self.config.get_stay_signed_in():
+            self.config.set_open_tabs([])
+            if done:
+                done()
+            return
+        
+        if not wait:
+            self.engine.capture_tab_scroll(write)
+            return
+        if self._in_tray:
+            # Frozen pages can't scroll (or answer); positions were read when hidden
+            write()
+            return
+        
+        # Bounded by TAB_SCROLL_CAPTURE_TIMEOUT_MS when a page doesn't answer
+        captured = []
+        loop = QtCore.QEventLoop()
+        
+        def on_captured() -> None:
+            captured.append(True)
+            loop.quit()
+        
+        self.engine.capture_tab_scroll(on_captured)
+        if not captured:
+            loop.exec()
+        write()
+    
     # Toast notifications
     def _show_toast(self, message: str, duration_ms: int = TOAST_DURATION_MS) -> None:
         """Show a toast message."""
@@ -623,16 +1286,7 @@ class MainWindow(QWidget):
             self._toast_label.deleteLater()
         
         self._toast_label = QLabel(message, self)
-        self._toast_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {self.colors['panel']};
-                color: {self.colors['fg']};
-                border: 1px solid {self.colors['border']};
-                border-radius: 4px;
-                padding: 8px 12px;
-                font-size: 12px;
-            }}
-        """)
+        self._toast_label.setObjectName("toast")
         self._toast_label.setAlignment(QtCore.Qt.AlignCenter)
         self._toast_label.adjustSize()
         
@@ -650,6 +1304,23 @@ class MainWindow(QWidget):
             self._toast_label.deleteLater()
             self._toast_label = None
     
+    def paintEvent(self, e: QtGui.QPaintEvent) -> None:
+        """Handle paint event.
+        
+        Args:
+            e: Paint event
+        """
+        super().paintEvent(e)
+        if not self._first_paint_done:
+            self._first_paint_done = True
+            milestones.mark("first_paint")
+        if self._show_started is not None:
+            # First paint after showing from the tray
+            latency_ms = (time.perf_counter() - self._show_started) * 1000
+            self._show_started = None
+            self._show_latencies.append(latency_ms)
+            logger.info(f"Shown from tray in {latency_ms:.1f} ms")
+    
     # Mouse event handlers for dragging (undocked mode)
     def mousePressEvent(self, e: QtGui.QMouseEvent) -> None:
         """Handle mouse press for dragging."""
@@ -710,7 +1381,17 @@ class MainWindow(QWidget):
         Args:
             e: Close event
         """
+        if self._tray is not None and not self._quitting:
+            e.ignore()
+            self._hide_to_tray()
+            return
+        
         self._save_preferences()
+        if not self._in_tray:  # Already saved when hidden (a frozen page doesn't paint)
+            self._save_session_snapshot()
+        self._save_open_tabs(wait=True)
+        if self.memory_sampler:
+            self.memory_sampler.stop()
         
         if self.appbar:
             self.appbar.undock()
@@ -29,6 +29,14 @@ class AppBarNotification:
     POSCHANGED = 0x00000001
 
 
+# SetWindowPos constants
+HWND_TOPMOST = -1
+HWND_NOTOPMOST = -2
+SWP_NOSIZE = 0x0001
+SWP_NOMOVE = 0x0002
+SWP_NOACTIVATE = 0x0010
+
+
 # AppBar edge constants
 class AppBarEdge:
     LEFT = 0
@@ -66,6 +74,27 @@ class MONITORINFO(ctypes.Structure):
     ]
 
 
+def set_topmost(hwnd: int, topmost: bool) -> bool:
+    """Put a window in or out of the topmost z-order band in place.
+    
+    Unlike changing Qt's WindowStaysOnTopHint, this keeps the native
+    window (and its AppBar registration).
+    
+    Args:
+        hwnd: Window handle
+        topmost: True to keep the window above non-topmost windows
+        
+    Returns:
+        bool: True if the z-order was changed
+    """
+    insert_after = HWND_TOPMOST if topmost else HWND_NOTOPMOST
+    ok = bool(user32.SetWindowPos(wintypes.HWND(hwnd), wintypes.HWND(insert_after), 0, 0, 0, 0,
+                                  SWP_NOMOVE | SWP_NOSIZE | SWP_NOACTIVATE))
+    if not ok:
+        logger.warning(f"SetWindowPos failed for topmost={topmost}")
+    return ok
+
+
 class AppBarWin:
     """Windows AppBar for docking a window to the edge of the screen."""
     
@@ -0,0 +1,150 @@
+"""Windows global hotkey via RegisterHotKey."""
+
+import ctypes
+from ctypes import wintypes
+from typing import Optional, Tuple
+from PySide6.QtCore import QAbstractNativeEventFilter, QCoreApplication, QObject, Qt, Signal
+from PySide6.QtGui import QKeySequence
+
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Win32 API DLL bindings
+user32 = ctypes.windll.user32
+
+WM_HOTKEY = 0x0312
+
+# RegisterHotKey modifiers
+MOD_ALT = 0x0001
+MOD_CONTROL = 0x0002
+MOD_SHIFT = 0x0004
+MOD_WIN = 0x0008
+MOD_NOREPEAT = 0x4000
+
+# Qt keys without an ASCII virtual-key code
+_VIRTUAL_KEYS = {
+    Qt.Key_Space: 0x20,
+    Qt.Key_PageUp: 0x21,
+    Qt.Key_PageDown: 0x22,
+    Qt.Key_End: 0x23,
+    Qt.Key_Home: 0x24,
+    Qt.Key_Left: 0x25,
+    Qt.Key_Up: 0x26,
+    Qt.Key_Right: 0x27,
+    Qt.Key_Down: 0x28,
+    Qt.Key_Insert: 0x2D,
+    Qt.Key_Delete: 0x2E,
+    Qt.Key_QuoteLeft: 0xC0,
+}
+
+
+def parse_hotkey(sequence: str) -> Optional[Tuple[int, int]]:
+    """Convert a key sequence such as "Ctrl+Alt+Space" to RegisterHotKey arguments.
+    
+    Args:
+        sequence: Portable key sequence text (one key with modifiers)
+        
+    Returns:
+        Optional[Tuple[int, int]]: (modifiers, virtual key), or None if it can't be registered
+    """
+    keys = QKeySequence(sequence)
+    if keys.count() != 1:
+        return None
+    combination = keys[0]
+    key = combination.key()
+    qt_modifiers = combination.keyboardModifiers()
+    
+    modifiers = MOD_NOREPEAT
+    if qt_modifiers & Qt.AltModifier:
+        modifiers |= MOD_ALT
+    if qt_modifiers & Qt.ControlModifier:
+        modifiers |= MOD_CONTROL
+    if qt_modifiers & Qt.ShiftModifier:
+        modifiers |= MOD_SHIFT
+    if qt_modifiers & Qt.MetaModifier:
+        modifiers |= MOD_WIN
+    
+    if Qt.Key_A <= key <= Qt.Key_Z or Qt.Key_0 <= key <= Qt.Key_9:
+        vk = int(key)  # Same as the ASCII code
+    elif Qt.Key_F1 <= key <= Qt.Key_F24:
+        vk = 0x70 + (key - Qt.Key_F1)
+    else:
+        vk = _VIRTUAL_KEYS.get(key)
+    if vk is None:
+        return None
+    return modifiers, vk
+
+
+class GlobalHotkey(QObject, QAbstractNativeEventFilter):
+    """System-wide hotkey delivered as a Qt signal.
+    
+    The hotkey is registered for the GUI thread rather than a window, so it
+    keeps working while the window is hidden or its native handle is
+    recreated (dock / undock).
+    """
+    
+    # Emitted when the hotkey is pressed
+    activated = Signal()
+    
+    _HOTKEY_ID = 1
+    
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize the hotkey (nothing is registered until register()).
+        
+        Args:
+            parent: Parent object
+        """
+        QObject.__init__(self, parent)
+        QAbstractNativeEventFilter.__init__(self)
+        self._sequence: Optional[str] = None
+        QCoreApplication.instance().installNativeEventFilter(self)
+    
+    def register(self, sequence: str) -> bool:
+        """Register (or replace) the hotkey.
+        
+        Args:
+            sequence: Key sequence text, e.g. "Ctrl+Alt+Space" (empty unregisters)
+            
+        Returns:
+            bool: False if the sequence is invalid or already taken by another application
+        """
+        self.unregister()
+        if not sequence:
+            return True
+        
+        parsed = parse_hotkey(sequence)
+        if parsed is None:
+            logger.warning(f"Unsupported hotkey: {sequence}")
+            return False
+        if not user32.RegisterHotKey(None, self._HOTKEY_ID, parsed[0], parsed[1]):
+            logger.warning(f"Hotkey {sequence} unavailable (error {ctypes.GetLastError()})")
+            return False
+        self._sequence = sequence
+        logger.info(f"Global hotkey registered: {sequence}")
+        return True
+    
+    def sequence(self) -> Optional[str]:
+        """Get the registered key sequence.
+        
+        Returns:
+            Optional[str]: Sequence text, or None if nothing is registered
+        """
+        return self._sequence
+    
+    def unregister(self) -> None:
+        """Release the hotkey."""
+        if self._sequence is not None:
+            user32.UnregisterHotKey(None, self._HOTKEY_ID)
+            self._sequence = None
+    
+    def nativeEventFilter(self, eventType, message) -> Tuple[bool, int]:
+        """Turn WM_HOTKEY thread messages into the activated signal."""
+        if eventType == b"windows_generic_MSG" and self._sequence is not None:
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_HOTKEY and msg.wParam == self._HOTKEY_ID:
+                self.activated.emit()
+                return True, 0
+        return False, 0
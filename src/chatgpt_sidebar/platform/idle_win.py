@@ -0,0 +1,57 @@
+"""Windows user idle time and pending input queries."""
+
+import ctypes
+from ctypes import wintypes
+from typing import Optional
+
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Win32 API DLL bindings
+user32 = ctypes.windll.user32
+kernel32 = ctypes.windll.kernel32
+
+
+class LASTINPUTINFO(ctypes.Structure):
+    _fields_ = [
+        ("cbSize", wintypes.UINT),
+        ("dwTime", wintypes.DWORD)
+    ]
+
+
+# GetQueueStatus flags
+QS_KEY = 0x0001
+QS_MOUSEMOVE = 0x0002
+QS_MOUSEBUTTON = 0x0004
+QS_PAINT = 0x0020
+QS_RAWINPUT = 0x0400
+QS_INPUT = QS_KEY | QS_MOUSEMOVE | QS_MOUSEBUTTON | QS_RAWINPUT
+
+
+def get_idle_ms() -> Optional[int]:
+    """Get the time since the user's last keyboard or mouse input (any application).
+    
+    Returns:
+        Optional[int]: Idle time in milliseconds, or None if the query failed
+    """
+    info = LASTINPUTINFO()
+    info.cbSize = ctypes.sizeof(LASTINPUTINFO)
+    if not user32.GetLastInputInfo(ctypes.byref(info)):
+        logger.warning(f"GetLastInputInfo failed (error {ctypes.GetLastError()})")
+        return None
+    # Both tick counts are 32-bit and wrap after 49.7 days
+    return (kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF
+
+
+def has_pending_input() -> bool:
+    """Check whether input or paint messages are waiting in the calling thread's queue.
+    
+    Returns:
+        bool: True if the GUI thread has keyboard, mouse or paint messages to process
+    """
+    # The high word holds the kinds of messages currently in the queue
+    status = user32.GetQueueStatus(QS_INPUT | QS_PAINT)
+    return bool((status >> 16) & (QS_INPUT | QS_PAINT))
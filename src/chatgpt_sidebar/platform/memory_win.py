@@ -0,0 +1,144 @@
+"""Windows memory and process queries used to size optional caches and watch renderers."""
+
+import ctypes
+from ctypes import wintypes
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Win32 API DLL bindings
+kernel32 = ctypes.windll.kernel32
+psapi = ctypes.windll.psapi
+
+# Process access rights
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+
+# Toolhelp snapshot flags
+TH32CS_SNAPPROCESS = 0x00000002
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+kernel32.CreateToolhelp32Snapshot.restype = wintypes.HANDLE
+kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+
+
+class MEMORYSTATUSEX(ctypes.Structure):
+    _fields_ = [
+        ("dwLength", wintypes.DWORD),
+        ("dwMemoryLoad", wintypes.DWORD),
+        ("ullTotalPhys", ctypes.c_ulonglong),
+        ("ullAvailPhys", ctypes.c_ulonglong),
+        ("ullTotalPageFile", ctypes.c_ulonglong),
+        ("ullAvailPageFile", ctypes.c_ulonglong),
+        ("ullTotalVirtual", ctypes.c_ulonglong),
+        ("ullAvailVirtual", ctypes.c_ulonglong),
+        ("ullAvailExtendedVirtual", ctypes.c_ulonglong)
+    ]
+
+
+class PROCESS_MEMORY_COUNTERS_EX(ctypes.Structure):
+    _fields_ = [
+        ("cb", wintypes.DWORD),
+        ("PageFaultCount", wintypes.DWORD),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+        ("PrivateUsage", ctypes.c_size_t)
+    ]
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wintypes.DWORD),
+        ("cntUsage", wintypes.DWORD),
+        ("th32ProcessID", wintypes.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wintypes.DWORD),
+        ("cntThreads", wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase", wintypes.LONG),
+        ("dwFlags", wintypes.DWORD),
+        ("szExeFile", wintypes.WCHAR * 260)
+    ]
+
+
+def get_physical_memory() -> Optional[Tuple[int, int]]:
+    """Get total and currently available physical memory.
+    
+    Returns:
+        Optional[Tuple[int, int]]: (total, available) in bytes, or None if the query failed
+    """
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    if not kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        logger.warning(f"GlobalMemoryStatusEx failed (error {ctypes.GetLastError()})")
+        return None
+    return status.ullTotalPhys, status.ullAvailPhys
+
+
+def get_process_memory(pid: int) -> Optional[Dict[str, int]]:
+    """Get the memory use of a process.
+    
+    Args:
+        pid: Process id
+        
+    Returns:
+        Optional[Dict[str, int]]: Working set and private bytes, or None if the process can't be queried
+    """
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        counters = PROCESS_MEMORY_COUNTERS_EX()
+        counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS_EX)
+        if not psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return None
+        return {"working_set": counters.WorkingSetSize, "private": counters.PrivateUsage}
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def get_process_tree(pid: int) -> List[Tuple[int, int, str]]:
+    """Get all descendants of a process (e.g. QtWebEngineProcess helpers).
+    
+    Args:
+        pid: Root process id
+        
+    Returns:
+        List[Tuple[int, int, str]]: (pid, parent pid, executable name) per descendant
+    """
+    snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if not snapshot or snapshot == INVALID_HANDLE_VALUE:
+        logger.warning(f"CreateToolhelp32Snapshot failed (error {ctypes.GetLastError()})")
+        return []
+    try:
+        entries = []
+        entry = PROCESSENTRY32W()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+        ok = kernel32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            entries.append((entry.th32ProcessID, entry.th32ParentProcessID, entry.szExeFile))
+            ok = kernel32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        kernel32.CloseHandle(snapshot)
+    
+    # Walk down from the root; pids can be reused, so only follow parents already in the tree
+    tree = []
+    parents = {pid}
+    found = True
+    while found:
+        found = False
+        for child_pid, parent_pid, name in entries:
+            if parent_pid in parents and child_pid not in parents:
+                parents.add(child_pid)
+                tree.append((child_pid, parent_pid, name))
+                found = True
+    return tree
@@ -1,9 +1,10 @@
 """Configuration management using QSettings."""
 
-from typing import Any, Optional
+import json
+from typing import Any, Dict, List, Optional
 from PySide6.QtCore import QSettings
 
-from ..constants import APP_ORGANIZATION, APP_NAME
+from ..constants import APP_ORGANIZATION, APP_NAME, CLOSE_EXIT, DEFAULT_HOTKEY
 
 
 class Config:
@@ -171,6 +172,44 @@ class Config:
         """
         self.set("always_on_top", always_on_top)
     
+    def get_close_behavior(self, default: str = CLOSE_EXIT) -> str:
+        """Get what closing the sidebar does.
+        
+        Args:
+            default: Default behavior
+            
+        Returns:
+            str: CLOSE_EXIT (quit) or CLOSE_TRAY (hide to the tray, keep the page warm)
+        """
+        return self.get("close_behavior", default, str)
+    
+    def set_close_behavior(self, behavior: str) -> None:
+        """Set what closing the sidebar does.
+        
+        Args:
+            behavior: CLOSE_EXIT or CLOSE_TRAY
+        """
+        self.set("close_behavior", behavior)
+    
+    def get_hotkey(self, default: str = DEFAULT_HOTKEY) -> str:
+        """Get the global show/hide hotkey used in tray mode.
+        
+        Args:
+            default: Default key sequence
+            
+        Returns:
+            str: Key sequence such as "Ctrl+Alt+Space" (empty = none)
+        """
+        return self.get("hotkey", default, str)
+    
+    def set_hotkey(self, sequence: str) -> None:
+        """Set the global show/hide hotkey used in tray mode.
+        
+        Args:
+            sequence: Key sequence (empty = none)
+        """
+        self.set("hotkey", sequence)
+    
     def get_undocked_geometry(self) -> Optional[bytes]:
         """Get the undocked window geometry.
         
@@ -270,4 +309,162 @@ class Config:
             stay_signed_in: Whether to stay signed in
         """
         self.set("stay_signed_in", stay_signed_in)
+    
+    # -------------------------------------------------------------------------
+    # Web engine settings
+    # -------------------------------------------------------------------------
+    
+    def get_renderer_recovery(self, default: str = "restore") -> str:
+        """Get the renderer crash/hang recovery mode.
+        
+        Args:
+            default: Default mode ("restore", "home", or "off")
+            
+        Returns:
+            str: Recovery mode
+        """
+        return self.get("renderer_recovery", default, str)
+    
+    def set_renderer_recovery(self, mode: str) -> None:
+        """Set the renderer crash/hang recovery mode.
+        
+        Args:
+            mode: "restore" (reopen the last URL), "home" (reopen the start URL) or "off"
+        """
+        self.set("renderer_recovery", mode)
+    
+    def get_renderer_hang_timeout_ms(self, default: int = 15000) -> int:
+        """Get the time after which an unresponsive renderer is recovered.
+        
+        Args:
+            default: Default timeout in milliseconds
+            
+        Returns:
+            int: Hang timeout in milliseconds
+        """
+        return self.get("renderer_hang_timeout_ms", default, int)
+    
+    def set_renderer_hang_timeout_ms(self, timeout_ms: int) -> None:
+        """Set the time after which an unresponsive renderer is recovered.
+        
+        Args:
+            timeout_ms: Hang timeout in milliseconds
+        """
+        self.set("renderer_hang_timeout_ms", timeout_ms)
+    
+    def get_standby_page(self, default: bool = True) -> bool:
+        """Get whether a new-chat page is kept preloaded in the background.
+        
+        Args:
+            default: Default value
+            
+        Returns:
+            bool: Whether the standby page is enabled
+        """
+        return self.get("standby_page", default, bool)
+    
+    def set_standby_page(self, enabled: bool) -> None:
+        """Set whether a new-chat page is kept preloaded in the background.
+        
+        Args:
+            enabled: Whether the standby page is enabled (it is still skipped when memory is low)
+        """
+        self.set("standby_page", enabled)
+    
+    def get_long_chat_mode(self, default: str = "contain") -> str:
+        """Get how long conversations are rendered.
+        
+        Args:
+            default: Default mode ("off", "contain" or "collapse")
+            
+        Returns:
+            str: Long conversation mode
+        """
+        return self.get("long_chat_mode", default, str)
+    
+    def set_long_chat_mode(self, mode: str) -> None:
+        """Set how long conversations are rendered.
+        
+        Args:
+            mode: "off", "contain" (skip layout of off-screen turns) or "collapse"
+                (also hide turns far above the viewport)
+        """
+        self.set("long_chat_mode", mode)
+    
+    def get_perf_monitor_ms(self, default: int = 5000) -> int:
+        """Get the interval of the page performance monitor's reports.
+        
+        Args:
+            default: Default interval in milliseconds
+            
+        Returns:
+            int: Report interval in milliseconds (0 = monitor off)
+        """
+        return self.get("perf_monitor_ms", default, int)
+    
+    def set_perf_monitor_ms(self, interval_ms: int) -> None:
+        """Set the interval of the page performance monitor's reports.
+        
+        Args:
+            interval_ms: Report interval in milliseconds (0 turns the page and Qt probes off)
+        """
+        self.set("perf_monitor_ms", interval_ms)
+    
+    def get_renderer_memory_budget_mb(self, default: int = 2048) -> int:
+        """Get the private memory budget of the visible page's renderer.
+        
+        Args:
+            default: Default budget in MB
+            
+        Returns:
+            int: Budget in MB (0 = watchdog off)
+        """
+        return self.get("renderer_memory_budget_mb", default, int)
+    
+    def set_renderer_memory_budget_mb(self, budget_mb: int) -> None:
+        """Set the private memory budget of the visible page's renderer.
+        
+        Args:
+            budget_mb: Budget in MB; above it the page is reloaded on a fresh renderer when idle (0 = off)
+        """
+        self.set("renderer_memory_budget_mb", budget_mb)
+    
+    def get_max_live_tabs(self, default: int = 3) -> int:
+        """Get how many chat tabs keep a live page.
+        
+        Args:
+            default: Default limit
+            
+        Returns:
+            int: Maximum live tabs (least recently used ones are discarded beyond this)
+        """
+        return self.get("max_live_tabs", default, int)
+    
+    def set_max_live_tabs(self, max_live: int) -> None:
+        """Set how many chat tabs keep a live page.
+        
+        Args:
+            max_live: Maximum live tabs
+        """
+        self.set("max_live_tabs", max_live)
+    
+    def get_open_tabs(self) -> List[Dict[str, Any]]:
+        """Get the chat tabs saved at the last exit.
+        
+        Returns:
+            List[Dict[str, Any]]: Saved tabs (url, title, scroll_y)
+        """
+        try:
+            tabs = json.loads(self.get("open_tabs", "[]", str))
+        except ValueError:
+            return []
+        return [tab for tab in tabs if isinstance(tab, dict) and tab.get("url")]
+    
+    def set_open_tabs(self, tabs: List[Dict[str, Any]]) -> None:
+        """Save the chat tabs for the next launch.
+        
+        Args:
+            tabs: Tabs to save (url, title, scroll_y)
+        """
+        self.set("open_tabs", json.dumps(tabs))
 
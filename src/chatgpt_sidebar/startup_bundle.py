@@ -0,0 +1,218 @@
+"""Precompiled startup bundle.
+
+A startup bundle is a single file holding the marshalled code objects of
+every package module and of the standard library modules recorded by a
+startup import trace (built by ``tools/build_startup_bundle.py``). Once
+installed, ``BundleFinder`` sits first on ``sys.meta_path`` and serves
+those modules from an in-memory index: one file read at startup instead of
+a directory lookup, ``stat`` and ``.pyc`` read per module. Anything not in
+the bundle falls through to the normal finders.
+
+File layout::
+
+    MAGIC | importlib MAGIC_NUMBER | index length (uint32 LE) | index | code blobs
+
+The index is a marshalled dict mapping module names to ``[offset, size,
+is_package, root, path]``, where ``path`` is the source file relative to
+the package's parent directory (root ``"package"``) or the standard
+library directory (root ``"stdlib"``). Both are resolved where the app
+runs, so ``__file__`` and package search paths match what the normal
+finders would use (the source tree, or the packaged app's data
+directory). A bundle written by another Python version is ignored.
+
+This module is imported from the package's ``__init__`` before anything
+else, so it only imports modules that are loaded at startup anyway.
+"""
+
+import marshal
+import os
+import sys
+import time
+from importlib.machinery import ModuleSpec
+from importlib.util import MAGIC_NUMBER
+from typing import Any, Dict, List, Optional
+
+
+MAGIC = b"CSBUNDLE"
+
+# Shipped next to the packaged executable's data files
+BUNDLE_FILE_NAME = "startup.bundle"
+
+# Bundle to use when running from source (benchmarks)
+BUNDLE_ENV = "CHATGPT_SIDEBAR_BUNDLE"
+
+_HEADER_SIZE = len(MAGIC) + len(MAGIC_NUMBER) + 4
+
+_installed: Optional["BundleFinder"] = None
+
+
+def write_bundle(path: str, modules: Dict[str, Any]) -> int:
+    """Write a bundle file.
+    
+    Args:
+        path: Output file
+        modules: Module name to (code object, is_package, root, relative path)
+        
+    Returns:
+        int: Size of the written file in bytes
+    """
+    index = {}
+    blobs: List[bytes] = []
+    offset = 0
+    for name, (code, is_package, root, relative_path) in sorted(modules.items()):
+        blob = marshal.dumps(code)
+        index[name] = [offset, len(blob), is_package, root, relative_path]
+        blobs.append(blob)
+        offset += len(blob)
+    
+    index_bytes = marshal.dumps(index)
+    with open(path, "wb") as f:
+        f.write(MAGIC + MAGIC_NUMBER + len(index_bytes).to_bytes(4, "little"))
+        f.write(index_bytes)
+        for blob in blobs:
+            f.write(blob)
+    return _HEADER_SIZE + len(index_bytes) + offset
+
+
+class BundleFinder:
+    """Meta path finder and loader serving modules from a bundle."""
+    
+    def __init__(self, path: str, data: bytes, index: Dict[str, list], blobs_start: int) -> None:
+        """Initialize the finder (use load() to read a file).
+        
+        Args:
+            path: Bundle file
+            data: Whole file content
+            index: Module name to [offset, size, is_package, root, relative path]
+            blobs_start: Offset of the first code blob in data
+        """
+        self.path = path
+        self._data = memoryview(data)
+        self._index = index
+        self._blobs_start = blobs_start
+        self._roots = {
+            "package": os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            "stdlib": os.path.dirname(os.__file__),
+        }
+        self._served = 0
+        self._unmarshal_ns = 0
+    
+    @classmethod
+    def load(cls, path: str) -> Optional["BundleFinder"]:
+        """Read a bundle file.
+        
+        Args:
+            path: Bundle file
+            
+        Returns:
+            Optional[BundleFinder]: Finder, or None if the file is missing, corrupt
+                or was built by another Python version
+        """
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if data[:len(MAGIC)] != MAGIC or data[len(MAGIC):len(MAGIC) + len(MAGIC_NUMBER)] != MAGIC_NUMBER:
+            return None
+        
+        index_size = int.from_bytes(data[_HEADER_SIZE - 4:_HEADER_SIZE], "little")
+        try:
+            index = marshal.loads(data[_HEADER_SIZE:_HEADER_SIZE + index_size])
+        except (EOFError, ValueError, TypeError):
+            return None
+        if not isinstance(index, dict):
+            return None
+        return cls(path, data, index, _HEADER_SIZE + index_size)
+    
+    def find_spec(self, fullname: str, path=None, target=None) -> Optional[ModuleSpec]:
+        """Find a bundled module (meta path finder protocol)."""
+        entry = self._index.get(fullname)
+        if entry is None:
+            return None
+        _, _, is_package, root, relative_path = entry
+        origin = os.path.join(self._roots[root], relative_path)
+        spec = ModuleSpec(fullname, self, origin=origin, is_package=is_package)
+        spec.has_location = True  # Sets __file__ to the original source path
+        if is_package:
+            # Let the normal finders locate submodules that aren't bundled
+            spec.submodule_search_locations = [os.path.dirname(origin)]
+        return spec
+    
+    def create_module(self, spec: ModuleSpec) -> None:
+        """Use the default module creation."""
+        return None
+    
+    def exec_module(self, module) -> None:
+        """Run a bundled module's code."""
+        exec(self.get_code(module.__name__), module.__dict__)
+    
+    def get_code(self, fullname: str):
+        """Unmarshal a module's code object (also used by runpy for ``-m``)."""
+        offset, size = self._index[fullname][:2]
+        start = self._blobs_start + offset
+        t0 = time.perf_counter_ns()
+        code = marshal.loads(self._data[start:start + size])
+        self._unmarshal_ns += time.perf_counter_ns() - t0
+        self._served += 1
+        return code
+    
+    def is_package(self, fullname: str) -> bool:
+        """Check whether a bundled module is a package."""
+        return self._index[fullname][2]
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Report the bundle's use.
+        
+        Returns:
+            Dict[str, Any]: File, bundled and served module counts and unmarshal time
+        """
+        return {
+            "path": self.path,
+            "size_kb": len(self._data) // 1024,
+            "modules": len(self._index),
+            "served": self._served,
+            "unmarshal_ms": round(self._unmarshal_ns / 1e6, 1),
+        }
+
+
+def install(path: str) -> Optional[BundleFinder]:
+    """Serve modules from a bundle ahead of the normal finders.
+    
+    Args:
+        path: Bundle file
+        
+    Returns:
+        Optional[BundleFinder]: Installed finder, or None if the bundle can't be used
+    """
+    global _installed
+    if _installed is not None:
+        return _installed
+    finder = BundleFinder.load(path)
+    if finder is not None:
+        sys.meta_path.insert(0, finder)
+        _installed = finder
+    return finder
+
+
+def install_default() -> Optional[BundleFinder]:
+    """Install the bundle named by ``CHATGPT_SIDEBAR_BUNDLE`` or shipped with the packaged app.
+    
+    Returns:
+        Optional[BundleFinder]: Installed finder, or None if there is no usable bundle
+    """
+    path = os.environ.get(BUNDLE_ENV)
+    if not path and getattr(sys, "frozen", False):
+        path = os.path.join(getattr(sys, "_MEIPASS", os.path.dirname(sys.executable)), BUNDLE_FILE_NAME)
+    if not path:
+        return None
+    return install(path)
+
+
+def installed() -> Optional[BundleFinder]:
+    """Get the installed finder.
+    
+    Returns:
+        Optional[BundleFinder]: Finder, or None when modules are imported normally
+    """
+    return _installed
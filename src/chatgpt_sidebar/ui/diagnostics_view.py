@@ -0,0 +1,158 @@
+"""Diagnostics page shown in the sidebar stack."""
+
+import json
+from typing import Any, Dict, Optional
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtGui import QFont, QIcon
+from PySide6.QtWidgets import (
+    QFileDialog, QFrame, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton, QVBoxLayout, QWidget
+)
+
+from ..constants import DIAGNOSTICS_REFRESH_MS
+from ..utils import diagnostics
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class DiagnosticsView(QWidget):
+    """Live view of every registered diagnostics provider.
+    
+    Shows a short performance summary (page vs. Qt main thread) above the
+    full snapshot as JSON, refreshes while visible and exports the
+    snapshot to a file.
+    """
+    
+    # Emitted when the back button is clicked
+    back_clicked = Signal()
+    
+    def __init__(self, colors: Dict[str, str], icons: Dict[str, QIcon], parent: Optional[QWidget] = None) -> None:
+        """Initialize the view.
+        
+        Args:
+            colors: Theme color palette
+            icons: Icon dictionary
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.colors = colors
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        
+        header = QFrame()
+        header.setProperty("role", "pageHeader")
+        header.setFixedHeight(50)
+        header_layout = QHBoxLayout(header)
+        header_layout.setContentsMargins(10, 10, 10, 10)
+        header_layout.setSpacing(10)
+        
+        self.btn_back = QPushButton()
+        self.btn_back.setIcon(icons['left'])
+        self.btn_back.setToolTip("Back to chat")
+        self.btn_back.setFixedSize(30, 30)
+        self.btn_back.setProperty("role", "back")
+        self.btn_back.clicked.connect(self.back_clicked.emit)
+        
+        title = QLabel("Diagnostics")
+        title.setProperty("role", "pageTitle")
+        
+        self.btn_export = QPushButton("Export...")
+        self.btn_export.setToolTip("Save the snapshot as JSON")
+        self.btn_export.setObjectName("exportButton")
+        self.btn_export.clicked.connect(self._on_export)
+        
+        header_layout.addWidget(self.btn_back)
+        header_layout.addWidget(title)
+        header_layout.addStretch()
+        header_layout.addWidget(self.btn_export)
+        
+        self.summary = QLabel()
+        self.summary.setObjectName("diagnosticsSummary")
+        self.summary.setWordWrap(True)
+        
+        self.text = QPlainTextEdit()
+        self.text.setReadOnly(True)
+        self.text.setFont(QFont("Consolas", 9))
+        self.text.setObjectName("diagnosticsText")
+        
+        layout.addWidget(header)
+        layout.addWidget(self.summary)
+        layout.addWidget(self.text, 1)
+        
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.refresh)
+    
+    def set_theme(self, colors: Dict[str, str], icons: Dict[str, QIcon]) -> None:
+        """Switch to another palette (the application stylesheet styles the page).
+        
+        Args:
+            colors: Theme color palette
+            icons: Icon dictionary
+        """
+        self.colors = colors
+        self.btn_back.setIcon(icons['left'])
+    
+    def refresh(self) -> None:
+        """Collect a new snapshot and show it (keeping the scroll position)."""
+        snapshot = diagnostics.collect()
+        self.summary.setText(self._summarize(snapshot.get("performance")))
+        scroll = self.text.verticalScrollBar().value()
+        self.text.setPlainText(json.dumps(snapshot, indent=2, default=str))
+        self.text.verticalScrollBar().setValue(scroll)
+    
+    def showEvent(self, e) -> None:
+        """Refresh immediately and periodically while visible."""
+        super().showEvent(e)
+        self.refresh()
+        self._timer.start(DIAGNOSTICS_REFRESH_MS)
+    
+    def hideEvent(self, e) -> None:
+        """Stop refreshing while hidden."""
+        super().hideEvent(e)
+        self._timer.stop()
+    
+    def _summarize(self, perf: Optional[Dict[str, Any]]) -> str:
+        """Describe where time is going in one short paragraph.
+        
+        Args:
+            perf: Performance section of the snapshot
+            
+        Returns:
+            str: Summary text
+        """
+        if not perf or not perf.get("report_ms"):
+            return "Performance monitor is off (perf_monitor_ms = 0)."
+        
+        lines = []
+        page = perf.get("page")
+        if page:
+            heap = page.get("heap_used")
+            heap_text = f"{heap / (1024 * 1024):.0f} MB JS heap" if heap else "JS heap n/a"
+            lines.append(f"Page (last {page['window_s']:.0f} s): {page['long_tasks']} long tasks "
+                         f"({page['long_task_ms']:.0f} ms, max {page['long_task_max_ms']:.0f} ms), "
+                         f"event-loop delay p95 up to {page['lag_p95_ms_worst'] or 0:.0f} ms, {heap_text}, "
+                         f"monitor overhead {page['overhead_pct']:.2f}%")
+        else:
+            lines.append("Page: waiting for the first report...")
+        
+        qt = perf.get("qt") or {}
+        lag = qt.get("event_loop_lag_ms")
+        if lag:
+            lines.append(f"Qt: event-loop delay p95 {lag['p95']:.0f} ms, max {lag['max']:.0f} ms, "
+                         f"{qt['stalls']} stalls over {qt['stall_threshold_ms']} ms")
+        return "\n".join(lines)
+    
+    def _on_export(self) -> None:
+        """Save the current snapshot as JSON."""
+        path, _ = QFileDialog.getSaveFileName(self, "Export diagnostics", "sidebar-diagnostics.json",
+                                              "JSON files (*.json)")
+        if not path:
+            return
+        try:
+            diagnostics.export(path)
+            logger.info(f"Diagnostics exported to {path}")
+        except OSError as e:
+            logger.error(f"Failed to export diagnostics: {e}")
@@ -0,0 +1,168 @@
+"""Themed icon cache.
+
+Control icons are painted with QPainter or taken from the Qt style and
+recolored. ``IconCache`` renders each icon once per process for a palette
+and for the device pixel ratio of every screen, so icons stay sharp on
+HiDPI displays. It also writes the pixmaps as PNGs to the app cache
+directory, so later launches only decode them.
+
+Cached files live in one folder per palette, keyed by a hash of the
+palette, the Qt style and ``ICON_CACHE_VERSION``. Folders for palettes
+that are no longer used age out through the idle cache pruner, like any
+other cache file.
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from PySide6.QtGui import QGuiApplication, QIcon, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from ..constants import ICON_CACHE_VERSION
+from ..utils.logging import get_logger
+from ..utils.paths import get_app_cache_path
+
+
+logger = get_logger(__name__)
+
+
+def screen_ratios() -> Tuple[float, ...]:
+    """Get the distinct device pixel ratios of the connected screens.
+    
+    Returns:
+        Tuple[float, ...]: Ratios in ascending order (1.0 if there is no screen)
+    """
+    return tuple(sorted({screen.devicePixelRatio() for screen in QGuiApplication.screens()})) or (1.0,)
+
+
+class IconCache:
+    """Icons rendered once per (palette, icon, device pixel ratio) and kept as PNGs."""
+    
+    def __init__(self, directory: Optional[Path]) -> None:
+        """Initialize the cache.
+        
+        Args:
+            directory: Folder for rendered PNGs (None keeps icons in memory only)
+        """
+        self._directory = directory
+        self._icons: Dict[Tuple, QIcon] = {}
+        self._folders: Dict[Tuple, Optional[Path]] = {}
+        self._loaded = 0
+        self._rendered = 0
+        self._write_failures = 0
+        self._load_ns = 0
+        self._render_ns = 0
+    
+    def get(self, name: str, colors: Dict[str, str], render: Callable[[float], QPixmap]) -> QIcon:
+        """Get an icon, rendering the pixmaps that aren't cached yet.
+        
+        Args:
+            name: Icon name (unique across render functions)
+            colors: Theme color palette the icon is drawn with
+            render: Draws the icon for a device pixel ratio
+            
+        Returns:
+            QIcon: Icon with one pixmap per screen pixel ratio
+        """
+        palette = tuple(sorted(colors.items()))
+        ratios = screen_ratios()
+        key = (palette, name, ratios)
+        icon = self._icons.get(key)
+        if icon is None:
+            folder = self._folder(palette)
+            icon = QIcon()
+            for ratio in ratios:
+                icon.addPixmap(self._pixmap(folder, name, ratio, render))
+            self._icons[key] = icon
+        return icon
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Report how icons were obtained.
+        
+        Returns:
+            Dict[str, Any]: Cache folder, icon and pixmap counts, load and render time
+        """
+        return {
+            "directory": str(self._directory) if self._directory else None,
+            "icons": len(self._icons),
+            "screen_ratios": list(screen_ratios()),
+            "loaded": self._loaded,
+            "rendered": self._rendered,
+            "write_failures": self._write_failures,
+            "load_ms": round(self._load_ns / 1e6, 2),
+            "render_ms": round(self._render_ns / 1e6, 2),
+        }
+    
+    def _folder(self, palette: Tuple) -> Optional[Path]:
+        """Get (and create) the PNG folder of a palette.
+        
+        Args:
+            palette: Sorted palette items
+            
+        Returns:
+            Optional[Path]: Folder, or None if icons can't be persisted
+        """
+        if palette not in self._folders:
+            folder = None
+            if self._directory is not None:
+                key = f"{ICON_CACHE_VERSION}|{QApplication.style().name()}|{palette}"
+                folder = self._directory / hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+                try:
+                    folder.mkdir(parents=True, exist_ok=True)
+                except OSError as e:
+                    logger.warning(f"Icon cache unavailable, icons are rendered every launch: {e}")
+                    folder = None
+            self._folders[palette] = folder
+        return self._folders[palette]
+    
+    def _pixmap(self, folder: Optional[Path], name: str, ratio: float,
+                render: Callable[[float], QPixmap]) -> QPixmap:
+        """Load one pixmap from disk, or render and save it.
+        
+        Args:
+            folder: Palette folder (None to only render)
+            name: Icon name
+            ratio: Device pixel ratio
+            render: Draws the icon for a device pixel ratio
+            
+        Returns:
+            QPixmap: Pixmap with its device pixel ratio set
+        """
+        path = folder / f"{name}@{ratio:g}x.png" if folder is not None else None
+        if path is not None:
+            start = time.perf_counter_ns()
+            pixmap = QPixmap(str(path))  # Null if the file doesn't exist
+            if not pixmap.isNull():
+                pixmap.setDevicePixelRatio(ratio)
+                self._loaded += 1
+                self._load_ns += time.perf_counter_ns() - start
+                return pixmap
+        
+        start = time.perf_counter_ns()
+        pixmap = render(ratio)
+        self._rendered += 1
+        self._render_ns += time.perf_counter_ns() - start
+        if path is not None and not pixmap.save(str(path), "PNG"):
+            self._write_failures += 1
+        return pixmap
+
+
+_shared: Optional[IconCache] = None
+
+
+def shared_icon_cache() -> IconCache:
+    """Get the process-wide icon cache (PNGs under the app cache directory).
+    
+    Returns:
+        IconCache: Shared cache
+    """
+    global _shared
+    if _shared is None:
+        try:
+            directory: Optional[Path] = get_app_cache_path() / "Icons"
+        except OSError as e:
+            logger.warning(f"App cache directory unavailable: {e}")
+            directory = None
+        _shared = IconCache(directory)
+    return _shared
@@ -0,0 +1,720 @@
+"""Settings page shown in the sidebar stack.
+
+The page can be built in steps (``build_steps()``) so the sidebar can
+construct it in idle time, a few widgets per slice, long before it is
+first opened. Widgets are styled by the application stylesheet (see
+``stylesheet.py``) through their object names and ``role`` properties.
+"""
+
+from typing import Any, Dict, Iterator, Optional, Tuple
+from PySide6 import QtCore
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QFrame, QLabel,
+    QPushButton, QCheckBox, QSlider, QSpinBox, QRadioButton, QButtonGroup,
+    QGroupBox, QSpacerItem, QSizePolicy, QScrollArea
+)
+from PySide6.QtGui import QIcon
+
+from ..constants import CLOSE_EXIT, CLOSE_TRAY
+from ..platform.appbar_win import AppBarEdge
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class SettingsView(QWidget):
+    """Settings form with Apply / Restore to Default."""
+    
+    # Emits dict of changed settings
+    settings_changed = Signal(dict)
+    
+    # Emitted when the back button is clicked
+    back_clicked = Signal()
+    
+    def __init__(self, colors: Dict[str, str], icons: Dict[str, QIcon], config,
+                 parent: Optional[QWidget] = None, deferred: bool = False) -> None:
+        """Initialize the view.
+        
+        Args:
+            colors: Theme color palette
+            icons: Icon dictionary
+            config: Configuration manager
+            parent: Parent widget
+            deferred: Leave the page empty until build_steps() or finish_build() is run
+        """
+        super().__init__(parent)
+        self.colors = colors
+        self.icons = icons
+        self.config = config
+        
+        # Config values the controls were last loaded from
+        self._loaded: Dict[str, Any] = {}
+        
+        settings_layout = QVBoxLayout(self)
+        settings_layout.setContentsMargins(0, 0, 0, 0)
+        settings_layout.setSpacing(0)
+        
+        self._build: Optional[Iterator[None]] = self._build_page(settings_layout)
+        if not deferred:
+            self.finish_build()
+    
+    def build_steps(self) -> Iterator[None]:
+        """Build the page one step per iteration (an idle task).
+        
+        Yields:
+            None: After each section, control group and polish batch
+        """
+        while self._build is not None:
+            try:
+                next(self._build)
+            except StopIteration:
+                self._build = None
+                return
+            yield
+    
+    def finish_build(self) -> None:
+        """Run the build steps that are still left."""
+        for _ in self.build_steps():
+            pass
+    
+    def is_built(self) -> bool:
+        """Check whether the page is complete.
+        
+        Returns:
+            bool: True once every build step has run
+        """
+        return self._build is None
+    
+    def set_theme(self, colors: Dict[str, str], icons: Dict[str, QIcon]) -> None:
+        """Switch to another palette (the application stylesheet styles the controls).
+        
+        Args:
+            colors: Theme color palette
+            icons: Icon dictionary
+        """
+        self.colors = colors
+        self.icons = icons
+        if hasattr(self, 'btn_back'):  # Created by the first build step
+            self.btn_back.setIcon(icons['left'])
+    
+    def reload(self) -> None:
+        """Update the controls whose config values changed since they were loaded."""
+        self.finish_build()
+        values = self._read_config()
+        if self.btn_apply.isEnabled():
+            # Unapplied edits are discarded, so every control is reset
+            changed = list(values)
+        else:
+            changed = [key for key, value in values.items() if self._loaded.get(key) != value]
+        
+        for key in changed:
+            self._load_control(key, values[key])
+        self._loaded = values
+        logger.debug(f"Settings reloaded ({len(changed)} of {len(values)} values changed)")
+        
+        # Disable Apply button after reloading
+        self.btn_apply.setEnabled(False)
+    
+    def _read_config(self) -> Dict[str, Any]:
+        """Read the config values shown by the controls.
+        
+        Returns:
+            Dict[str, Any]: Setting name to value
+        """
+        return {
+            'autostart': self.config.get_autostart(),
+            'docked': self.config.is_docked(),
+            'close_behavior': self.config.get_close_behavior(),
+            'hotkey': self.config.get_hotkey(),
+            'edge': self.config.get_edge(),
+            'width_percent': self.config.get_width_percent(),
+            'always_on_top': self.config.get_always_on_top(),
+            'theme': self.config.get_theme(),
+            'opacity': self.config.get_opacity(),
+            'font_size': self.config.get_font_size(),
+            'stay_signed_in': self.config.get_stay_signed_in(),
+        }
+    
+    def _load_control(self, key: str, value: Any) -> None:
+        """Show a config value in its control.
+        
+        Args:
+            key: Setting name (see _read_config())
+            value: Config value
+        """
+        # General settings
+        if key == 'autostart':
+            self.chk_launch_startup.setChecked(value)
+        elif key == 'docked':
+            self.chk_start_docked.setChecked(value)
+        elif key == 'close_behavior':
+            self.chk_keep_in_tray.setChecked(value == CLOSE_TRAY)
+        elif key == 'hotkey':
+            self.chk_keep_in_tray.setToolTip(self._get_keep_in_tray_tooltip(value))
+        elif key == 'edge':
+            if value == AppBarEdge.LEFT:
+                self.radio_left.setChecked(True)
+            else:
+                self.radio_right.setChecked(True)
+        elif key == 'width_percent':
+            # Update both slider and spinbox for width
+            self.width_spinbox.setValue(value)
+            self.width_slider.setValue(value // 5)
+        elif key == 'always_on_top':
+            self.chk_always_on_top.setChecked(value)
+        
+        # Appearance settings
+        elif key == 'theme':
+            if value == "system":
+                self.radio_system.setChecked(True)
+            elif value == "light":
+                self.radio_light.setChecked(True)
+            else:
+                self.radio_dark.setChecked(True)
+        elif key == 'opacity':
+            self.opacity_slider.setValue(int(value * 100))
+        elif key == 'font_size':
+            if value == "small":
+                self.radio_small.setChecked(True)
+            elif value == "medium":
+                self.radio_medium.setChecked(True)
+            else:
+                self.radio_large.setChecked(True)
+        
+        # Storage settings
+        elif key == 'stay_signed_in':
+            self.chk_stay_signed_in.setChecked(value)
+    
+    # -------------------------------------------------------------------------
+    # Settings UI construction
+    # -------------------------------------------------------------------------
+    
+    def _build_page(self, settings_layout: QVBoxLayout) -> Iterator[None]:
+        """Create the page's widgets, yielding between steps.
+        
+        Args:
+            settings_layout: Top-level layout of the view
+        """
+        self._loaded = self._read_config()
+        
+        # Create header with back button
+        header = self._create_header()
+        settings_layout.addWidget(header)
+        yield
+        
+        # Create scrollable content area
+        scroll_area, content_layout = self._create_scroll_area()
+        settings_layout.addWidget(scroll_area, 1)
+        yield
+        
+        # Create settings sections
+        yield from self._create_general_section(content_layout)
+        yield from self._create_appearance_section(content_layout)
+        yield from self._create_storage_section(content_layout)
+        
+        # Add spacer at the end
+        content_layout.addStretch()
+        
+        # Create fixed footer with buttons
+        footer = self._create_settings_footer()
+        settings_layout.addWidget(footer)
+        yield
+        
+        # Resolve styles and size hints now rather than on the first show
+        widgets = self.findChildren(QWidget)
+        for i in range(0, len(widgets), 8):
+            for widget in widgets[i:i + 8]:
+                widget.ensurePolished()
+            yield
+        settings_layout.activate()
+    
+    def _create_header(self) -> QFrame:
+        """Create settings header with back button.
+        
+        Returns:
+            QFrame: Header frame
+        """
+        header = QFrame()
+        header.setProperty("role", "pageHeader")
+        header.setFixedHeight(50)
+        
+        header_layout = QHBoxLayout(header)
+        header_layout.setContentsMargins(10, 10, 10, 10)
+        header_layout.setSpacing(10)
+        
+        # Back button
+        self.btn_back = QPushButton()
+        self.btn_back.setIcon(self.icons['left'])
+        self.btn_back.setToolTip("Back to chat")
+        self.btn_back.setFixedSize(30, 30)
+        self.btn_back.setProperty("role", "back")
+        self.btn_back.clicked.connect(self.back_clicked.emit)
+        
+        # Settings title
+        settings_title = QLabel("Settings")
+        settings_title.setProperty("role", "pageTitle")
+        
+        header_layout.addWidget(self.btn_back)
+        header_layout.addWidget(settings_title)
+        header_layout.addStretch()
+        
+        return header
+    
+    def _create_scroll_area(self) -> Tuple[QScrollArea, QVBoxLayout]:
+        """Create scrollable settings area.
+        
+        Returns:
+            Tuple[QScrollArea, QVBoxLayout]: Scroll area and the layout to add sections to
+        """
+        content_area = QWidget()
+        content_area.setObjectName("settingsContent")
+        
+        scroll_area = QScrollArea()
+        scroll_area.setObjectName("settingsScroll")
+        scroll_area.setWidget(content_area)
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        scroll_area.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAsNeeded)
+        
+        content_layout = QVBoxLayout(content_area)
+        content_layout.setContentsMargins(15, 15, 15, 15)
+        content_layout.setSpacing(15)
+        
+        return scroll_area, content_layout
+    
+    def _create_general_section(self, parent_layout: QVBoxLayout) -> Iterator[None]:
+        """Create the general settings section, yielding after each control group.
+        
+        Args:
+            parent_layout: Parent layout to add section to
+        """
+        # General group box
+        general_group = QGroupBox("General")
+        general_layout = QVBoxLayout(general_group)
+        general_layout.setSpacing(12)
+        general_layout.setContentsMargins(10, 15, 10, 10)
+        parent_layout.addWidget(general_group)
+        
+        # Add settings controls
+        for add_settings in (self._add_startup_settings, self._add_position_settings,
+                             self._add_width_settings, self._add_always_on_top_settings):
+            add_settings(general_layout)
+            yield
+        
+        # Add stretch
+        general_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+    
+    def _add_startup_settings(self, layout: QVBoxLayout) -> None:
+        """Add startup behavior settings."""
+        label = QLabel("Startup behavior")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        self.chk_launch_startup = QCheckBox("Launch on system startup")
+        self.chk_launch_startup.setChecked(self.config.get_autostart())
+        layout.addWidget(self.chk_launch_startup)
+        
+        self.chk_start_docked = QCheckBox("Start in docked mode")
+        self.chk_start_docked.setChecked(self.config.is_docked())
+        layout.addWidget(self.chk_start_docked)
+        
+        self.chk_keep_in_tray = QCheckBox("Keep running in the tray when closed")
+        self.chk_keep_in_tray.setToolTip(self._get_keep_in_tray_tooltip(self.config.get_hotkey()))
+        self.chk_keep_in_tray.setChecked(self.config.get_close_behavior() == CLOSE_TRAY)
+        layout.addWidget(self.chk_keep_in_tray)
+        
+        layout.addSpacing(8)
+    
+    def _add_position_settings(self, layout: QVBoxLayout) -> None:
+        """Add position settings."""
+        label = QLabel("Default position")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        position_widget = QWidget()
+        position_layout = QHBoxLayout(position_widget)
+        position_layout.setContentsMargins(0, 0, 0, 0)
+        position_layout.setSpacing(15)
+        
+        self.position_group = QButtonGroup()
+        self.radio_left = QRadioButton("Left")
+        self.radio_right = QRadioButton("Right")
+        
+        self.position_group.addButton(self.radio_left, AppBarEdge.LEFT)
+        self.position_group.addButton(self.radio_right, AppBarEdge.RIGHT)
+        
+        current_edge = self.config.get_edge()
+        if current_edge == AppBarEdge.LEFT:
+            self.radio_left.setChecked(True)
+        else:
+            self.radio_right.setChecked(True)
+        
+        position_layout.addWidget(self.radio_left)
+        position_layout.addWidget(self.radio_right)
+        position_layout.addStretch()
+        
+        layout.addWidget(position_widget)
+        layout.addSpacing(8)
+    
+    def _add_width_settings(self, layout: QVBoxLayout) -> None:
+        """Add width settings."""
+        label = QLabel("Default width")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        width_widget = QWidget()
+        width_layout = QHBoxLayout(width_widget)
+        width_layout.setContentsMargins(0, 0, 0, 0)
+        width_layout.setSpacing(8)
+        
+        self.width_slider = QSlider(QtCore.Qt.Horizontal)
+        self.width_slider.setMinimum(2)
+        self.width_slider.setMaximum(10)
+        self.width_slider.setValue(self.config.get_width_percent() // 5)
+        self.width_slider.setMaximumWidth(120)
+        
+        self.width_spinbox = QSpinBox()
+        self.width_spinbox.setMinimum(10)
+        self.width_spinbox.setMaximum(50)
+        self.width_spinbox.setSingleStep(5)
+        self.width_spinbox.setValue(self.config.get_width_percent())
+        self.width_spinbox.setSuffix("%")
+        self.width_spinbox.setMaximumWidth(60)
+        
+        self.width_slider.valueChanged.connect(lambda v: self.width_spinbox.setValue(v * 5))
+        self.width_spinbox.valueChanged.connect(lambda v: self.width_slider.setValue(v // 5))
+        
+        width_layout.addWidget(self.width_slider, 1)
+        width_layout.addWidget(self.width_spinbox)
+        
+        layout.addWidget(width_widget)
+        layout.addSpacing(8)
+    
+    def _add_always_on_top_settings(self, layout: QVBoxLayout) -> None:
+        """Add always on top settings."""
+        label = QLabel("Always on top")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        self.chk_always_on_top = QCheckBox("Keep sidebar above other windows")
+        self.chk_always_on_top.setChecked(self.config.get_always_on_top())
+        layout.addWidget(self.chk_always_on_top)
+        
+        layout.addSpacing(8)
+    
+    def _create_appearance_section(self, parent_layout: QVBoxLayout) -> Iterator[None]:
+        """Create the appearance settings section, yielding after each control group.
+        
+        Args:
+            parent_layout: Parent layout to add section to
+        """
+        # Appearance group box
+        appearance_group = QGroupBox("Appearance")
+        appearance_layout = QVBoxLayout(appearance_group)
+        appearance_layout.setSpacing(12)
+        appearance_layout.setContentsMargins(10, 15, 10, 10)
+        parent_layout.addWidget(appearance_group)
+        
+        # Add appearance controls
+        for add_settings in (self._add_theme_settings, self._add_opacity_settings,
+                             self._add_font_size_settings):
+            add_settings(appearance_layout)
+            yield
+        
+        # Add stretch
+        appearance_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+    
+    def _add_theme_settings(self, layout: QVBoxLayout) -> None:
+        """Add theme selection settings."""
+        label = QLabel("Theme")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        theme_widget = QWidget()
+        theme_layout = QHBoxLayout(theme_widget)
+        theme_layout.setContentsMargins(0, 0, 0, 0)
+        theme_layout.setSpacing(15)
+        
+        self.theme_group = QButtonGroup()
+        self.radio_system = QRadioButton("Match system")
+        self.radio_light = QRadioButton("Light")
+        self.radio_dark = QRadioButton("Dark")
+        
+        self.theme_group.addButton(self.radio_system, 0)
+        self.theme_group.addButton(self.radio_light, 1)
+        self.theme_group.addButton(self.radio_dark, 2)
+        
+        current_theme = self.config.get_theme()
+        if current_theme == "system":
+            self.radio_system.setChecked(True)
+        elif current_theme == "light":
+            self.radio_light.setChecked(True)
+        else:
+            self.radio_dark.setChecked(True)
+        
+        theme_layout.addWidget(self.radio_system)
+        theme_layout.addWidget(self.radio_light)
+        theme_layout.addWidget(self.radio_dark)
+        theme_layout.addStretch()
+        
+        layout.addWidget(theme_widget)
+        layout.addSpacing(8)
+    
+    def _add_opacity_settings(self, layout: QVBoxLayout) -> None:
+        """Add opacity/transparency settings."""
+        label = QLabel("Transparency / Opacity")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        opacity_widget = QWidget()
+        opacity_layout = QHBoxLayout(opacity_widget)
+        opacity_layout.setContentsMargins(0, 0, 0, 0)
+        opacity_layout.setSpacing(8)
+        
+        self.opacity_slider = QSlider(QtCore.Qt.Horizontal)
+        self.opacity_slider.setMinimum(50)  # 50% minimum
+        self.opacity_slider.setMaximum(100)  # 100% maximum
+        self.opacity_slider.setValue(int(self.config.get_opacity() * 100))
+        
+        self.opacity_label = QLabel(f"{int(self.config.get_opacity() * 100)}%")
+        self.opacity_label.setObjectName("opacityLabel")
+        
+        self.opacity_slider.valueChanged.connect(lambda v: self.opacity_label.setText(f"{v}%"))
+        
+        opacity_layout.addWidget(self.opacity_slider, 1)
+        opacity_layout.addWidget(self.opacity_label)
+        
+        layout.addWidget(opacity_widget)
+        layout.addSpacing(8)
+    
+    def _add_font_size_settings(self, layout: QVBoxLayout) -> None:
+        """Add font size settings."""
+        label = QLabel("Font size for chat text")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        fontsize_widget = QWidget()
+        fontsize_layout = QHBoxLayout(fontsize_widget)
+        fontsize_layout.setContentsMargins(0, 0, 0, 0)
+        fontsize_layout.setSpacing(15)
+        
+        self.fontsize_group = QButtonGroup()
+        self.radio_small = QRadioButton("Small")
+        self.radio_medium = QRadioButton("Medium")
+        self.radio_large = QRadioButton("Large")
+        
+        self.fontsize_group.addButton(self.radio_small, 0)
+        self.fontsize_group.addButton(self.radio_medium, 1)
+        self.fontsize_group.addButton(self.radio_large, 2)
+        
+        current_fontsize = self.config.get_font_size()
+        if current_fontsize == "small":
+            self.radio_small.setChecked(True)
+        elif current_fontsize == "medium":
+            self.radio_medium.setChecked(True)
+        else:
+            self.radio_large.setChecked(True)
+        
+        fontsize_layout.addWidget(self.radio_small)
+        fontsize_layout.addWidget(self.radio_medium)
+        fontsize_layout.addWidget(self.radio_large)
+        fontsize_layout.addStretch()
+        
+        layout.addWidget(fontsize_widget)
+        layout.addSpacing(8)
+    
+    def _create_storage_section(self, parent_layout: QVBoxLayout) -> Iterator[None]:
+        """Create the storage settings section, yielding after each control group.
+        
+        Args:
+            parent_layout: Parent layout to add section to
+        """
+        # Storage group box
+        storage_group = QGroupBox("Storage")
+        storage_layout = QVBoxLayout(storage_group)
+        storage_layout.setSpacing(12)
+        storage_layout.setContentsMargins(10, 15, 10, 10)
+        parent_layout.addWidget(storage_group)
+        
+        # Add storage controls
+        for add_settings in (self._add_stay_signed_in_settings, self._add_sign_out_button):
+            add_settings(storage_layout)
+            yield
+        
+        # Add stretch
+        storage_layout.addItem(QSpacerItem(20, 40, QSizePolicy.Minimum, QSizePolicy.Expanding))
+    
+    def _add_stay_signed_in_settings(self, layout: QVBoxLayout) -> None:
+        """Add stay signed in settings."""
+        label = QLabel("Session")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        self.chk_stay_signed_in = QCheckBox("Stay signed in")
+        self.chk_stay_signed_in.setChecked(self.config.get_stay_signed_in())
+        layout.addWidget(self.chk_stay_signed_in)
+        
+        layout.addSpacing(8)
+    
+    def _add_sign_out_button(self, layout: QVBoxLayout) -> None:
+        """Add sign out button."""
+        label = QLabel("Account")
+        label.setProperty("role", "settingLabel")
+        layout.addWidget(label)
+        
+        self.btn_sign_out = QPushButton("Sign out")
+        self.btn_sign_out.setObjectName("signOutButton")
+        self.btn_sign_out.clicked.connect(self._on_sign_out)
+        layout.addWidget(self.btn_sign_out)
+        
+        layout.addSpacing(8)
+    
+    def _create_settings_footer(self) -> QFrame:
+        """Create fixed footer with Apply and Restore buttons.
+        
+        Returns:
+            QFrame: Footer frame with buttons
+        """
+        footer = QFrame()
+        footer.setObjectName("settingsFooter")
+        footer.setFixedHeight(60)
+        
+        footer_layout = QHBoxLayout(footer)
+        footer_layout.setContentsMargins(15, 10, 15, 10)
+        footer_layout.setSpacing(10)
+        
+        self.btn_restore_default = QPushButton("Restore to Default")
+        self.btn_restore_default.clicked.connect(self._on_restore_defaults)
+        
+        self.btn_apply = QPushButton("Apply")
+        self.btn_apply.setEnabled(False)
+        self.btn_apply.clicked.connect(self._on_apply_settings)
+        
+        footer_layout.addWidget(self.btn_restore_default)
+        footer_layout.addStretch()
+        footer_layout.addWidget(self.btn_apply)
+        
+        # Connect all controls to enable Apply button when changed
+        self._connect_change_handlers()
+        
+        return footer
+    
+    def _get_keep_in_tray_tooltip(self, hotkey: str) -> str:
+        return ("Closing hides the sidebar; reopen it instantly from the tray icon"
+                + (f" or with {hotkey}" if hotkey else ""))
+    
+    # -------------------------------------------------------------------------
+    # Settings event handlers
+    # -------------------------------------------------------------------------
+    
+    def _connect_change_handlers(self) -> None:
+        """Connect all setting controls to enable Apply button on change."""
+        # General section
+        self.chk_launch_startup.stateChanged.connect(self._on_setting_changed)
+        self.chk_start_docked.stateChanged.connect(self._on_setting_changed)
+        self.chk_keep_in_tray.stateChanged.connect(self._on_setting_changed)
+        self.position_group.buttonClicked.connect(self._on_setting_changed)
+        self.width_slider.valueChanged.connect(self._on_setting_changed)
+        self.chk_always_on_top.stateChanged.connect(self._on_setting_changed)
+        
+        # Appearance section
+        self.theme_group.buttonClicked.connect(self._on_setting_changed)
+        self.opacity_slider.valueChanged.connect(self._on_setting_changed)
+        self.fontsize_group.buttonClicked.connect(self._on_setting_changed)
+        
+        # Storage section
+        self.chk_stay_signed_in.stateChanged.connect(self._on_setting_changed)
+    
+    def _on_setting_changed(self) -> None:
+        """Enable Apply button when a setting is changed."""
+        self.btn_apply.setEnabled(True)
+    
+    def _on_apply_settings(self) -> None:
+        """Apply and save all settings."""
+        logger.info("Applying settings...")
+        
+        # General settings
+        self.config.set_autostart(self.chk_launch_startup.isChecked())
+        self.config.set_docked(self.chk_start_docked.isChecked())
+        self.config.set_close_behavior(CLOSE_TRAY if self.chk_keep_in_tray.isChecked() else CLOSE_EXIT)
+        self.config.set_edge(self.position_group.checkedId())
+        self.config.set_width_percent(self.width_spinbox.value())
+        self.config.set_always_on_top(self.chk_always_on_top.isChecked())
+        
+        # Appearance settings
+        if self.radio_system.isChecked():
+            self.config.set_theme("system")
+        elif self.radio_light.isChecked():
+            self.config.set_theme("light")
+        else:
+            self.config.set_theme("dark")
+        
+        self.config.set_opacity(self.opacity_slider.value() / 100.0)
+        
+        if self.radio_small.isChecked():
+            self.config.set_font_size("small")
+        elif self.radio_medium.isChecked():
+            self.config.set_font_size("medium")
+        else:
+            self.config.set_font_size("large")
+        
+        # Storage settings
+        self.config.set_stay_signed_in(self.chk_stay_signed_in.isChecked())
+        
+        # The controls now show the saved config (reload() diffs against this)
+        self._loaded = self._read_config()
+        
+        # Emit signal with changed settings
+        changed_settings = {
+            'autostart': self.chk_launch_startup.isChecked(),
+            'docked': self.chk_start_docked.isChecked(),
+            'close_behavior': self.config.get_close_behavior(),
+            'edge': self.position_group.checkedId(),
+            'width_percent': self.width_spinbox.value(),
+            'always_on_top': self.chk_always_on_top.isChecked(),
+            'theme': self.config.get_theme(),
+            'opacity': self.config.get_opacity(),
+            'font_size': self.config.get_font_size(),
+            'stay_signed_in': self.chk_stay_signed_in.isChecked(),
+        }
+        self.settings_changed.emit(changed_settings)
+        
+        # Disable Apply button after saving
+        self.btn_apply.setEnabled(False)
+        logger.info("Settings applied successfully")
+    
+    def _on_restore_defaults(self) -> None:
+        """Restore all settings to default values."""
+        logger.info("Restoring default settings...")
+        
+        # General defaults
+        self.chk_launch_startup.setChecked(False)
+        self.chk_start_docked.setChecked(True)
+        self.chk_keep_in_tray.setChecked(False)
+        self.radio_left.setChecked(True)
+        self.width_slider.setValue(4)  # 20%
+        self.chk_always_on_top.setChecked(True)
+        
+        # Appearance defaults
+        self.radio_system.setChecked(True)
+        self.opacity_slider.setValue(100)
+        self.radio_medium.setChecked(True)
+        
+        # Storage defaults
+        self.chk_stay_signed_in.setChecked(True)
+        
+        # Config is unchanged until Apply; reload() resets the controls if it isn't clicked
+        self._loaded = self._read_config()
+        
+        # Enable Apply button so user can save defaults
+        self.btn_apply.setEnabled(True)
+        logger.info("Default settings restored (click Apply to save)")
+    
+    def _on_sign_out(self) -> None:
+        """Handle sign out button click."""
+        # Emit signal to main window to sign out
+        self.settings_changed.emit({'sign_out': True})
+        logger.info("User requested to sign out")
+
@@ -0,0 +1,172 @@
+"""Startup splash built from a snapshot of the last session."""
+
+import time
+from typing import Dict, Optional
+from PySide6 import QtCore, QtGui
+from PySide6.QtCore import Signal, QPropertyAnimation
+from PySide6.QtWidgets import QWidget, QGraphicsOpacityEffect, QSizePolicy
+
+from ..constants import SNAPSHOT_SCALE, SNAPSHOT_JPEG_QUALITY, SPLASH_FADE_MS
+from ..utils.logging import get_logger
+from ..utils.paths import get_snapshot_path
+
+
+logger = get_logger(__name__)
+
+
+def save_snapshot(widget: QWidget) -> bool:
+    """Save a downscaled JPEG snapshot of a widget for the next launch.
+    
+    Args:
+        widget: Widget to capture (normally the web view)
+        
+    Returns:
+        bool: True if the snapshot was written
+    """
+    try:
+        pixmap = widget.grab()
+        if pixmap.isNull() or pixmap.width() <= 0:
+            return False
+        
+        # Downscale in device pixels; the splash stretches it back on load
+        target_width = max(1, int(pixmap.width() * SNAPSHOT_SCALE))
+        image = pixmap.toImage().scaledToWidth(target_width, QtCore.Qt.SmoothTransformation)
+        
+        path = get_snapshot_path()
+        ok = image.save(str(path), "JPG", SNAPSHOT_JPEG_QUALITY)
+        if ok:
+            logger.info(f"Saved session snapshot {image.width()}x{image.height()} to {path}")
+        return ok
+    except Exception as e:
+        logger.warning(f"Failed to save session snapshot: {e}")
+        return False
+
+
+def load_snapshot() -> Optional[QtGui.QPixmap]:
+    """Load the last-session snapshot.
+    
+    Returns:
+        Optional[QtGui.QPixmap]: Snapshot pixmap or None if unavailable
+    """
+    path = get_snapshot_path()
+    if not path.exists():
+        return None
+    
+    start = time.perf_counter()
+    pixmap = QtGui.QPixmap(str(path))
+    if pixmap.isNull():
+        logger.warning(f"Ignoring unreadable snapshot at {path}")
+        return None
+    
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"Loaded session snapshot in {elapsed_ms:.1f}ms")
+    return pixmap
+
+
+def delete_snapshot() -> None:
+    """Delete the last-session snapshot if one exists."""
+    try:
+        get_snapshot_path().unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Failed to delete session snapshot: {e}")
+
+
+class SnapshotSplash(QWidget):
+    """Placeholder that shows the last session until the web view has painted.
+    
+    Falls back to a plain "Loading..." message when no snapshot exists.
+    """
+    
+    # Emitted once the fade-out animation has completed
+    finished = Signal()
+    
+    def __init__(self, colors: Dict[str, str], parent: Optional[QWidget] = None) -> None:
+        """Initialize the splash.
+        
+        Args:
+            colors: Theme color palette
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.colors = colors
+        self._pixmap = load_snapshot()
+        self._animation: Optional[QPropertyAnimation] = None
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+    
+    def set_theme(self, colors: Dict[str, str]) -> None:
+        """Repaint the background and message in another palette.
+        
+        Args:
+            colors: Theme color palette
+        """
+        self.colors = colors
+        self.update()
+    
+    def has_snapshot(self) -> bool:
+        """Check whether a snapshot is being shown.
+        
+        Returns:
+            bool: True if a snapshot was loaded
+        """
+        return self._pixmap is not None
+    
+    def overlay(self, parent: QWidget) -> None:
+        """Float the splash over a widget so its content can fade in underneath.
+        
+        Args:
+            parent: Widget to cover
+        """
+        self.setParent(parent)
+        self.setGeometry(parent.rect())
+        parent.installEventFilter(self)
+        self.show()
+        self.raise_()
+    
+    def fade_out(self, duration_ms: int = SPLASH_FADE_MS) -> None:
+        """Cross-fade the splash away, then hide it.
+        
+        Args:
+            duration_ms: Animation duration in milliseconds
+        """
+        if self._animation is not None:
+            return
+        
+        effect = QGraphicsOpacityEffect(self)
+        self.setGraphicsEffect(effect)
+        
+        self._animation = QPropertyAnimation(effect, b"opacity", self)
+        self._animation.setDuration(duration_ms)
+        self._animation.setStartValue(1.0)
+        self._animation.setEndValue(0.0)
+        self._animation.finished.connect(self._on_fade_finished)
+        self._animation.start()
+    
+    def _on_fade_finished(self) -> None:
+        """Hide the splash once the animation completes."""
+        self.hide()
+        self.finished.emit()
+    
+    def eventFilter(self, obj: QtCore.QObject, event: QtCore.QEvent) -> bool:
+        """Keep the overlay sized to the widget it covers."""
+        if obj is self.parent() and event.type() == QtCore.QEvent.Resize:
+            self.setGeometry(obj.rect())
+        return False
+    
+    def paintEvent(self, e: QtGui.QPaintEvent) -> None:
+        """Paint the snapshot scaled to the current width, or the loading text."""
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), QtGui.QColor(self.colors['bg']))
+        
+        if self._pixmap is not None:
+            # Scale to the current width; the docked height rarely changes between launches
+            height = int(self._pixmap.height() * self.width() / self._pixmap.width())
+            painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+            painter.drawPixmap(QtCore.QRect(0, 0, self.width(), height), self._pixmap)
+        else:
+            font = painter.font()
+            font.setPixelSize(14)
+            painter.setFont(font)
+            painter.setPen(QtGui.QColor(self.colors['fg']))
+            painter.drawText(self.rect(), QtCore.Qt.AlignCenter, "Loading...")
+        
+        painter.end()
@@ -0,0 +1,358 @@
+"""Compiled application stylesheet.
+
+All themed widgets are styled by one stylesheet per palette, set once on
+the application instead of a QSS string per widget. Widgets only carry an
+object name, or a ``role`` dynamic property where several widgets share a
+style, and the rules below select on those, so Qt parses the styles once
+rather than for every widget it creates. Compiled sheets are cached per
+palette, so switching themes back and forth doesn't rebuild them.
+
+Every rule is scoped to an object name or role, so widgets without one
+(dialogs, menus, the web view) keep the native style.
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+from PySide6.QtWidgets import QApplication
+
+from ..constants import (
+    BUTTON_SIZE_PX,
+    BUTTON_PADDING_PX,
+)
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def compile_stylesheet(colors: Dict[str, str]) -> str:
+    """Get the application stylesheet for a palette.
+    
+    Args:
+        colors: Theme color palette
+        
+    Returns:
+        str: QSS for every themed widget
+    """
+    return _compile(tuple(sorted(colors.items())))
+
+
+def apply_stylesheet(colors: Dict[str, str]) -> None:
+    """Style the application with a palette (no-op if it already is).
+    
+    Args:
+        colors: Theme color palette
+    """
+    app = QApplication.instance()
+    stylesheet = compile_stylesheet(colors)
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+        logger.info(f"Application stylesheet applied ({len(stylesheet)} chars)")
+
+
+@lru_cache(maxsize=4)
+def _compile(palette: Tuple[Tuple[str, str], ...]) -> str:
+    colors = dict(palette)
+    return "".join(section(colors) for section in (
+        _control_bar_rules,
+        _tab_bar_rules,
+        _toast_rules,
+        _page_header_rules,
+        _settings_rules,
+        _diagnostics_rules,
+    ))
+
+
+def _control_bar_rules(colors: Dict[str, str]) -> str:
+    return f"""
+        QFrame#controlBar {{
+            background-color: {colors['panel']};
+            border-top: 1px solid {colors['border']};
+        }}
+        #controlBar QPushButton {{
+            background-color: transparent;
+            border: none;
+            border-radius: 4px;
+            padding: {BUTTON_PADDING_PX}px;
+            min-width: {BUTTON_SIZE_PX - 4}px;
+            min-height: {BUTTON_SIZE_PX - 4}px;
+            max-width: {BUTTON_SIZE_PX}px;
+            max-height: {BUTTON_SIZE_PX}px;
+            outline: none;
+        }}
+        #controlBar QPushButton:hover {{
+            background-color: {colors['hover']};
+        }}
+        #controlBar QPushButton:pressed {{
+            background-color: {colors['pressed']};
+        }}
+        #controlBar QPushButton:focus {{
+            outline: none;
+            border: none;
+        }}
+    """
+
+
+def _tab_bar_rules(colors: Dict[str, str]) -> str:
+    return f"""
+        QFrame#tabBar {{
+            background-color: {colors['panel']};
+            border-bottom: 1px solid {colors['border']};
+        }}
+        #tabBar QTabBar::tab {{
+            background-color: transparent;
+            border: none;
+            padding: 4px 8px;
+            max-width: 160px;
+        }}
+        #tabBar QTabBar::tab:selected {{
+            background-color: {colors['bg']};
+            border-bottom: 2px solid {colors['accent']};
+        }}
+        #tabBar QTabBar::tab:hover:!selected {{
+            background-color: {colors['hover']};
+        }}
+        #tabBar QPushButton {{
+            background-color: transparent;
+            border: none;
+            border-radius: 4px;
+            padding: 2px;
+            min-width: {BUTTON_SIZE_PX - 6}px;
+            max-width: {BUTTON_SIZE_PX - 6}px;
+            outline: none;
+        }}
+        #tabBar QPushButton:hover {{
+            background-color: {colors['hover']};
+        }}
+    """
+
+
+def _toast_rules(colors: Dict[str, str]) -> str:
+    return f"""
+        QLabel#toast {{
+            background-color: {colors['panel']};
+            color: {colors['fg']};
+            border: 1px solid {colors['border']};
+            border-radius: 4px;
+            padding: 8px 12px;
+            font-size: 12px;
+        }}
+    """
+
+
+def _page_header_rules(colors: Dict[str, str]) -> str:
+    # Header bar of the settings and diagnostics pages
+    return f"""
+        QFrame[role="pageHeader"] {{
+            background-color: {colors['panel']};
+            border-bottom: 1px solid {colors['border']};
+        }}
+        QLabel[role="pageTitle"] {{
+            color: {colors['fg']};
+            font-size: 18px;
+            font-weight: bold;
+            border: none;
+        }}
+        QPushButton[role="back"] {{
+            background-color: transparent;
+            border: none;
+            border-radius: 4px;
+            padding: 4px;
+        }}
+        QPushButton[role="back"]:hover {{
+            background-color: {colors['hover']};
+        }}
+        QPushButton[role="back"]:pressed {{
+            background-color: {colors['pressed']};
+        }}
+    """
+
+
+def _settings_rules(colors: Dict[str, str]) -> str:
+    return f"""
+        QScrollArea#settingsScroll {{
+            border: none;
+            background-color: {colors['bg']};
+        }}
+        #settingsScroll QScrollBar:vertical {{
+            background-color: {colors['panel']};
+            width: 8px;
+            border-radius: 4px;
+        }}
+        #settingsScroll QScrollBar::handle:vertical {{
+            background-color: {colors['border']};
+            border-radius: 4px;
+            min-height: 20px;
+        }}
+        #settingsScroll QScrollBar::handle:vertical:hover {{
+            background-color: {colors['accent']};
+        }}
+        QWidget#settingsContent, #settingsContent QWidget {{
+            background-color: {colors['bg']};
+        }}
+        #settingsContent QGroupBox {{
+            color: {colors['fg']};
+            font-size: 14px;
+            font-weight: bold;
+            border: 1px solid {colors['border']};
+            border-radius: 6px;
+            margin-top: 10px;
+            padding-top: 10px;
+        }}
+        #settingsContent QGroupBox::title {{
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px 0 5px;
+        }}
+        #settingsContent QLabel[role="settingLabel"] {{
+            color: {colors['fg']};
+            font-weight: bold;
+            font-size: 12px;
+            margin-bottom: 5px;
+        }}
+        #settingsContent QLabel#opacityLabel {{
+            color: {colors['fg']};
+            font-size: 11px;
+            min-width: 40px;
+        }}
+        #settingsContent QCheckBox {{
+            color: {colors['fg']};
+            font-size: 11px;
+            spacing: 8px;
+        }}
+        #settingsContent QCheckBox::indicator {{
+            width: 16px;
+            height: 16px;
+            border: 1px solid {colors['border']};
+            border-radius: 3px;
+            background-color: {colors['panel']};
+        }}
+        #settingsContent QCheckBox::indicator:checked {{
+            background-color: {colors['accent']};
+            border: 1px solid {colors['accent']};
+        }}
+        #settingsContent QCheckBox::indicator:hover {{
+            border: 1px solid {colors['accent']};
+        }}
+        #settingsContent QRadioButton {{
+            color: {colors['fg']};
+            font-size: 11px;
+            spacing: 8px;
+        }}
+        #settingsContent QRadioButton::indicator {{
+            width: 16px;
+            height: 16px;
+            border: 1px solid {colors['border']};
+            border-radius: 8px;
+            background-color: {colors['panel']};
+        }}
+        #settingsContent QRadioButton::indicator:checked {{
+            background-color: {colors['accent']};
+            border: 1px solid {colors['accent']};
+        }}
+        #settingsContent QRadioButton::indicator:hover {{
+            border: 1px solid {colors['accent']};
+        }}
+        #settingsContent QSlider::groove:horizontal {{
+            border: 1px solid {colors['border']};
+            height: 6px;
+            background: {colors['panel']};
+            border-radius: 3px;
+        }}
+        #settingsContent QSlider::handle:horizontal {{
+            background: {colors['accent']};
+            border: 1px solid {colors['accent']};
+            width: 16px;
+            height: 16px;
+            border-radius: 8px;
+            margin: -6px 0;
+        }}
+        #settingsContent QSlider::handle:horizontal:hover {{
+            background: {colors['accent']};
+        }}
+        #settingsContent QSpinBox {{
+            color: {colors['fg']};
+            background-color: {colors['panel']};
+            border: 1px solid {colors['border']};
+            border-radius: 4px;
+            padding: 4px 8px;
+            font-size: 11px;
+            min-width: 60px;
+        }}
+        #settingsContent QSpinBox:focus {{
+            border: 1px solid {colors['accent']};
+        }}
+        #settingsContent QPushButton#signOutButton {{
+            color: {colors['fg']};
+            background-color: {colors['panel']};
+            border: 1px solid {colors['border']};
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-size: 11px;
+            font-weight: bold;
+            text-align: left;
+        }}
+        #settingsContent QPushButton#signOutButton:hover {{
+            background-color: {colors['hover']};
+            border: 1px solid #d13438;
+        }}
+        #settingsContent QPushButton#signOutButton:pressed {{
+            background-color: {colors['pressed']};
+        }}
+        QFrame#settingsFooter {{
+            background-color: {colors['panel']};
+            border-top: 1px solid {colors['border']};
+        }}
+        #settingsFooter QPushButton {{
+            color: {colors['fg']};
+            background-color: {colors['panel']};
+            border: 1px solid {colors['border']};
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-size: 11px;
+            font-weight: bold;
+            min-width: 80px;
+        }}
+        #settingsFooter QPushButton:hover {{
+            background-color: {colors['hover']};
+        }}
+        #settingsFooter QPushButton:pressed {{
+            background-color: {colors['pressed']};
+        }}
+        #settingsFooter QPushButton:disabled {{
+            color: {colors['border']};
+            background-color: {colors['bg']};
+            border: 1px solid {colors['border']};
+        }}
+        #settingsFooter QPushButton:enabled {{
+            border: 1px solid {colors['accent']};
+        }}
+    """
+
+
+def _diagnostics_rules(colors: Dict[str, str]) -> str:
+    return f"""
+        QPushButton#exportButton {{
+            color: {colors['fg']};
+            background-color: {colors['panel']};
+            border: 1px solid {colors['border']};
+            border-radius: 6px;
+            padding: 4px 12px;
+            font-size: 11px;
+        }}
+        QPushButton#exportButton:hover {{
+            background-color: {colors['hover']};
+        }}
+        QLabel#diagnosticsSummary {{
+            color: {colors['fg']};
+            background-color: {colors['bg']};
+            padding: 10px;
+            font-size: 11px;
+        }}
+        QPlainTextEdit#diagnosticsText {{
+            color: {colors['fg']};
+            background-color: {colors['bg']};
+            border: none;
+            border-top: 1px solid {colors['border']};
+        }}
+    """
@@ -0,0 +1,120 @@
+"""Chat tab strip UI component."""
+
+from typing import Any, Dict, List, Optional
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QFrame, QHBoxLayout, QPushButton, QTabBar, QWidget
+
+from ..constants import (
+    TABBAR_HEIGHT_PX,
+    LAYOUT_MARGIN_PX,
+)
+
+
+class ChatTabBar(QFrame):
+    """Tab strip above the web view.
+    
+    Shows one tab per conversation (discarded tabs are drawn dimmed) and a
+    button for opening a new tab. The strip only displays state: the
+    engine owns the tabs and calls set_tabs() whenever they change.
+    """
+    
+    # Signals (carry engine tab ids)
+    tab_selected = Signal(int)
+    tab_close_requested = Signal(int)
+    new_tab_clicked = Signal()
+    
+    def __init__(self, colors: Dict[str, str], icons: Dict[str, Any], parent: Optional[QWidget] = None) -> None:
+        """Initialize the tab strip.
+        
+        Args:
+            colors: Theme color palette
+            icons: Control icons
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.colors = colors
+        self._tab_ids: List[int] = []
+        self._updating = False
+        
+        self.setFrameShape(QFrame.NoFrame)
+        self.setFixedHeight(TABBAR_HEIGHT_PX)
+        self.setObjectName("tabBar")  # Styled by the application stylesheet
+        
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(LAYOUT_MARGIN_PX, 0, LAYOUT_MARGIN_PX, 0)
+        layout.setSpacing(0)
+        
+        self.tabs = QTabBar()
+        self.tabs.setTabsClosable(True)
+        self.tabs.setExpanding(False)
+        self.tabs.setElideMode(Qt.ElideRight)
+        self.tabs.setUsesScrollButtons(True)
+        self.tabs.setDrawBase(False)
+        self.tabs.currentChanged.connect(self._on_current_changed)
+        self.tabs.tabCloseRequested.connect(self._on_close_requested)
+        
+        self.btn_new_tab = QPushButton()
+        self.btn_new_tab.setIcon(icons['new_chat'])
+        self.btn_new_tab.setToolTip("New tab (Ctrl+T)")
+        self.btn_new_tab.setAccessibleName("New tab")
+        self.btn_new_tab.clicked.connect(self.new_tab_clicked.emit)
+        
+        layout.addWidget(self.tabs, 1)
+        layout.addWidget(self.btn_new_tab)
+    
+    def set_theme(self, colors: Dict[str, str], icons: Dict[str, Any]) -> None:
+        """Switch to another palette (tab text colors follow on the next set_tabs()).
+        
+        Args:
+            colors: Theme color palette
+            icons: Control icons
+        """
+        self.colors = colors
+        self.btn_new_tab.setIcon(icons['new_chat'])
+    
+    def set_tabs(self, tabs: List[Dict[str, Any]]) -> None:
+        """Show the engine's tabs.
+        
+        Args:
+            tabs: Tabs as returned by the engine's get_tabs()
+        """
+        self._updating = True
+        try:
+            while self.tabs.count() > len(tabs):
+                self.tabs.removeTab(self.tabs.count() - 1)
+            while self.tabs.count() < len(tabs):
+                self.tabs.addTab("")
+            
+            self._tab_ids = [tab["id"] for tab in tabs]
+            normal = QColor(self.colors['fg'])
+            dimmed = QColor(self.colors['fg'])
+            dimmed.setAlpha(120)
+            for index, tab in enumerate(tabs):
+                title = tab["title"] or "New chat"
+                self.tabs.setTabText(index, title)
+                self.tabs.setTabToolTip(index, f"{title}\n{tab['url']}" + ("" if tab["live"] else "\n(unloaded)"))
+                self.tabs.setTabTextColor(index, normal if tab["live"] else dimmed)
+                if tab["active"]:
+                    self.tabs.setCurrentIndex(index)
+            self.tabs.setTabsClosable(len(tabs) > 1)
+        finally:
+            self._updating = False
+    
+    def _on_current_changed(self, index: int) -> None:
+        """Report a tab picked by the user.
+        
+        Args:
+            index: Tab index
+        """
+        if not self._updating and 0 <= index < len(self._tab_ids):
+            self.tab_selected.emit(self._tab_ids[index])
+    
+    def _on_close_requested(self, index: int) -> None:
+        """Report a tab close button click.
+        
+        Args:
+            index: Tab index
+        """
+        if 0 <= index < len(self._tab_ids):
+            self.tab_close_requested.emit(self._tab_ids[index])
@@ -6,10 +6,8 @@ from PySide6 import QtCore, QtGui
 from PySide6.QtWidgets import QApplication, QStyle
 from PySide6.QtGui import QPalette, QIcon
 
-from ..constants import (
-    BUTTON_SIZE_PX,
-    BUTTON_PADDING_PX,
-)
+from ..constants import ICON_SIZE_PX
+from .icon_cache import shared_icon_cache
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +35,18 @@ LIGHT_THEME = {
 }
 
 
+# Qt style icons used when the system icon theme has none (recolored to the palette)
+STYLE_ICONS = {
+    'go-previous': QStyle.SP_ArrowLeft,
+    'go-next': QStyle.SP_ArrowRight,
+    'view-fullscreen': QStyle.SP_TitleBarNormalButton,
+    'view-restore': QStyle.SP_TitleBarNormalButton,
+    'window-close': QStyle.SP_TitleBarCloseButton,
+    'camera-photo': QStyle.SP_FileDialogDetailedView,
+    'settings': QStyle.SP_ComputerIcon
+}
+
+
 class ThemeManager:
     """Manages theme detection and styling for the application."""
     
@@ -46,7 +56,7 @@ class ThemeManager:
         
         Args:
             theme_preference: User's theme preference ("system", "light", or "dark")
-        
+            
         Returns:
             Dict[str, str]: Color palette for the selected/detected theme
         """
@@ -82,44 +92,6 @@ class ThemeManager:
         logger.info(f"Detected {'dark' if is_dark else 'light'} theme (system)")
         return theme
     
-    @staticmethod
-    def create_control_bar_stylesheet(colors: Dict[str, str]) -> str:
-        """Create stylesheet for control bar based on theme colors.
-        
-        Args:
-            colors: Color palette dictionary
-            
-        Returns:
-            str: CSS stylesheet
-        """
-        return f"""
-            QFrame {{
-                background-color: {colors['panel']};
-                border-top: 1px solid {colors['border']};
-            }}
-            QPushButton {{
-                background-color: transparent;
-                border: none;
-                border-radius: 4px;
-                padding: {BUTTON_PADDING_PX}px;
-                min-width: {BUTTON_SIZE_PX - 4}px;
-                min-height: {BUTTON_SIZE_PX - 4}px;
-                max-width: {BUTTON_SIZE_PX}px;
-                max-height: {BUTTON_SIZE_PX}px;
-                outline: none;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['hover']};
-            }}
-            QPushButton:pressed {{
-                background-color: {colors['pressed']};
-            }}
-            QPushButton:focus {{
-                outline: none;
-                border: none;
-            }}
-        """
-    
     @staticmethod
     def recolor_pixmap(pixmap: QtGui.QPixmap, color: str) -> QtGui.QPixmap:
         """Recolor a pixmap to the specified color.
@@ -133,6 +105,7 @@ class ThemeManager:
         """
         try:
             result = QtGui.QPixmap(pixmap.size())
+            result.setDevicePixelRatio(pixmap.devicePixelRatio())
             result.fill(QtCore.Qt.transparent)
             
             painter = QtGui.QPainter(result)
@@ -149,7 +122,7 @@ class ThemeManager:
     
     @staticmethod
     def create_geometric_icon(icon_type: str, colors: Dict[str, str]) -> QIcon:
-        """Create a simple geometric icon.
+        """Create a simple geometric icon (cached, see icon_cache.py).
         
         Args:
             icon_type: Type of icon to create
@@ -158,7 +131,25 @@ class ThemeManager:
         Returns:
             QIcon: Created icon
         """
-        pixmap = QtGui.QPixmap(20, 20)
+        return shared_icon_cache().get(
+            f"geometric-{icon_type}", colors,
+            lambda ratio: ThemeManager.render_geometric_pixmap(icon_type, colors, ratio))
+    
+    @staticmethod
+    def render_geometric_pixmap(icon_type: str, colors: Dict[str, str], ratio: float = 1.0) -> QtGui.QPixmap:
+        """Draw a simple geometric icon.
+        
+        Args:
+            icon_type: Type of icon to draw
+            colors: Color palette
+            ratio: Device pixel ratio to draw for
+            
+        Returns:
+            QtGui.QPixmap: ICON_SIZE_PX square pixmap (in device-independent pixels)
+        """
+        size = round(ICON_SIZE_PX * ratio)
+        pixmap = QtGui.QPixmap(size, size)
+        pixmap.setDevicePixelRatio(ratio)
         pixmap.fill(QtCore.Qt.transparent)
         
         painter = QtGui.QPainter(pixmap)
@@ -169,7 +160,7 @@ class ThemeManager:
         painter.setPen(pen)
         painter.setBrush(QtGui.QColor(colors['fg']))
         
-        center_x, center_y = 10, 10
+        center_x, center_y = ICON_SIZE_PX // 2, ICON_SIZE_PX // 2
         
         if icon_type == 'left':
             painter.drawPolygon([
@@ -195,6 +186,14 @@ class ThemeManager:
             painter.drawEllipse(center_x - 5, center_y - 3, 10, 7)
             painter.drawRect(center_x - 2, center_y + 2, 4, 2)
             painter.drawEllipse(center_x - 2, center_y - 2, 5, 4)
+        elif icon_type == 'new_chat':
+            painter.drawLine(center_x, center_y - 5, center_x, center_y + 5)
+            painter.drawLine(center_x - 5, center_y, center_x + 5, center_y)
+        elif icon_type == 'sidebar':
+            painter.setBrush(QtCore.Qt.NoBrush)
+            painter.drawRect(center_x - 7, center_y - 6, 14, 12)
+            painter.setBrush(QtGui.QColor(colors['fg']))
+            painter.drawRect(center_x - 7, center_y - 6, 5, 12)
         elif icon_type == 'settings':
             painter.drawEllipse(center_x - 4, center_y - 4, 8, 8)
             painter.drawEllipse(center_x - 2, center_y - 2, 4, 4)
@@ -204,7 +203,28 @@ class ThemeManager:
             painter.drawRect(center_x + 4, center_y - 1, 3, 2)
         
         painter.end()
-        return QIcon(pixmap)
+        return pixmap
+    
+    @staticmethod
+    def render_style_pixmap(theme_name: str, colors: Dict[str, str], ratio: float = 1.0) -> QtGui.QPixmap:
+        """Draw a Qt style icon recolored to the palette.
+        
+        Args:
+            theme_name: Icon theme name (a key of STYLE_ICONS)
+            colors: Color palette
+            ratio: Device pixel ratio to draw for
+            
+        Returns:
+            QtGui.QPixmap: Recolored pixmap at the style's icon size, or a geometric
+                icon if the style has none
+        """
+        style = QApplication.style()
+        standard = STYLE_ICONS[theme_name]
+        size = style.standardPixmap(standard).deviceIndependentSize().toSize()
+        pixmap = style.standardIcon(standard).pixmap(size, ratio)
+        if pixmap.isNull():
+            return ThemeManager.render_geometric_pixmap(theme_name, colors, ratio)
+        return ThemeManager.recolor_pixmap(pixmap, colors['fg'])
     
     @staticmethod
     def create_icon(theme_name: str, colors: Dict[str, str]) -> QIcon:
@@ -217,27 +237,16 @@ class ThemeManager:
         Returns:
             QIcon: Created icon
         """
-        # Try system theme first
+        # Try system theme first (scalable, so not cached)
         icon = QIcon.fromTheme(theme_name)
         if not icon.isNull():
             return icon
         
-        # Try built-in Qt icons
-        builtin_icons = {
-            'go-previous': QStyle.SP_ArrowLeft,
-            'go-next': QStyle.SP_ArrowRight,
-            'view-fullscreen': QStyle.SP_TitleBarNormalButton,
-            'view-restore': QStyle.SP_TitleBarNormalButton,
-            'window-close': QStyle.SP_TitleBarCloseButton,
-            'camera-photo': QStyle.SP_FileDialogDetailedView,
-            'settings': QStyle.SP_ComputerIcon
-        }
-        
-        if theme_name in builtin_icons:
-            pixmap = QApplication.style().standardPixmap(builtin_icons[theme_name])
-            if not pixmap.isNull():
-                colored_pixmap = ThemeManager.recolor_pixmap(pixmap, colors['fg'])
-                return QIcon(colored_pixmap)
+        # Try built-in Qt icons (cached, see icon_cache.py)
+        if theme_name in STYLE_ICONS:
+            return shared_icon_cache().get(
+                f"style-{theme_name}", colors,
+                lambda ratio: ThemeManager.render_style_pixmap(theme_name, colors, ratio))
         
         # Fallback to geometric icons
         return ThemeManager.create_geometric_icon(theme_name, colors)
@@ -259,6 +268,7 @@ class ThemeManager:
             'undock': ThemeManager.create_icon('view-restore', colors),
             'exit': ThemeManager.create_icon('window-close', colors),
             'camera': ThemeManager.create_icon('camera-photo', colors),
+            'new_chat': ThemeManager.create_geometric_icon('new_chat', colors),
             'settings': ThemeManager.create_geometric_icon('settings', colors)
         }
 
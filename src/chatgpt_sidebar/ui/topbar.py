@@ -18,6 +18,7 @@ class TopBar(QFrame):
     """Top control bar with navigation and action buttons.
     
     Provides a horizontal bar with control buttons for:
+    - New chat
     - Screenshot capture
     - Settings panel
     - Side toggle (left/right)
@@ -26,6 +27,7 @@ class TopBar(QFrame):
     """
     
     # Signals
+    new_chat_clicked = Signal()
     screenshot_clicked = Signal()
     settings_clicked = Signal()
     toggle_side_clicked = Signal()
@@ -46,7 +48,7 @@ class TopBar(QFrame):
         # Configure frame
         self.setFrameShape(QFrame.NoFrame)
         self.setFixedHeight(TOPBAR_HEIGHT_PX)
-        self.setStyleSheet(ThemeManager.create_control_bar_stylesheet(colors))
+        self.setObjectName("controlBar")  # Styled by the application stylesheet
         
         # Create layout
         layout = QHBoxLayout(self)
@@ -54,6 +56,7 @@ class TopBar(QFrame):
         layout.setSpacing(BUTTON_SPACING_PX)
         
         # Create buttons
+        self.btn_new_chat = QPushButton()
         self.btn_screenshot = QPushButton()
         self.btn_settings = QPushButton()
         self.btn_toggle_side = QPushButton()
@@ -64,6 +67,7 @@ class TopBar(QFrame):
         self._update_icons()
         
         # Connect signals
+        self.btn_new_chat.clicked.connect(self.new_chat_clicked.emit)
         self.btn_screenshot.clicked.connect(self.screenshot_clicked.emit)
         self.btn_settings.clicked.connect(self.settings_clicked.emit)
         self.btn_toggle_side.clicked.connect(self.toggle_side_clicked.emit)
@@ -71,6 +75,7 @@ class TopBar(QFrame):
         self.btn_exit.clicked.connect(self.exit_clicked.emit)
         
         # Add buttons to layout
+        layout.addWidget(self.btn_new_chat)
         layout.addWidget(self.btn_screenshot)
         layout.addWidget(self.btn_settings)
         layout.addStretch()
@@ -80,6 +85,11 @@ class TopBar(QFrame):
     
     def _update_icons(self) -> None:
         """Update button icons and tooltips."""
+        # New chat button
+        self.btn_new_chat.setIcon(self.icons['new_chat'])
+        self.btn_new_chat.setToolTip("New chat")
+        self.btn_new_chat.setAccessibleName("New chat")
+        
         # Screenshot button
         self.btn_screenshot.setIcon(self.icons['camera'])
         self.btn_screenshot.setToolTip("Attach a screenshot to the current chat")
@@ -94,6 +104,19 @@ class TopBar(QFrame):
         self.btn_exit.setIcon(self.icons['exit'])
         self.btn_exit.setToolTip("Exit")
     
+    def set_theme(self, colors: Dict[str, str]) -> None:
+        """Switch the button icons to another palette.
+        
+        The side and dock buttons keep their old icons until
+        update_side_button() and update_dock_button() are called.
+        
+        Args:
+            colors: Theme color palette
+        """
+        self.colors = colors
+        self.icons = ThemeManager.get_control_icons(colors)
+        self._update_icons()
+    
     def update_side_button(self, edge: str) -> None:
         """Update the side toggle button based on current edge.
         
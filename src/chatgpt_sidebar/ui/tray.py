@@ -0,0 +1,62 @@
+"""System tray icon for resident mode."""
+
+from typing import Dict, Optional
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QMenu, QSystemTrayIcon
+
+from .theme import ThemeManager
+
+
+class TrayIcon(QSystemTrayIcon):
+    """Tray icon that shows/hides the sidebar and offers a real exit."""
+    
+    # Emitted on a left click or "Show / Hide"
+    toggle_requested = Signal()
+    
+    # Emitted by "Quit"
+    quit_requested = Signal()
+    
+    def __init__(self, colors: Dict[str, str], title: str, parent: Optional[QObject] = None) -> None:
+        """Initialize the tray icon (hidden until show()).
+        
+        Args:
+            colors: Theme color palette
+            title: Tooltip text
+            parent: Parent object
+        """
+        super().__init__(ThemeManager.create_geometric_icon('sidebar', colors), parent)
+        self.setToolTip(title)
+        
+        self._menu = QMenu()
+        self._menu.addAction("Show / Hide", self.toggle_requested.emit)
+        self._menu.addSeparator()
+        self._menu.addAction("Quit", self.quit_requested.emit)
+        self.setContextMenu(self._menu)
+        
+        self.activated.connect(self._on_activated)
+    
+    def set_theme(self, colors: Dict[str, str]) -> None:
+        """Redraw the icon in another palette.
+        
+        Args:
+            colors: Theme color palette
+        """
+        self.setIcon(ThemeManager.create_geometric_icon('sidebar', colors))
+    
+    def set_hotkey_hint(self, sequence: str) -> None:
+        """Mention the global hotkey in the tooltip.
+        
+        Args:
+            sequence: Registered hotkey (empty if none)
+        """
+        title = self.toolTip().split("\n")[0]
+        self.setToolTip(f"{title}\n{sequence}" if sequence else title)
+    
+    def _on_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
+        """Toggle the sidebar on a left click.
+        
+        Args:
+            reason: Activation reason
+        """
+        if reason == QSystemTrayIcon.Trigger:
+            self.toggle_requested.emit()
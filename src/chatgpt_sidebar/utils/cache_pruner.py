@@ -0,0 +1,86 @@
+"""Pruning of the app's own cache directory.
+
+``prune_cache()`` is a generator meant to run as an idle task: it examines
+``CACHE_SCAN_BATCH`` directory entries or deletes that many files per step,
+so a large cache never blocks the GUI thread for long. Files that haven't
+been modified for ``CACHE_MAX_AGE_DAYS`` are deleted first; if the rest is
+still larger than ``CACHE_MAX_MB``, the oldest files go until it fits.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+from .logging import get_logger
+from ..constants import CACHE_MAX_AGE_DAYS, CACHE_MAX_MB, CACHE_SCAN_BATCH
+
+
+logger = get_logger(__name__)
+
+
+def _remove(path: str) -> bool:
+    """Delete a file, ignoring files that are in use or already gone.
+    
+    Args:
+        path: File to delete
+        
+    Returns:
+        bool: True if the file was deleted
+    """
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
+
+
+def prune_cache(directory: Path, max_mb: int = CACHE_MAX_MB, max_age_days: int = CACHE_MAX_AGE_DAYS) -> Iterator[None]:
+    """Delete expired files and the oldest files beyond a size budget.
+    
+    Args:
+        directory: Cache directory (searched recursively)
+        max_mb: Size budget of the directory
+        max_age_days: Age (since last modification) after which files are deleted
+        
+    Yields:
+        None: After every batch of examined entries or deleted files
+    """
+    cutoff = time.time() - max_age_days * 24 * 3600
+    kept: List[Tuple[float, int, str]] = []
+    removed = 0
+    freed = 0
+    examined = 0
+    
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_mtime < cutoff and _remove(path):
+                removed += 1
+                freed += stat.st_size
+            else:
+                kept.append((stat.st_mtime, stat.st_size, path))
+            examined += 1
+            if examined % CACHE_SCAN_BATCH == 0:
+                yield
+    
+    # Oldest first until the rest fits the budget
+    total = sum(size for _, size, _ in kept)
+    budget = max_mb * 1024 * 1024
+    kept.sort()
+    for mtime, size, path in kept:
+        if total <= budget:
+            break
+        if _remove(path):
+            removed += 1
+            freed += size
+            total -= size
+            if removed % CACHE_SCAN_BATCH == 0:
+                yield
+    
+    logger.info(f"Cache pruned: {removed} of {examined} files deleted ({freed // 1024} KB), "
+                f"{total // 1024} KB kept in {directory}")
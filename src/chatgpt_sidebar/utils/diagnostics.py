@@ -0,0 +1,53 @@
+"""Registry of diagnostic providers.
+
+Components register a function that returns a JSON-serializable snapshot
+of their state; ``collect()`` calls every provider and combines the
+results under their names. Used by the ``diagnostics`` IPC command and
+the diagnostics view, which can also export the snapshot as JSON.
+"""
+
+import json
+import time
+from typing import Any, Callable, Dict
+
+
+_providers: Dict[str, Callable[[], Any]] = {}
+
+
+def register(name: str, provider: Callable[[], Any]) -> None:
+    """Register (or replace) a diagnostics provider.
+    
+    Args:
+        name: Section name in the collected snapshot
+        provider: Returns the section's JSON-serializable content
+    """
+    _providers[name] = provider
+
+
+def collect() -> Dict[str, Any]:
+    """Collect a snapshot from every provider.
+    
+    Returns:
+        Dict[str, Any]: Sections by name (a failing provider reports its error instead)
+    """
+    snapshot = {}
+    for name, provider in _providers.items():
+        try:
+            snapshot[name] = provider()
+        except Exception as e:
+            snapshot[name] = {"error": str(e)}
+    return snapshot
+
+
+def export(path: str) -> None:
+    """Write a timestamped snapshot to a JSON file.
+    
+    Args:
+        path: Output file
+        
+    Raises:
+        OSError: If the file can't be written
+    """
+    snapshot = {"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), **collect()}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, indent=2, default=str)
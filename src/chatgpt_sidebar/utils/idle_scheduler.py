@@ -0,0 +1,186 @@
+"""Cooperative idle-time task scheduler.
+
+Deferred work (prebuilding views, cache maintenance) is queued with a
+priority and run on the GUI thread in small slices while the app is idle.
+A task is a callable; if it returns a generator, every ``next()`` is one
+slice and the task is done when the generator is exhausted. Every
+``IDLE_TICK_MS`` the scheduler runs slices, highest priority first, until
+the tick's ``IDLE_BUDGET_MS`` is used up. A tick is skipped, and slicing
+stops early, while input or paint messages are waiting for the GUI thread
+(``GetQueueStatus`` on Windows) or a mouse button is held, so deferred
+work never delays a response to the user.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QGuiApplication
+
+from .logging import get_logger
+from ..constants import (
+    IDLE_TICK_MS,
+    IDLE_BUDGET_MS,
+    IDLE_HISTORY,
+    IDLE_PRIORITY_NORMAL,
+)
+
+
+logger = get_logger(__name__)
+
+
+class _Task:
+    """A queued task and its accounting."""
+    
+    __slots__ = ("name", "priority", "seq", "func", "steps", "slices", "run_ns", "queued_at")
+    
+    def __init__(self, name: str, priority: int, seq: int, func: Callable[[], Optional[Iterator]]) -> None:
+        self.name = name
+        self.priority = priority
+        self.seq = seq
+        self.func = func
+        self.steps: Optional[Iterator] = None
+        self.slices = 0
+        self.run_ns = 0
+        self.queued_at = time.monotonic()
+
+
+class IdleScheduler(QObject):
+    """Runs prioritized, time-sliced tasks when the GUI thread is idle."""
+    
+    def __init__(self, budget_ms: float = IDLE_BUDGET_MS, parent: Optional[QObject] = None) -> None:
+        """Initialize the scheduler (the timer only runs while tasks are queued).
+        
+        Args:
+            budget_ms: Task time per tick
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._budget_ms = budget_ms
+        self._tasks: List[_Task] = []
+        self._seq = 0
+        self._ticks = 0
+        self._busy_ticks = 0
+        self._completed: Deque[Dict[str, Any]] = deque(maxlen=IDLE_HISTORY)
+        
+        # Lazy import idle_win (Win32 only)
+        try:
+            from ..platform.idle_win import has_pending_input
+            self._has_pending_input: Optional[Callable[[], bool]] = has_pending_input
+        except (ImportError, AttributeError, OSError):
+            self._has_pending_input = None
+        
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+    
+    def schedule(self, name: str, func: Callable[[], Optional[Iterator]],
+                 priority: int = IDLE_PRIORITY_NORMAL) -> None:
+        """Queue a task (replacing a queued task of the same name).
+        
+        Args:
+            name: Task name (for diagnostics and cancel())
+            func: Work to run; may return a generator whose steps are run as separate slices
+            priority: IDLE_PRIORITY_HIGH, IDLE_PRIORITY_NORMAL or IDLE_PRIORITY_LOW
+        """
+        self.cancel(name)
+        self._seq += 1
+        self._tasks.append(_Task(name, priority, self._seq, func))
+        if not self._timer.isActive():
+            self._timer.start(IDLE_TICK_MS)
+    
+    def cancel(self, name: str) -> bool:
+        """Drop a queued task (a started generator is closed).
+        
+        Args:
+            name: Task name
+            
+        Returns:
+            bool: True if a task was dropped
+        """
+        for task in self._tasks:
+            if task.name == name:
+                self._tasks.remove(task)
+                if task.steps is not None:
+                    task.steps.close()
+                return True
+        return False
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Report queued and recently completed tasks.
+        
+        Returns:
+            Dict[str, Any]: Budget, tick counts, queued tasks and completed tasks (newest last)
+        """
+        return {
+            "budget_ms": self._budget_ms,
+            "ticks": self._ticks,
+            "busy_ticks": self._busy_ticks,
+            "queued": [
+                {"name": t.name, "priority": t.priority, "slices": t.slices, "run_ms": round(t.run_ns / 1e6, 1)}
+                for t in sorted(self._tasks, key=lambda t: (t.priority, t.seq))
+            ],
+            "completed": list(self._completed),
+        }
+    
+    def _is_busy(self) -> bool:
+        """Check whether the user is interacting with the app right now.
+        
+        Returns:
+            bool: True if input or paint messages are pending or a mouse button is held
+        """
+        if QGuiApplication.mouseButtons() != Qt.NoButton:
+            return True
+        return self._has_pending_input is not None and self._has_pending_input()
+    
+    def _tick(self) -> None:
+        """Run task slices until the tick's budget is used up."""
+        self._ticks += 1
+        if self._is_busy():
+            self._busy_ticks += 1
+            return
+        
+        deadline = time.perf_counter() + self._budget_ms / 1000
+        while self._tasks and time.perf_counter() < deadline:
+            task = min(self._tasks, key=lambda t: (t.priority, t.seq))
+            status = self._run_slice(task)
+            if status != "pending" and task in self._tasks:
+                self._tasks.remove(task)
+                self._completed.append({
+                    "name": task.name,
+                    "slices": task.slices,
+                    "run_ms": round(task.run_ns / 1e6, 1),
+                    "wait_ms": round((time.monotonic() - task.queued_at) * 1000),
+                    "failed": status == "failed",
+                })
+            # Let input that arrived during the slice go first
+            if self._is_busy():
+                break
+        
+        if not self._tasks:
+            self._timer.stop()
+    
+    def _run_slice(self, task: _Task) -> str:
+        """Run one slice of a task.
+        
+        Args:
+            task: Task to advance
+            
+        Returns:
+            str: "pending" while the task has more slices, "done" or "failed"
+        """
+        start = time.perf_counter_ns()
+        try:
+            if task.steps is None:
+                task.steps = task.func()
+                if task.steps is None:
+                    return "done"
+            next(task.steps)
+            return "pending"
+        except StopIteration:
+            return "done"
+        except Exception as e:
+            logger.error(f"Idle task {task.name} failed: {e}")
+            return "failed"
+        finally:
+            task.slices += 1
+            task.run_ns += time.perf_counter_ns() - start
@@ -0,0 +1,152 @@
+"""Background sampler of the app's process tree memory.
+
+A worker thread wakes up every ``MEMORY_SAMPLE_MS`` and reads working set
+and private bytes of the main process and every descendant (the
+``QtWebEngineProcess`` renderer, GPU and utility processes). Win32 calls
+are made from the thread so the GUI thread never waits on them. Each
+sample is emitted as ``sampled`` (delivered on the GUI thread) and folded
+into a compact rolling series of whole megabytes for diagnostics.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from PySide6.QtCore import QObject, Signal
+
+from .logging import get_logger
+from ..constants import MEMORY_SAMPLE_MS, MEMORY_HISTORY
+
+
+logger = get_logger(__name__)
+
+
+# Columns of a row in the rolling series
+SERIES_COLUMNS = ["t", "main_private_mb", "children_private_mb", "largest_child_private_mb", "total_working_set_mb"]
+
+_MB = 1024 * 1024
+
+
+class MemorySampler(QObject):
+    """Samples process tree memory on a worker thread."""
+    
+    # Emitted with each sample: {"t": ..., "processes": [{"pid", "parent", "name", "working_set", "private"}]}
+    sampled = Signal(dict)
+    
+    def __init__(self, interval_ms: int = MEMORY_SAMPLE_MS, parent: Optional[QObject] = None) -> None:
+        """Initialize the sampler (call start() to begin).
+        
+        Args:
+            interval_ms: Time between samples
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._interval_ms = interval_ms
+        self._series: Deque[Tuple[int, ...]] = deque(maxlen=MEMORY_HISTORY)
+        self._latest: Optional[Dict[str, Any]] = None
+        self._sample_ms = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> bool:
+        """Start the sampler thread.
+        
+        Returns:
+            bool: False if process memory can't be queried on this platform
+        """
+        # Lazy import memory_win (Win32 only)
+        try:
+            from ..platform import memory_win
+        except (ImportError, AttributeError, OSError):
+            logger.info("Process memory queries unavailable; memory sampler disabled")
+            return False
+        
+        if self._thread is not None:
+            return True
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(memory_win,), name="memory-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"Memory sampler started (every {self._interval_ms} ms)")
+        return True
+    
+    def stop(self) -> None:
+        """Stop the sampler thread."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=2)
+        self._thread = None
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Get the latest sample and the rolling series.
+        
+        Returns:
+            Dict[str, Any]: Latest per-process figures, peaks and the series as columns + rows
+        """
+        with self._lock:
+            rows = [list(row) for row in self._series]
+            latest = self._latest
+            sample_ms = self._sample_ms
+        return {
+            "interval_ms": self._interval_ms,
+            "sample_cost_ms": round(sample_ms, 2),
+            "latest": latest,
+            "peak_children_private_mb": max((row[2] for row in rows), default=None),
+            "series": {"columns": SERIES_COLUMNS, "rows": rows},
+        }
+    
+    def _run(self, memory_win) -> None:
+        """Sampling loop (worker thread).
+        
+        Args:
+            memory_win: Platform module with get_process_tree() and get_process_memory()
+        """
+        while True:
+            started = time.perf_counter()
+            try:
+                sample = self._sample(memory_win)
+            except Exception as e:
+                logger.warning(f"Memory sample failed: {e}")
+                sample = None
+            
+            if sample is not None:
+                processes = sample["processes"]
+                children = [p["private"] for p in processes[1:]]
+                row = (
+                    int(sample["t"]),
+                    processes[0]["private"] // _MB,
+                    sum(children) // _MB,
+                    max(children, default=0) // _MB,
+                    sum(p["working_set"] for p in processes) // _MB,
+                )
+                with self._lock:
+                    self._series.append(row)
+                    self._latest = sample
+                    self._sample_ms = (time.perf_counter() - started) * 1000
+                self.sampled.emit(sample)
+            
+            if self._stop.wait(self._interval_ms / 1000):
+                return
+    
+    def _sample(self, memory_win) -> Optional[Dict[str, Any]]:
+        """Read memory of the main process and its descendants.
+        
+        Args:
+            memory_win: Platform module with get_process_tree() and get_process_memory()
+            
+        Returns:
+            Optional[Dict[str, Any]]: Sample, or None if the main process couldn't be read
+        """
+        main_pid = os.getpid()
+        tree: List[Tuple[int, int, str]] = [(main_pid, 0, "main")] + memory_win.get_process_tree(main_pid)
+        processes = []
+        for pid, parent_pid, name in tree:
+            memory = memory_win.get_process_memory(pid)
+            if memory is None:
+                if pid == main_pid:
+                    return None
+                continue  # Exited since the snapshot
+            processes.append({"pid": pid, "parent": parent_pid, "name": name, **memory})
+        return {"t": time.time(), "processes": processes}
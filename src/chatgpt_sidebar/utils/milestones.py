@@ -0,0 +1,49 @@
+"""Startup milestone reporting for the benchmark harness.
+
+When the ``CHATGPT_SIDEBAR_MILESTONES`` environment variable names a file,
+each milestone is appended to it as a JSON line with a wall-clock timestamp
+in nanoseconds. The harness in ``tools/benchmark_startup.py`` compares those
+timestamps with the moment it launched the process. Without the variable,
+``mark()`` returns immediately.
+"""
+
+import json
+import os
+import time
+from typing import Optional, Set
+
+from . import tracing
+
+
+MILESTONES_ENV = "CHATGPT_SIDEBAR_MILESTONES"
+
+_milestones_path: Optional[str] = os.environ.get(MILESTONES_ENV) or None
+_reported: Set[str] = set()
+
+
+def enabled() -> bool:
+    """Check whether milestone reporting is active.
+    
+    Returns:
+        bool: True if milestones are being recorded
+    """
+    return _milestones_path is not None
+
+
+def mark(name: str) -> None:
+    """Record a milestone the first time it is reached.
+    
+    Args:
+        name: Milestone name (e.g. "qapplication", "load_finished")
+    """
+    tracing.instant(name)
+    if _milestones_path is None or name in _reported:
+        return
+    _reported.add(name)
+    
+    record = {"name": name, "t_ns": time.time_ns(), "pid": os.getpid()}
+    try:
+        with open(_milestones_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError:
+        pass  # Never let benchmarking break the app
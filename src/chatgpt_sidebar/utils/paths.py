@@ -5,14 +5,25 @@ import pathlib
 from typing import Optional
 
 
+def get_app_data_path() -> pathlib.Path:
+    """Get the path to the application's local data directory.
+    
+    Returns:
+        pathlib.Path: Path to the application data directory
+    """
+    appdata = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
+    app_dir = pathlib.Path(appdata) / "ChatGPTSidebar"
+    app_dir.mkdir(parents=True, exist_ok=True)
+    return app_dir
+
+
 def get_profile_path() -> pathlib.Path:
     """Get the path to the user profile directory.
     
     Returns:
         pathlib.Path: Path to the profile directory
     """
-    appdata = os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
-    profile_dir = pathlib.Path(appdata) / "ChatGPTSidebar" / "Profile"
+    profile_dir = get_app_data_path() / "Profile"
     profile_dir.mkdir(parents=True, exist_ok=True)
     return profile_dir
 
@@ -40,3 +51,22 @@ def get_storage_path() -> pathlib.Path:
     storage_dir.mkdir(parents=True, exist_ok=True)
     return storage_dir
 
+
+def get_app_cache_path() -> pathlib.Path:
+    """Get the path to the directory of the app's own caches (pruned when idle).
+    
+    Returns:
+        pathlib.Path: Path to the app cache directory
+    """
+    cache_dir = get_app_data_path() / "Cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_snapshot_path() -> pathlib.Path:
+    """Get the path of the last-session snapshot image.
+    
+    Returns:
+        pathlib.Path: Path to the snapshot file (may not exist yet)
+    """
+    return get_app_data_path() / "last_session.jpg"
@@ -0,0 +1,131 @@
+"""Combined page and Qt performance monitor.
+
+Page-side figures (long tasks, JS heap, event-loop delay) arrive as
+periodic reports from the script built by ``build_perf_monitor_js``. The
+Qt side is measured here with the same kind of probe: a precise timer that
+records how late it fires on the GUI thread. Comparing the two tells
+whether jank comes from the page's main thread or from our own.
+"""
+
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from PySide6.QtCore import QObject, Qt, QTimer
+
+from .logging import get_logger
+from .stats import summarize_latencies
+from ..constants import (
+    PERF_LAG_SAMPLE_MS,
+    PERF_HISTORY,
+    PERF_QT_SAMPLES,
+    PERF_STALL_MS,
+)
+
+
+logger = get_logger(__name__)
+
+
+class PerfMonitor(QObject):
+    """Collects page performance reports and measures Qt event-loop delay."""
+    
+    def __init__(self, engine: Any, parent: Optional[QObject] = None) -> None:
+        """Initialize the monitor (stopped until set_interval()).
+        
+        Args:
+            engine: Web engine relaying the page's perf_report signal
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._engine = engine
+        self._report_ms = 0
+        self._reports: Deque[Dict[str, Any]] = deque(maxlen=PERF_HISTORY)
+        self._qt_lags: Deque[float] = deque(maxlen=PERF_QT_SAMPLES)
+        self._qt_stalls = 0
+        self._qt_busy_s = 0.0
+        self._started = 0.0
+        self._expected = 0.0
+        
+        self._probe = QTimer(self)
+        self._probe.setTimerType(Qt.PreciseTimer)
+        self._probe.timeout.connect(self._on_probe)
+        engine.perf_report.connect(self._on_page_report)
+    
+    def set_interval(self, report_ms: int) -> None:
+        """Start, stop or retime monitoring.
+        
+        Args:
+            report_ms: Interval between page reports (0 stops both the page and Qt probes)
+        """
+        self._report_ms = max(0, report_ms)
+        self._engine.set_perf_monitor(self._report_ms)
+        if self._report_ms:
+            self._started = time.perf_counter()
+            self._expected = self._started + PERF_LAG_SAMPLE_MS / 1000
+            self._probe.start(PERF_LAG_SAMPLE_MS)
+            logger.info(f"Performance monitor: page reports every {self._report_ms} ms")
+        else:
+            self._probe.stop()
+            logger.info("Performance monitor stopped")
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Combine recent page reports and Qt event-loop delay.
+        
+        Returns:
+            Dict[str, Any]: Settings, page aggregates over the kept reports,
+                the latest and all kept page reports, and Qt-side figures
+        """
+        reports = list(self._reports)
+        page = None
+        if reports:
+            window_ms = sum(r.get("window_ms") or 0 for r in reports)
+            lag_p95 = [r["lag_p95_ms"] for r in reports if r.get("lag_p95_ms") is not None]
+            heap = [r["heap_used"] for r in reports if r.get("heap_used") is not None]
+            page = {
+                "reports": len(reports),
+                "window_s": round(window_ms / 1000, 1),
+                "long_tasks": sum(r.get("long_tasks") or 0 for r in reports),
+                "long_task_ms": round(sum(r.get("long_task_ms") or 0 for r in reports), 1),
+                "long_task_max_ms": max(r.get("long_task_max_ms") or 0 for r in reports),
+                "lag_p95_ms_worst": max(lag_p95) if lag_p95 else None,
+                "lag_max_ms": max((r.get("lag_max_ms") or 0 for r in reports), default=None),
+                "heap_used": heap[-1] if heap else None,
+                "heap_used_peak": max(heap) if heap else None,
+                "heap_limit": reports[-1].get("heap_limit"),
+                "overhead_pct": round(sum(r.get("overhead_pct") or 0 for r in reports) / len(reports), 3),
+            }
+        
+        elapsed_s = time.perf_counter() - self._started if self._report_ms else 0
+        return {
+            "report_ms": self._report_ms,
+            "sample_ms": PERF_LAG_SAMPLE_MS,
+            "page": page,
+            "page_latest": reports[-1] if reports else None,
+            "page_history": reports,
+            "qt": {
+                "event_loop_lag_ms": summarize_latencies(self._qt_lags),
+                "stalls": self._qt_stalls,
+                "stall_threshold_ms": PERF_STALL_MS,
+                "overhead_pct": round(self._qt_busy_s / elapsed_s * 100, 3) if elapsed_s else 0,
+            },
+        }
+    
+    def _on_page_report(self, report: Dict[str, Any]) -> None:
+        """Keep a page report.
+        
+        Args:
+            report: Report from the page's monitor
+        """
+        report["received"] = round(time.time(), 3)
+        self._reports.append(report)
+        if (report.get("long_task_max_ms") or 0) > 500:
+            logger.info(f"Page long task of {report['long_task_max_ms']} ms")
+    
+    def _on_probe(self) -> None:
+        """Record how late the probe timer fired."""
+        now = time.perf_counter()
+        lag_ms = max(0.0, (now - self._expected) * 1000)
+        self._qt_lags.append(lag_ms)
+        if lag_ms > PERF_STALL_MS:
+            self._qt_stalls += 1
+        self._expected = now + PERF_LAG_SAMPLE_MS / 1000
+        self._qt_busy_s += time.perf_counter() - now
@@ -0,0 +1,165 @@
+"""GUI thread stall detector.
+
+A timer on the GUI thread records a heartbeat every ``STALL_HEARTBEAT_MS``.
+A watchdog thread checks the heartbeat; once it is older than
+``STALL_THRESHOLD_MS`` the GUI thread's Python stack is captured with
+``sys._current_frames()`` (the watchdog only needs the GIL, which a
+blocked Qt call releases and a busy Python loop hands over every few ms).
+When the heartbeat resumes, the stall's duration is recorded with its
+stack. Identical stacks are merged, and both the stall events and the
+distinct stacks are kept in bounded buffers for the ``stalls``
+diagnostics section.
+"""
+
+import sys
+import threading
+import time
+import traceback
+import zlib
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, List, Optional
+from PySide6.QtCore import QObject, Qt, QTimer
+
+from .logging import get_logger
+from ..constants import (
+    STALL_HEARTBEAT_MS,
+    STALL_THRESHOLD_MS,
+    STALL_HISTORY,
+    STALL_MAX_STACKS,
+)
+
+
+logger = get_logger(__name__)
+
+
+def _format_stack(frame) -> List[str]:
+    """Format a stack as "module.py:line function" entries, innermost last.
+    
+    Args:
+        frame: Innermost frame
+        
+    Returns:
+        List[str]: Stack entries
+    """
+    entries = []
+    for summary in traceback.extract_stack(frame):
+        path = summary.filename.replace("\\", "/")
+        # Keep package-relative paths short; other files by name
+        marker = path.rfind("/chatgpt_sidebar/")
+        path = path[marker + 1:] if marker >= 0 else path.rsplit("/", 1)[-1]
+        entries.append(f"{path}:{summary.lineno} {summary.name}")
+    return entries
+
+
+class StallDetector(QObject):
+    """Watches a GUI thread heartbeat and captures the stack of long stalls."""
+    
+    def __init__(self, threshold_ms: int = STALL_THRESHOLD_MS, parent: Optional[QObject] = None) -> None:
+        """Initialize the detector (must be created on the GUI thread; call start() to begin).
+        
+        Args:
+            threshold_ms: Heartbeat age that counts as a stall
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._threshold_ms = threshold_ms
+        self._gui_thread_id = threading.get_ident()
+        self._beat = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=STALL_HISTORY)
+        self._stacks: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._stalls = 0
+        self._stalled_ms = 0.0
+        
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setTimerType(Qt.PreciseTimer)
+        self._heartbeat.timeout.connect(self._on_heartbeat)
+    
+    def start(self) -> None:
+        """Start the heartbeat and the watchdog thread."""
+        if self._thread is not None:
+            return
+        self._beat = time.monotonic()
+        self._heartbeat.start(STALL_HEARTBEAT_MS)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stall-detector", daemon=True)
+        self._thread.start()
+        logger.info(f"Stall detector started (threshold {self._threshold_ms} ms)")
+    
+    def stop(self) -> None:
+        """Stop the heartbeat and the watchdog thread."""
+        if self._thread is None:
+            return
+        self._heartbeat.stop()
+        self._stop.set()
+        self._thread.join(timeout=2)
+        self._thread = None
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Report stall counts, recent stalls and their distinct stacks.
+        
+        Returns:
+            Dict[str, Any]: Totals, recent stall events (newest last) and stacks by id,
+                most recently seen last
+        """
+        with self._lock:
+            return {
+                "threshold_ms": self._threshold_ms,
+                "heartbeat_ms": STALL_HEARTBEAT_MS,
+                "stalls": self._stalls,
+                "stalled_ms": round(self._stalled_ms),
+                "recent": list(self._events),
+                "stacks": {stack_id: dict(entry) for stack_id, entry in self._stacks.items()},
+            }
+    
+    def _on_heartbeat(self) -> None:
+        """Record that the GUI thread is processing events."""
+        self._beat = time.monotonic()
+    
+    def _run(self) -> None:
+        """Watchdog loop (worker thread)."""
+        stall_beat = None
+        stack: List[str] = []
+        while not self._stop.wait(STALL_HEARTBEAT_MS / 1000):
+            beat = self._beat
+            if stall_beat is not None and beat != stall_beat:
+                # Heartbeat resumed; the gap minus one timer interval was the stall
+                self._record(max(0.0, (beat - stall_beat) * 1000 - STALL_HEARTBEAT_MS), stack)
+                stall_beat = None
+            
+            if stall_beat is None and (time.monotonic() - beat) * 1000 > self._threshold_ms:
+                frame = sys._current_frames().get(self._gui_thread_id)
+                stack = _format_stack(frame) if frame is not None else []
+                del frame
+                stall_beat = beat
+    
+    def _record(self, duration_ms: float, stack: List[str]) -> None:
+        """Add a finished stall to the buffers.
+        
+        Args:
+            duration_ms: Stall duration
+            stack: GUI thread stack captured during the stall
+        """
+        stack_id = f"{zlib.crc32(repr(stack).encode()):08x}"
+        with self._lock:
+            self._stalls += 1
+            self._stalled_ms += duration_ms
+            self._events.append({"t": round(time.time(), 3), "duration_ms": round(duration_ms), "stack": stack_id})
+            
+            entry = self._stacks.pop(stack_id, None)
+            first_seen = entry is None
+            if first_seen:
+                entry = {"count": 0, "total_ms": 0, "max_ms": 0, "stack": stack}
+            entry["count"] += 1
+            entry["total_ms"] += round(duration_ms)
+            entry["max_ms"] = max(entry["max_ms"], round(duration_ms))
+            self._stacks[stack_id] = entry
+            while len(self._stacks) > STALL_MAX_STACKS:
+                self._stacks.popitem(last=False)
+        
+        where = stack[-1] if stack else "unknown"
+        logger.warning(f"GUI thread stalled for {duration_ms:.0f} ms in {where} (stack {stack_id})")
+        if first_seen and stack:
+            logger.debug("Stall stack:\n  " + "\n  ".join(stack))
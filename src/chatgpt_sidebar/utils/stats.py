@@ -0,0 +1,23 @@
+"""Small statistics helpers for in-app metrics."""
+
+from typing import Dict, Iterable, Optional
+
+
+def summarize_latencies(samples: Iterable[float]) -> Optional[Dict[str, float]]:
+    """Summarize latency samples.
+    
+    Args:
+        samples: Latencies in ms
+        
+    Returns:
+        Optional[Dict[str, float]]: Mean, p50, p95 and max, or None without samples
+    """
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    return {
+        "mean": round(sum(ordered) / len(ordered), 2),
+        "p50": round(ordered[len(ordered) // 2], 2),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max": round(ordered[-1], 2),
+    }
@@ -0,0 +1,165 @@
+"""Startup and handler tracing in Chrome Trace Event format.
+
+Enabled with ``--trace-startup``. ``span()`` records a begin/end pair
+around a block, ``traced()`` around a function and ``instant()`` a single
+point in time (milestones). ``write()`` saves everything recorded so far
+as JSON that chrome://tracing and Perfetto open directly.
+
+While tracing is off, ``span()`` returns a shared no-op object, ``instant()``
+returns at once and ``traced()`` leaves the function undecorated, so
+instrumented code pays no formatting or allocation. ``enable()`` must run
+before the instrumented modules are imported for ``traced()`` to apply.
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+
+
+_events: Optional[List[Dict[str, Any]]] = None
+_path: Optional[str] = None
+_pid = os.getpid()
+_thread_names: Dict[int, str] = {}
+
+
+def _now_us() -> float:
+    """Get a monotonic timestamp in microseconds."""
+    return time.perf_counter_ns() / 1000
+
+
+def _tid() -> int:
+    """Get the current thread's id, remembering its name for the trace metadata."""
+    tid = threading.get_ident()
+    if tid not in _thread_names:
+        _thread_names[tid] = threading.current_thread().name
+    return tid
+
+
+class _Span:
+    """Records a begin event on enter and the matching end event on exit."""
+    
+    __slots__ = ("name", "cat")
+    
+    def __init__(self, name: str, cat: str) -> None:
+        self.name = name
+        self.cat = cat
+    
+    def __enter__(self) -> "_Span":
+        _events.append({"name": self.name, "cat": self.cat, "ph": "B", "ts": _now_us(), "pid": _pid, "tid": _tid()})
+        return self
+    
+    def __exit__(self, *exc) -> bool:
+        if _events is not None:
+            _events.append({"name": self.name, "cat": self.cat, "ph": "E", "ts": _now_us(), "pid": _pid, "tid": _tid()})
+        return False
+
+
+class _NullSpan:
+    """Shared span used while tracing is off."""
+    
+    __slots__ = ()
+    
+    def __enter__(self) -> "_NullSpan":
+        return self
+    
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable(path: str) -> None:
+    """Start recording.
+    
+    Args:
+        path: File written by write()
+    """
+    global _events, _path
+    _events = []
+    _path = path
+
+
+def enabled() -> bool:
+    """Check whether tracing is active.
+    
+    Returns:
+        bool: True if events are being recorded
+    """
+    return _events is not None
+
+
+def span(name: str, cat: str = "startup"):
+    """Trace a block: ``with tracing.span("theme.icons"): ...``.
+    
+    Args:
+        name: Event name (pass a constant string so nothing is formatted while off)
+        cat: Event category
+        
+    Returns:
+        Context manager recording begin and end events (a no-op while off)
+    """
+    if _events is None:
+        return _NULL_SPAN
+    return _Span(name, cat)
+
+
+def traced(name: Optional[str] = None, cat: str = "handler") -> Callable[[Callable], Callable]:
+    """Decorator tracing every call of a function.
+    
+    Args:
+        name: Event name (defaults to the function's qualified name)
+        cat: Event category
+        
+    Returns:
+        Callable: Decorator (returns the function unchanged while tracing is off)
+    """
+    def decorator(func: Callable) -> Callable:
+        if _events is None:
+            return func
+        event_name = name or func.__qualname__
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with _Span(event_name, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instant(name: str, cat: str = "milestone") -> None:
+    """Record a point in time.
+    
+    Args:
+        name: Event name
+        cat: Event category
+    """
+    if _events is None:
+        return
+    _events.append({"name": name, "cat": cat, "ph": "i", "s": "p", "ts": _now_us(), "pid": _pid, "tid": _tid()})
+
+
+def write() -> Optional[str]:
+    """Save the events recorded so far (overwriting the previous file).
+    
+    Returns:
+        Optional[str]: Path written, or None if tracing is off or the file couldn't be written
+    """
+    if _events is None:
+        return None
+    
+    metadata = [{"name": "process_name", "ph": "M", "pid": _pid, "tid": 0, "args": {"name": "ChatGPT Sidebar"}}]
+    metadata += [
+        {"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": thread_name}}
+        for tid, thread_name in list(_thread_names.items())
+    ]
+    trace = {"traceEvents": metadata + list(_events), "displayTimeUnit": "ms"}
+    try:
+        with open(_path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+    except OSError:
+        return None  # Never let tracing break the app
+    return _path
@@ -0,0 +1,66 @@
+"""Python side of the QWebChannel bridge used by injected page scripts."""
+
+import json
+
+from PySide6.QtCore import QObject, Signal, Slot
+
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class PageBridge(QObject):
+    """Object exposed to injected scripts through QWebChannel.
+    
+    Slots are called from JavaScript; each one re-emits a Qt signal so the
+    rest of the application never deals with the channel directly.
+    """
+    
+    # Emitted with True when the composer is in the DOM, False when it is removed
+    composer_state_changed = Signal(bool)
+    
+    # Emitted with each assistant response event (see build_response_observer_js)
+    response_event = Signal(dict)
+    
+    # Emitted with each performance report (see build_perf_monitor_js)
+    perf_report = Signal(dict)
+    
+    @Slot(bool)
+    def composerStateChanged(self, present: bool) -> None:
+        """Receive composer presence updates from the page.
+        
+        Args:
+            present: Whether the composer element is currently in the DOM
+        """
+        self.composer_state_changed.emit(bool(present))
+    
+    @Slot(str)
+    def responseEvent(self, payload: str) -> None:
+        """Receive an assistant response event from the page.
+        
+        Args:
+            payload: JSON-encoded event object
+        """
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed response event from page")
+            return
+        if isinstance(event, dict):
+            self.response_event.emit(event)
+    
+    @Slot(str)
+    def perfReport(self, payload: str) -> None:
+        """Receive a performance report from the page.
+        
+        Args:
+            payload: JSON-encoded report object
+        """
+        try:
+            report = json.loads(payload)
+        except ValueError:
+            logger.warning("Ignoring malformed performance report from page")
+            return
+        if isinstance(report, dict):
+            self.perf_report.emit(report)
@@ -1,6 +1,6 @@
 """Web engine interface protocol."""
 
-from typing import Protocol, Callable, Optional, Any, Dict
+from typing import Protocol, Callable, Optional, Any, Dict, List
 
 
 class Engine(Protocol):
@@ -9,12 +9,110 @@ class Engine(Protocol):
     This protocol defines the interface that all web engine implementations
     must follow. It enables swapping different web engines (QtWebEngine,
     pywebview, etc.) without changing the rest of the application.
+    
+    Implementations also expose Qt signals: ``composer_ready`` when the chat
+    composer has rendered and the page accepts input, ``load_finished(bool)``
+    for every page load, ``recovery_started(str)`` before a crashed or
+    hung renderer's page is rebuilt, ``response_event(dict)`` for
+    assistant output observed in the page, ``perf_report(dict)`` for the
+    page's performance monitor, and ``tabs_changed`` when the set of chat
+    tabs or the active tab changes.
     """
     
+    composer_ready: Any
+    load_finished: Any
+    recovery_started: Any
+    response_event: Any
+    perf_report: Any
+    tabs_changed: Any
+    
     def __init__(self, parent=None, colors: Optional[Dict[str, str]] = None) -> None:
         """Initialize the engine with optional theme colors."""
         ...
     
+    def open_tab(self, url: Optional[str] = None) -> int:
+        """Open a tab and show it.
+        
+        Args:
+            url: URL to open (None opens the start URL)
+            
+        Returns:
+            int: New tab id
+        """
+        ...
+    
+    def activate_tab(self, tab_id: int) -> None:
+        """Show a tab, reloading it if it was discarded.
+        
+        Args:
+            tab_id: Tab to show
+        """
+        ...
+    
+    def close_tab(self, tab_id: int) -> None:
+        """Close a tab (the last tab stays open).
+        
+        Args:
+            tab_id: Tab to close
+        """
+        ...
+    
+    def get_tabs(self) -> List[Dict[str, Any]]:
+        """Get the tabs in display order.
+        
+        Returns:
+            List[Dict[str, Any]]: id, title, url, scroll_y, active and live per tab
+        """
+        ...
+    
+    def capture_tab_scroll(self, callback: Callable[[], None]) -> None:
+        """Refresh the scroll_y of every live tab from its page.
+        
+        Args:
+            callback: Called once all live pages have answered (or timed out)
+        """
+        ...
+    
+    def restore_tabs(self, tabs: List[Dict[str, Any]]) -> None:
+        """Add tabs from a saved session without loading them.
+        
+        Args:
+            tabs: Saved tabs with url and optional title and scroll_y
+        """
+        ...
+    
+    def set_max_live_tabs(self, max_live: int) -> None:
+        """Limit how many tabs keep a live page; older ones are discarded.
+        
+        Args:
+            max_live: Maximum live pages, including the active tab
+        """
+        ...
+    
+    def get_tab_diagnostics(self) -> Dict[str, Any]:
+        """Get per-tab renderer and memory details.
+        
+        Returns:
+            Dict[str, Any]: Live limit, discard count and tabs with renderer memory
+        """
+        ...
+    
+    def rebuild_page(self, url: Optional[str] = None) -> None:
+        """Replace the visible page with a fresh one, releasing its renderer.
+        
+        Args:
+            url: URL to open in the new page (None reopens the current URL)
+        """
+        ...
+    
+    def get_renderer_pids(self) -> Dict[int, str]:
+        """Get the renderer process of every live page.
+        
+        Returns:
+            Dict[int, str]: Renderer pid to role ("active", "tab" or "standby")
+        """
+        ...
+    
     def navigate(self, url: str) -> None:
         """Navigate to a URL.
         
@@ -23,12 +121,71 @@ class Engine(Protocol):
         """
         ...
     
-    def evaluate_js(self, js: str, callback: Optional[Callable[[bool], None]] = None) -> None:
-        """Evaluate JavaScript code.
+    def new_chat(self) -> bool:
+        """Start a new chat, instantly if a preloaded standby page is available.
+        
+        Returns:
+            bool: True if a standby page was shown, False if the engine navigated instead
+        """
+        ...
+    
+    def set_standby_enabled(self, enabled: bool) -> None:
+        """Enable or disable the warm standby page used by new_chat().
+        
+        Args:
+            enabled: Whether to keep a preloaded new-chat page
+        """
+        ...
+    
+    def evaluate_js(self, js: str, callback: Optional[Callable[[Any], None]] = None,
+                    wait_for: str = "load", timeout_ms: int = 10000, isolated: bool = False,
+                    coalesce: bool = False) -> None:
+        """Queue JavaScript code for evaluation.
+        
+        Scripts run one at a time in submission order. Identical pending
+        scripts marked ``coalesce`` are merged, and every callback is
+        resolved exactly once.
         
         Args:
             js: JavaScript code to evaluate
-            callback: Optional callback to receive result (True/False for success)
+            callback: Optional callback to receive result (None on timeout)
+            wait_for: Readiness to wait for: "none", "load" or "composer"
+            timeout_ms: Time allowed from when the script starts running until the result arrives
+            isolated: Run in the isolated world shared with the injected page scripts
+            coalesce: Merge with an identical pending call (scripts without side effects only)
+        """
+        ...
+    
+    def get_js_metrics(self) -> Dict[str, Any]:
+        """Get JavaScript queue metrics.
+        
+        Returns:
+            Dict[str, Any]: Queue depth, counters and latency statistics
+        """
+        ...
+    
+    def is_composer_ready(self) -> bool:
+        """Check whether the chat composer is rendered.
+        
+        Returns:
+            bool: True if the page is ready for input
+        """
+        ...
+    
+    def set_recovery_policy(self, mode: str, hang_timeout_ms: int) -> None:
+        """Configure renderer crash/hang recovery.
+        
+        Args:
+            mode: "restore", "home" or "off"
+            hang_timeout_ms: Time without a heartbeat reply before the renderer counts as hung
+        """
+        ...
+    
+    def get_recovery_count(self) -> int:
+        """Get the number of renderer recoveries in this session.
+        
+        Returns:
+            int: Number of page rebuilds
         """
         ...
     
@@ -40,6 +197,54 @@ class Engine(Protocol):
         """
         ...
     
+    def set_long_chat_mode(self, mode: str) -> None:
+        """Set how long conversations are rendered.
+        
+        Args:
+            mode: LONG_CHAT_OFF, LONG_CHAT_CONTAIN or LONG_CHAT_COLLAPSE
+        """
+        ...
+    
+    def set_perf_monitor(self, report_ms: int) -> None:
+        """Start or stop the in-page performance monitor.
+        
+        Args:
+            report_ms: Interval between perf_report signals (0 stops the monitor)
+        """
+        ...
+    
+    def set_frozen(self, frozen: bool) -> None:
+        """Freeze or resume the pages while the sidebar is hidden.
+        
+        Args:
+            frozen: True to stop scripts and timers, False to resume
+        """
+        ...
+    
+    def is_frozen(self) -> bool:
+        """Check whether the page in the view is frozen.
+        
+        Returns:
+            bool: True if the visible page runs no scripts
+        """
+        ...
+    
+    def set_background_color(self, color: str) -> None:
+        """Change the background shown behind the pages without reloading them.
+        
+        Args:
+            color: Background color (e.g. "#1a1a1a")
+        """
+        ...
+    
+    def get_profile(self) -> Any:
+        """Get the browser profile (cookies, storage) used by the engine.
+        
+        Returns:
+            Any: Profile object that additional pages can be created on
+        """
+        ...
+    
     def get_widget(self) -> Any:
         """Get the underlying widget for embedding.
         
@@ -1,11 +1,30 @@
 """QtWebEngine-based web engine implementation."""
 
-from typing import Callable, Optional, Dict
-from PySide6.QtCore import QUrl
+import os
+import signal
+import time
+from typing import Any, Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
 from PySide6.QtGui import QColor
-from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineScript
 from PySide6.QtWebEngineWidgets import QWebEngineView
 
+from .js_queue import JsQueue, WAIT_LOAD
+from .page import SidebarPage
+from .tabs import TabSet
+from ..constants import (
+    JS_QUEUE_TIMEOUT_MS,
+    LONG_CHAT_OFF,
+    RECOVERY_RESTORE,
+    RECOVERY_OFF,
+    RENDERER_HEARTBEAT_MS,
+    RENDERER_HANG_TIMEOUT_MS,
+    RECOVERY_LOOP_WINDOW_MS,
+    STANDBY_BUILD_DELAY_MS,
+    STANDBY_MAX_AGE_MS,
+    STANDBY_MIN_TOTAL_MEMORY_MB,
+    STANDBY_MIN_AVAILABLE_MEMORY_MB,
+)
 from ..utils.logging import get_logger
 from ..utils.paths import get_profile_path, get_cache_path, get_storage_path
 
@@ -13,9 +32,27 @@ from ..utils.paths import get_profile_path, get_cache_path, get_storage_path
 logger = get_logger(__name__)
 
 
-class QtWebEngine:
+class QtWebEngine(QObject):
     """QtWebEngine-based web engine implementation."""
     
+    # Emitted when the ChatGPT composer has rendered and the page is usable
+    composer_ready = Signal()
+    
+    # Relayed from the current page (survives page rebuilds)
+    load_finished = Signal(bool)
+    
+    # Emitted with the reason ("crashed" or "hung") before the page is rebuilt
+    recovery_started = Signal(str)
+    
+    # Assistant response events from the page's response observer
+    response_event = Signal(dict)
+    
+    # Performance reports from the page's monitor
+    perf_report = Signal(dict)
+    
+    # Emitted when tabs are opened, closed, renamed, discarded or switched
+    tabs_changed = Signal()
+    
     def __init__(self, parent=None, colors: Optional[Dict[str, str]] = None) -> None:
         """Initialize the web engine.
         
@@ -23,11 +60,42 @@ class QtWebEngine:
             parent: Parent widget (optional)
             colors: Theme colors dictionary (optional, used to prevent white flash)
         """
+        super().__init__(parent)
         self._parent = parent
         self._colors = colors or {'bg': '#1a1a1a'}  # Default to dark background
         self._web_view: Optional[QWebEngineView] = None
+        self._js_queue: Optional[JsQueue] = None
         self._profile: Optional[QWebEngineProfile] = None
+        self._wired_page: Optional[SidebarPage] = None
+        self._tabs = TabSet(self._new_page, self._show_page, self)
+        self._tabs.changed.connect(self.tabs_changed)
+        
+        # Renderer recovery state
+        self._home_url: Optional[str] = None
+        self._last_url: Optional[str] = None
+        self._zoom = 1.0
+        self._long_chat_mode = LONG_CHAT_OFF
+        self._perf_report_ms = 0
+        self._recovery_mode = RECOVERY_RESTORE
+        self._hang_timeout_ms = RENDERER_HANG_TIMEOUT_MS
+        self._recoveries = 0
+        self._last_recovery = 0.0
+        self._heartbeat_id = 0
+        self._heartbeat_sent: Optional[float] = None
+        
+        # Warm standby page for new chats (hidden, preloaded at the start URL)
+        self._standby: Optional[SidebarPage] = None
+        self._standby_created = 0.0
+        self._standby_enabled = False
+        self._standby_timer = QTimer(self)
+        self._standby_timer.setSingleShot(True)
+        self._standby_timer.timeout.connect(self._build_standby)
+        
         self._create_web_view()
+        
+        self._heartbeat_timer = QTimer(self)
+        self._heartbeat_timer.timeout.connect(self._heartbeat)
+        self._heartbeat_timer.start(RENDERER_HEARTBEAT_MS)
     
     def _create_web_view(self) -> None:
         """Create the web view with persistent profile."""
@@ -51,44 +119,309 @@ class QtWebEngine:
             
             # Create web view with profile
             self._web_view = QWebEngineView(self._parent)
-            page = QWebEnginePage(self._profile, self._web_view)
+            page = self._new_page()
+            self._wire_page(page)
             self._web_view.setPage(page)
+            self._js_queue = JsQueue(page, self)
+            self._tabs.adopt(page)
             
             # Set background color to prevent white flash during loading
             bg_color = self._colors.get('bg', '#1a1a1a')
             self._web_view.setStyleSheet(f"QWebEngineView {{ background-color: {bg_color}; }}")
             
-            # Set page background color as well
-            page.setBackgroundColor(QColor(bg_color))
-            
             logger.info(f"Web view background set to {bg_color}")
-            
+        
         except Exception as e:
             logger.error(f"Failed to create web view: {e}")
             raise
     
+    def _new_page(self) -> SidebarPage:
+        """Create a page on the existing profile.
+        
+        Returns:
+            SidebarPage: New page (not yet connected to the engine's signals)
+        """
+        page = SidebarPage(self._profile, self._web_view)
+        
+        # Set page background color to prevent white flash during loading
+        page.setBackgroundColor(QColor(self._colors.get('bg', '#1a1a1a')))
+        page.set_long_chat_mode(self._long_chat_mode)
+        page.set_perf_monitor(self._perf_report_ms)
+        return page
+    
+    def _wire_page(self, page: SidebarPage) -> None:
+        """Connect a page that is about to be shown to the engine's signals.
+        
+        Args:
+            page: Page to connect
+        """
+        self._unwire_page()
+        self._wired_page = page
+        page.composer_ready.connect(self.composer_ready)
+        page.bridge.response_event.connect(self.response_event)
+        page.bridge.perf_report.connect(self.perf_report)
+        page.loadFinished.connect(self.load_finished)
+        page.loadStarted.connect(self._on_load_started)
+        page.urlChanged.connect(self._on_url_changed)
+        page.renderProcessTerminated.connect(self._on_render_process_terminated)
+    
+    def _unwire_page(self) -> None:
+        """Disconnect the page that was shown until now from the engine's signals."""
+        page, self._wired_page = self._wired_page, None
+        if page is None:
+            return
+        page.composer_ready.disconnect(self.composer_ready)
+        page.bridge.response_event.disconnect(self.response_event)
+        page.bridge.perf_report.disconnect(self.perf_report)
+        page.loadFinished.disconnect(self.load_finished)
+        page.loadStarted.disconnect(self._on_load_started)
+        page.urlChanged.disconnect(self._on_url_changed)
+        page.renderProcessTerminated.disconnect(self._on_render_process_terminated)
+        
+        # Its response events are no longer relayed, so stop its observer too
+        # (the next wired page is synced on composer_ready)
+        page.runJavaScript("window.__sidebar && window.__sidebar.responses && window.__sidebar.responses.enable(false)",
+                           QWebEngineScript.ApplicationWorld)
+    
+    def _show_page(self, page: SidebarPage) -> None:
+        """Put a page into the view and point the engine's signals and JS queue at it.
+        
+        Args:
+            page: Page to show
+        """
+        if page is self._wired_page:
+            return
+        self._wire_page(page)
+        self._web_view.setPage(page)
+        self._js_queue.set_page(page)
+        self._web_view.setZoomFactor(self._zoom)
+        self._heartbeat_sent = None
+        self._on_url_changed(page.url())
+        
+        # Replay readiness the page reached before it was wired
+        if page.is_loaded():
+            self.load_finished.emit(True)
+        if page.is_composer_ready():
+            self.composer_ready.emit()
+    
+    def set_recovery_policy(self, mode: str, hang_timeout_ms: int) -> None:
+        """Configure how the engine reacts to renderer crashes and hangs.
+        
+        Args:
+            mode: RECOVERY_RESTORE, RECOVERY_HOME or RECOVERY_OFF
+            hang_timeout_ms: Time without a heartbeat reply before the renderer counts as hung
+        """
+        self._recovery_mode = mode
+        self._hang_timeout_ms = hang_timeout_ms
+        logger.info(f"Renderer recovery: mode={mode}, hang timeout={hang_timeout_ms} ms")
+    
+    def get_recovery_count(self) -> int:
+        """Get the number of renderer recoveries in this session.
+        
+        Returns:
+            int: Number of page rebuilds after a crash or hang
+        """
+        return self._recoveries
+    
+    def set_standby_enabled(self, enabled: bool) -> None:
+        """Enable or disable the warm standby page used by new_chat().
+        
+        Args:
+            enabled: Whether to keep a preloaded new-chat page
+        """
+        self._standby_enabled = enabled
+        if enabled:
+            self._standby_timer.start(STANDBY_BUILD_DELAY_MS)
+        else:
+            self._standby_timer.stop()
+            self._discard_standby()
+    
+    def new_chat(self) -> bool:
+        """Start a new chat, swapping in the standby page if one is ready.
+        
+        Returns:
+            bool: True if the preloaded page was shown, False if the view had to navigate
+        """
+        standby = self._standby
+        age_ms = (time.monotonic() - self._standby_created) * 1000
+        if standby is None or not standby.is_composer_ready() or age_ms > STANDBY_MAX_AGE_MS:
+            logger.info("No usable standby page; navigating to the start page")
+            self._discard_standby()
+            if self._home_url:
+                self.navigate(self._home_url)
+            if self._standby_enabled:
+                self._standby_timer.start(STANDBY_BUILD_DELAY_MS)
+            return False
+        
+        self._standby = None
+        standby.renderProcessTerminated.disconnect(self._on_standby_terminated)
+        standby.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+        
+        old_page = self._tabs.replace_active_page(standby)
+        self._show_page(standby)
+        if old_page:
+            old_page.deleteLater()
+        logger.info(f"Swapped in standby page ({age_ms / 1000:.0f} s old)")
+        
+        self._standby_timer.start(STANDBY_BUILD_DELAY_MS)
+        return True
+    
+    def open_tab(self, url: Optional[str] = None) -> int:
+        """Open a tab and show it.
+        
+        Args:
+            url: URL to open (None opens the start URL)
+            
+        Returns:
+            int: New tab id
+        """
+        return self._tabs.open(url or self._home_url or "about:blank").id
+    
+    def activate_tab(self, tab_id: int) -> None:
+        """Show a tab, reloading it if it was discarded.
+        
+        Args:
+            tab_id: Tab to show
+        """
+        self._tabs.activate(tab_id)
+    
+    def close_tab(self, tab_id: int) -> None:
+        """Close a tab and release its page (the last tab stays open).
+        
+        Args:
+            tab_id: Tab to close
+        """
+        self._tabs.close(tab_id)
+    
+    def get_tabs(self) -> List[Dict[str, Any]]:
+        """Get the tabs in display order.
+        
+        Returns:
+            List[Dict[str, Any]]: id, title, url, scroll_y, active and live (has a page) per tab
+        """
+        active = self._tabs.active()
+        return [{"id": tab.id, "title": tab.title, "url": tab.url, "scroll_y": tab.scroll_y,
+                 "active": tab is active, "live": tab.page is not None}
+                for tab in self._tabs.tabs()]
+    
+    def capture_tab_scroll(self, callback: Callable[[], None]) -> None:
+        """Refresh the scroll_y of every live tab from its page.
+        
+        Args:
+            callback: Called once all live pages have answered (or timed out)
+        """
+        self._tabs.capture_scroll(callback)
+    
+    def restore_tabs(self, tabs: List[Dict[str, Any]]) -> None:
+        """Add tabs from a saved session without loading them.
+        
+        Args:
+            tabs: Saved tabs with url and optional title and scroll_y
+        """
+        for tab in tabs:
+            self._tabs.restore(tab["url"], tab.get("title", ""), int(tab.get("scroll_y", 0)))
+    
+    def set_max_live_tabs(self, max_live: int) -> None:
+        """Limit how many tabs keep a live page (renderer).
+        
+        Args:
+            max_live: Maximum live pages, including the active tab
+        """
+        self._tabs.set_max_live(max_live)
+    
+    def rebuild_page(self, url: Optional[str] = None) -> None:
+        """Replace the visible page with a fresh one on the same profile.
+        
+        Unlike a reload, this releases the old page's renderer (unless
+        another tab's page shares the process).
+        
+        Args:
+            url: URL to open in the new page (None reopens the current URL)
+        """
+        old_page = self.get_page()
+        if not old_page:
+            return
+        url = url or self._last_url or self._home_url
+        logger.info(f"Rebuilding page at {url}")
+        self._unwire_page()
+        self._replace_page(old_page)
+        if url:
+            self.navigate(url)
+    
+    def get_renderer_pids(self) -> Dict[int, str]:
+        """Get the renderer process of every live page.
+        
+        Returns:
+            Dict[int, str]: Renderer pid to role ("active", "tab" or "standby")
+        """
+        pids = {}
+        if self._standby is not None and self._standby.renderProcessPid() > 0:
+            pids[self._standby.renderProcessPid()] = "standby"
+        for tab in self._tabs.tabs():
+            if tab.page is not None and tab.page.renderProcessPid() > 0:
+                pid = tab.page.renderProcessPid()
+                if pids.get(pid) != "active":
+                    pids[pid] = "active" if tab is self._tabs.active() else "tab"
+        return pids
+    
+    def get_tab_diagnostics(self) -> Dict[str, Any]:
+        """Get per-tab renderer and memory details.
+        
+        Returns:
+            Dict[str, Any]: Live limit, discard count and tabs with renderer memory
+        """
+        return self._tabs.get_diagnostics()
+    
     def navigate(self, url: str) -> None:
         """Navigate to a URL.
         
         Args:
             url: URL to navigate to
         """
+        if self._home_url is None:
+            self._home_url = url
         if self._web_view:
             self._web_view.setUrl(QUrl(url))
             logger.info(f"Navigating to {url}")
     
-    def evaluate_js(self, js: str, callback: Optional[Callable[[bool], None]] = None) -> None:
-        """Evaluate JavaScript code.
+    def evaluate_js(self, js: str, callback: Optional[Callable[[Any], None]] = None,
+                    wait_for: str = WAIT_LOAD, timeout_ms: int = JS_QUEUE_TIMEOUT_MS,
+                    isolated: bool = False, coalesce: bool = False) -> None:
+        """Queue JavaScript code for evaluation.
+        
+        Scripts run one at a time in submission order once the page reaches
+        the requested readiness level.
         
         Args:
             js: JavaScript code to evaluate
-            callback: Optional callback to receive result
+            callback: Optional callback to receive result (None on timeout)
+            wait_for: Readiness level to wait for (see web/js_queue.py)
+            timeout_ms: Time allowed from when the script starts running until the result arrives
+            isolated: Run in the isolated world shared with the injected page scripts
+            coalesce: Merge with an identical pending call (scripts without side effects only)
+        """
+        if self._js_queue:
+            world_id = QWebEngineScript.ApplicationWorld if isolated else QWebEngineScript.MainWorld
+            self._js_queue.submit(js, callback, wait_for, timeout_ms, int(world_id), coalesce)
+        elif callback:
+            callback(None)
+    
+    def get_js_metrics(self) -> Dict[str, Any]:
+        """Get JavaScript queue depth and latency metrics.
+        
+        Returns:
+            Dict[str, Any]: Queue metrics (empty before the web view exists)
         """
-        if self._web_view and self._web_view.page():
-            if callback:
-                self._web_view.page().runJavaScript(js, callback)
-            else:
-                self._web_view.page().runJavaScript(js)
+        return self._js_queue.get_metrics() if self._js_queue else {}
+    
+    def is_composer_ready(self) -> bool:
+        """Check whether the chat composer is rendered.
+        
+        Returns:
+            bool: True if the page is ready for input
+        """
+        page = self.get_page()
+        return bool(page) and page.is_composer_ready()
     
     def set_zoom(self, factor: float) -> None:
         """Set the zoom factor.
@@ -96,10 +429,74 @@ class QtWebEngine:
         Args:
             factor: Zoom factor (1.0 = 100%)
         """
+        self._zoom = factor
         if self._web_view:
             self._web_view.setZoomFactor(factor)
             logger.info(f"Zoom factor set to {factor}")
     
+    def set_long_chat_mode(self, mode: str) -> None:
+        """Set how long conversations are rendered in every page.
+        
+        Args:
+            mode: LONG_CHAT_OFF, LONG_CHAT_CONTAIN or LONG_CHAT_COLLAPSE
+        """
+        self._long_chat_mode = mode
+        for page in self._live_pages():
+            page.set_long_chat_mode(mode)
+        logger.info(f"Long conversation rendering: {mode}")
+    
+    def set_perf_monitor(self, report_ms: int) -> None:
+        """Start or stop the performance monitor in every page.
+        
+        Only the page in the view relays its reports (perf_report).
+        
+        Args:
+            report_ms: Interval between reports (0 stops the monitor)
+        """
+        self._perf_report_ms = report_ms
+        for page in self._live_pages():
+            page.set_perf_monitor(report_ms)
+    
+    def set_frozen(self, frozen: bool) -> None:
+        """Freeze or resume the tab pages while the sidebar is hidden.
+        
+        Frozen pages keep their DOM and renderer but run no scripts or
+        timers. The standby page manages its own state and is left alone.
+        
+        Args:
+            frozen: True to freeze (the view must already be hidden), False to resume
+        """
+        state = QWebEnginePage.LifecycleState.Frozen if frozen else QWebEnginePage.LifecycleState.Active
+        pages = [tab.page for tab in self._tabs.tabs() if tab.page is not None]
+        for page in pages:
+            if page.lifecycleState() != state:
+                page.setLifecycleState(state)
+        logger.info(f"{'Froze' if frozen else 'Resumed'} {len(pages)} page(s)")
+    
+    def is_frozen(self) -> bool:
+        """Check whether the page in the view is frozen.
+        
+        Returns:
+            bool: True if the visible page runs no scripts (set_frozen)
+        """
+        page = self.get_page()
+        return page is not None and page.lifecycleState() == QWebEnginePage.LifecycleState.Frozen
+    
+    def set_background_color(self, color: str) -> None:
+        """Change the color shown behind the pages (theme switch).
+        
+        The pages keep their content; only the color painted before and
+        between loads changes, so no page is reloaded.
+        
+        Args:
+            color: Background color (e.g. "#1a1a1a")
+        """
+        self._colors = {**self._colors, 'bg': color}
+        self._web_view.setStyleSheet(f"QWebEngineView {{ background-color: {color}; }}")
+        for page in self._live_pages():
+            page.setBackgroundColor(QColor(color))
+        logger.info(f"Web view background set to {color}")
+    
     def get_widget(self) -> QWebEngineView:
         """Get the underlying widget for embedding.
         
@@ -108,13 +505,214 @@ class QtWebEngine:
         """
         return self._web_view
     
-    def get_page(self) -> Optional[QWebEnginePage]:
+    def get_profile(self) -> Optional[QWebEngineProfile]:
+        """Get the persistent profile shared by all pages.
+        
+        Returns:
+            Optional[QWebEngineProfile]: The profile or None
+        """
+        return self._profile
+    
+    def get_page(self) -> Optional[SidebarPage]:
         """Get the web engine page.
         
         Returns:
-            Optional[QWebEnginePage]: The web page or None
+            Optional[SidebarPage]: The web page or None
         """
         if self._web_view:
             return self._web_view.page()
         return None
-
+    
+    
+    def _live_pages(self) -> List[SidebarPage]:
+        """Get every page that currently exists (tabs and the standby page).
+        
+        Returns:
+            List[SidebarPage]: Live pages
+        """
+        pages = [tab.page for tab in self._tabs.tabs() if tab.page is not None]
+        if self._standby is not None:
+            pages.append(self._standby)
+        return pages
+    
+    def _build_standby(self) -> None:
+        """Preload a hidden new-chat page if enabled and memory allows."""
+        if not self._standby_enabled or self._standby is not None or not self._home_url:
+            return
+        
+        # Don't compete with the visible page while it is still loading
+        page = self.get_page()
+        if page and not page.is_loaded():
+            self._standby_timer.start(STANDBY_BUILD_DELAY_MS)
+            return
+        
+        if not self._memory_allows_standby():
+            return
+        
+        standby = self._new_page()
+        standby.renderProcessTerminated.connect(self._on_standby_terminated)
+        standby.composer_ready.connect(lambda: self._freeze_standby(standby))
+        standby.load(QUrl(self._home_url))
+        self._standby = standby
+        self._standby_created = time.monotonic()
+        logger.info(f"Preloading standby page at {self._home_url}")
+    
+    def _freeze_standby(self, standby: SidebarPage) -> None:
+        """Stop a preloaded standby page from using CPU until it is shown.
+        
+        Args:
+            standby: The standby page
+        """
+        if standby is self._standby:
+            standby.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+    
+    def _memory_allows_standby(self) -> bool:
+        """Check the standby page's memory budget.
+        
+        Returns:
+            bool: True if the machine has enough total and available memory
+        """
+        # Lazy import memory_win (Win32 only)
+        try:
+            from ..platform.memory_win import get_physical_memory
+            memory = get_physical_memory()
+        except (ImportError, AttributeError, OSError):
+            memory = None
+        if memory is None:
+            return True
+        
+        total_mb, available_mb = memory[0] // (1024 * 1024), memory[1] // (1024 * 1024)
+        if total_mb < STANDBY_MIN_TOTAL_MEMORY_MB or available_mb < STANDBY_MIN_AVAILABLE_MEMORY_MB:
+            logger.info(f"Standby page skipped: {available_mb} MB of {total_mb} MB available")
+            return False
+        return True
+    
+    def _discard_standby(self) -> None:
+        """Release the standby page and its renderer."""
+        if self._standby is not None:
+            self._standby.deleteLater()
+            self._standby = None
+    
+    def _on_standby_terminated(self, *args) -> None:
+        """Drop a standby page whose renderer died and build a new one later."""
+        logger.warning("Standby page renderer terminated")
+        self._discard_standby()
+        if self._standby_enabled:
+            self._standby_timer.start(STANDBY_BUILD_DELAY_MS)
+    
+    def _on_load_started(self) -> None:
+        """Forget any outstanding heartbeat (navigation may drop its reply)."""
+        self._heartbeat_sent = None
+    
+    def _on_url_changed(self, url: QUrl) -> None:
+        """Remember the last real URL so it can be restored after a crash.
+        
+        Args:
+            url: New page URL
+        """
+        if url.scheme() in ("http", "https"):
+            self._last_url = url.toString()
+    
+    def _heartbeat(self) -> None:
+        """Ping the renderer and recover it if an earlier ping went unanswered."""
+        page = self.get_page()
+        if not page or self._recovery_mode == RECOVERY_OFF or not page.is_loaded():
+            return
+        
+        # Frozen or discarded pages don't run scripts, so they can't answer
+        if page.lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            self._heartbeat_sent = None
+            return
+        
+        if self._heartbeat_sent is not None:
+            waited_ms = (time.monotonic() - self._heartbeat_sent) * 1000
+            if waited_ms >= self._hang_timeout_ms:
+                logger.warning(f"Renderer unresponsive for {waited_ms:.0f} ms")
+                self._recover("hung")
+            return
+        
+        self._heartbeat_id += 1
+        heartbeat_id = self._heartbeat_id
+        self._heartbeat_sent = time.monotonic()
+        page.runJavaScript("1", QWebEngineScript.ApplicationWorld,
+                           lambda _: self._on_heartbeat_reply(heartbeat_id))
+    
+    def _on_heartbeat_reply(self, heartbeat_id: int) -> None:
+        """Clear the outstanding heartbeat.
+        
+        Args:
+            heartbeat_id: Identifier of the answered heartbeat
+        """
+        if heartbeat_id == self._heartbeat_id:
+            self._heartbeat_sent = None
+    
+    def _on_render_process_terminated(self, status: QWebEnginePage.RenderProcessTerminationStatus,
+                                      exit_code: int) -> None:
+        """Recover from a renderer crash.
+        
+        Args:
+            status: Termination status
+            exit_code: Renderer exit code
+        """
+        if status == QWebEnginePage.RenderProcessTerminationStatus.NormalTerminationStatus:
+            logger.info(f"Renderer process exited normally (exit code {exit_code})")
+            return
+        logger.error(f"Renderer process terminated ({status.name}, exit code {exit_code})")
+        if self._recovery_mode != RECOVERY_OFF:
+            # Let Qt finish handling the termination before replacing the page
+            QTimer.singleShot(0, lambda: self._recover("crashed"))
+    
+    def _recover(self, reason: str) -> None:
+        """Replace the page with a fresh one on the same profile.
+        
+        The profile, view and widget tree are kept, so this is much cheaper than
+        restarting the app. A hung renderer is killed first so the new page
+        doesn't share its process, unless another tab or the standby page
+        also lives in it; then the page is only replaced.
+        
+        Args:
+            reason: "crashed" or "hung"
+        """
+        old_page = self.get_page()
+        if not old_page:
+            return
+        
+        self._recoveries += 1
+        self._heartbeat_sent = None
+        
+        # Reopen the start page if the last URL keeps taking the renderer down
+        now = time.monotonic()
+        repeated = (now - self._last_recovery) * 1000 < RECOVERY_LOOP_WINDOW_MS
+        self._last_recovery = now
+        url = self._last_url if self._recovery_mode == RECOVERY_RESTORE and not repeated else None
+        url = url or self._home_url
+        
+        logger.warning(f"Recovering {reason} renderer (recovery #{self._recoveries}), reopening {url}")
+        self.recovery_started.emit(reason)
+        
+        self._unwire_page()
+        if reason == "hung":
+            pid = old_page.renderProcessPid()
+            shared = any(page is not old_page and page.renderProcessPid() == pid for page in self._live_pages())
+            if shared:
+                logger.warning(f"Renderer {pid} also hosts other pages, replacing the page without killing it")
+            elif pid > 0:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError as e:
+                    logger.warning(f"Failed to kill renderer {pid}: {e}")
+        
+        self._replace_page(old_page)
+        if url:
+            self.navigate(url)
+    
+    def _replace_page(self, old_page: SidebarPage) -> None:
+        """Show a fresh page in the active tab and dispose of the old one.
+        
+        Args:
+            old_page: Page to replace (already unwired)
+        """
+        page = self._new_page()
+        self._tabs.replace_active_page(page)
+        self._show_page(page)
+        old_page.deleteLater()
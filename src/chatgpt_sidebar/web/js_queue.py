@@ -0,0 +1,253 @@
+"""Ordered JavaScript execution queue for a web page.
+
+``runJavaScript`` results are lost when a navigation starts before they
+arrive, and independent callers have no ordering guarantees. ``JsQueue``
+runs one script at a time, holds scripts until the page has loaded (or the
+composer has rendered), merges identical pending calls the caller marks as
+idempotent and resolves every callback exactly once, with ``None`` on
+timeout.
+
+A call has two deadlines: ``JS_QUEUE_READY_TIMEOUT_MS`` for waiting at the
+head of the queue until the page is ready, and its own ``timeout_ms``
+counted from when it starts running. A slow load therefore only fails the
+calls that keep waiting past the readiness timeout, not everything queued
+behind it.
+"""
+
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+from PySide6.QtCore import QObject, QTimer
+
+from ..constants import JS_QUEUE_TIMEOUT_MS, JS_QUEUE_READY_TIMEOUT_MS, JS_QUEUE_LATENCY_SAMPLES
+from ..utils.logging import get_logger
+from ..utils.stats import summarize_latencies
+
+
+logger = get_logger(__name__)
+
+
+# Readiness levels a queued script can wait for
+WAIT_NONE = "none"  # Run as soon as the queue reaches it
+WAIT_LOAD = "load"  # Run after the current document has finished loading
+WAIT_COMPOSER = "composer"  # Run after the chat composer has rendered
+
+
+class _JsCall:
+    """A queued script and everyone waiting for its result."""
+    
+    __slots__ = ("js", "world_id", "wait_for", "timeout_ms", "coalesce", "callbacks",
+                 "enqueued_ns", "head_ns", "started_ns")
+    
+    def __init__(self, js: str, world_id: int, wait_for: str, timeout_ms: int, coalesce: bool) -> None:
+        self.js = js
+        self.world_id = world_id
+        self.wait_for = wait_for
+        self.timeout_ms = timeout_ms
+        self.coalesce = coalesce
+        self.callbacks: List[Callable[[Any], None]] = []
+        self.enqueued_ns = time.perf_counter_ns()
+        self.head_ns = 0  # When the call reached the head of the queue
+        self.started_ns = 0
+
+
+class JsQueue(QObject):
+    """Serializes ``runJavaScript`` calls on a ``SidebarPage``."""
+    
+    def __init__(self, page, parent: Optional[QObject] = None) -> None:
+        """Initialize the queue.
+        
+        Args:
+            page: SidebarPage to run scripts on
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._page = None
+        self._pending: Deque[_JsCall] = deque()
+        self._running: Optional[_JsCall] = None
+        self._run_id = 0
+        
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+        
+        # Metrics
+        self._max_depth = 0
+        self._executed = 0
+        self._timeouts = 0
+        self._coalesced = 0
+        self._wait_ms: Deque[float] = deque(maxlen=JS_QUEUE_LATENCY_SAMPLES)
+        self._exec_ms: Deque[float] = deque(maxlen=JS_QUEUE_LATENCY_SAMPLES)
+        
+        self.set_page(page)
+    
+    def set_page(self, page) -> None:
+        """Attach the queue to a (new) page.
+        
+        Pending scripts are kept and run on the new page once it is ready.
+        
+        Args:
+            page: SidebarPage to run scripts on
+        """
+        if self._page is not None:
+            self._page.loadFinished.disconnect(self._pump)
+            self._page.composer_ready.disconnect(self._pump)
+        self._page = page
+        page.loadFinished.connect(self._pump)
+        page.composer_ready.connect(self._pump)
+        self._pump()
+    
+    def submit(self, js: str, callback: Optional[Callable[[Any], None]] = None,
+               wait_for: str = WAIT_LOAD, timeout_ms: int = JS_QUEUE_TIMEOUT_MS,
+               world_id: int = 0, coalesce: bool = False) -> None:
+        """Queue a script.
+        
+        With ``coalesce``, a call is merged into an identical coalescing
+        script with the same readiness level and world that is already
+        waiting, and both callbacks receive the same result. Only use it for
+        scripts without side effects (reads).
+        
+        Args:
+            js: JavaScript code to evaluate
+            callback: Optional callback to receive the result (None on timeout)
+            wait_for: Readiness level to wait for (WAIT_NONE, WAIT_LOAD or WAIT_COMPOSER)
+            timeout_ms: Time allowed from when the script starts running until the result arrives
+            world_id: Script world to run in (0 is the page's main world)
+            coalesce: Merge with an identical pending call (idempotent scripts only)
+        """
+        call = None
+        if coalesce:
+            for pending in self._pending:
+                if (pending.coalesce and pending.js == js and pending.wait_for == wait_for
+                        and pending.world_id == world_id):
+                    call = pending
+                    self._coalesced += 1
+                    break
+        
+        if call is None:
+            call = _JsCall(js, world_id, wait_for, timeout_ms, coalesce)
+            self._pending.append(call)
+            self._max_depth = max(self._max_depth, len(self._pending))
+        
+        if callback:
+            call.callbacks.append(callback)
+        
+        if self._running is None:
+            self._pump()
+            self._arm_timer()
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth and latency metrics.
+        
+        Returns:
+            Dict[str, Any]: Depth, counters and wait/execution latency stats in ms
+        """
+        return {
+            "depth": len(self._pending) + (1 if self._running else 0),
+            "max_depth": self._max_depth,
+            "executed": self._executed,
+            "timeouts": self._timeouts,
+            "coalesced": self._coalesced,
+            "wait_ms": summarize_latencies(self._wait_ms),
+            "exec_ms": summarize_latencies(self._exec_ms),
+        }
+    
+    def _is_ready(self, wait_for: str) -> bool:
+        """Check whether the page satisfies a readiness level.
+        
+        Args:
+            wait_for: Readiness level
+            
+        Returns:
+            bool: True if a script waiting for this level may run
+        """
+        if wait_for == WAIT_COMPOSER:
+            return self._page.is_composer_ready()
+        if wait_for == WAIT_LOAD:
+            return self._page.is_loaded()
+        return True
+    
+    def _pump(self, *args) -> None:
+        """Start the next script if nothing is running and the page is ready."""
+        if self._running is not None or not self._pending:
+            return
+        call = self._pending[0]
+        if not self._is_ready(call.wait_for):
+            return
+        
+        self._pending.popleft()
+        self._running = call
+        self._run_id += 1
+        run_id = self._run_id
+        call.started_ns = time.perf_counter_ns()
+        self._wait_ms.append((call.started_ns - call.enqueued_ns) / 1e6)
+        
+        self._arm_timer()
+        self._page.runJavaScript(call.js, call.world_id, lambda result: self._on_result(run_id, result))
+    
+    def _arm_timer(self) -> None:
+        """Point the timeout timer at the call whose deadline matters now.
+        
+        That is the running call's timeout, or else the readiness timeout of
+        the call waiting at the head of the queue.
+        """
+        now = time.perf_counter_ns()
+        if self._running is not None:
+            elapsed_ms = (now - self._running.started_ns) / 1e6
+            self._timer.start(max(0, int(self._running.timeout_ms - elapsed_ms)))
+        elif self._pending:
+            head = self._pending[0]
+            if not head.head_ns:
+                head.head_ns = now
+            elapsed_ms = (now - head.head_ns) / 1e6
+            self._timer.start(max(0, int(JS_QUEUE_READY_TIMEOUT_MS - elapsed_ms)))
+        else:
+            self._timer.stop()
+    
+    def _on_result(self, run_id: int, result: Any) -> None:
+        """Handle a script result.
+        
+        Args:
+            run_id: Identifier of the run the result belongs to
+            result: Value returned by the script
+        """
+        if run_id != self._run_id or self._running is None:
+            return  # Late result of a call that already timed out
+        call, self._running = self._running, None
+        self._exec_ms.append((time.perf_counter_ns() - call.started_ns) / 1e6)
+        self._executed += 1
+        self._resolve(call, result)
+        self._pump()
+        self._arm_timer()
+    
+    def _on_timeout(self) -> None:
+        """Fail the running call, or the oldest waiting one, when it runs out of time."""
+        if self._running is not None:
+            call, self._running = self._running, None
+        elif self._pending:
+            call = self._pending.popleft()
+        else:
+            return
+        
+        self._timeouts += 1
+        if call.started_ns:
+            logger.warning(f"JavaScript call timed out after {call.timeout_ms} ms (running)")
+        else:
+            logger.warning(f"JavaScript call timed out after {JS_QUEUE_READY_TIMEOUT_MS} ms (waiting for {call.wait_for})")
+        self._resolve(call, None)
+        self._pump()
+        self._arm_timer()
+    
+    def _resolve(self, call: _JsCall, result: Any) -> None:
+        """Deliver a result to every callback of a call.
+        
+        Args:
+            call: Finished call
+            result: Value to deliver
+        """
+        for callback in call.callbacks:
+            try:
+                callback(result)
+            except Exception as e:
+                logger.error(f"JavaScript callback failed: {e}")
+
@@ -0,0 +1,193 @@
+"""QWebEnginePage subclass with the sidebar's page integration."""
+
+import json
+from typing import Optional
+from PySide6.QtCore import QFile, QIODevice, QObject, Signal
+from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineScript
+
+from .bridge import PageBridge
+from .page_scripts import (
+    BRIDGE_OBJECT_NAME,
+    build_bridge_js,
+    build_composer_watch_js,
+    build_transfer_js,
+    build_prompt_js,
+    build_scroll_js,
+    build_long_chat_js,
+    build_perf_monitor_js,
+    build_response_observer_js,
+)
+from ..constants import LONG_CHAT_OFF, PERF_LAG_SAMPLE_MS
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# Cached contents of Qt's qwebchannel.js client library
+_qwebchannel_js: Optional[str] = None
+
+
+def _load_qwebchannel_js() -> str:
+    """Read qwebchannel.js from Qt's resources.
+    
+    Returns:
+        str: JavaScript source (empty if the resource is unavailable)
+    """
+    global _qwebchannel_js
+    if _qwebchannel_js is None:
+        f = QFile(":/qtwebchannel/qwebchannel.js")
+        if f.open(QIODevice.ReadOnly):
+            _qwebchannel_js = bytes(f.readAll()).decode("utf-8")
+            f.close()
+        else:
+            logger.error("qwebchannel.js resource not found; page bridge disabled")
+            _qwebchannel_js = ""
+    return _qwebchannel_js
+
+
+class SidebarPage(QWebEnginePage):
+    """Web page that reports when ChatGPT is usable.
+    
+    Installs a QWebChannel bridge and a composer watcher in Qt's isolated
+    application world on every document load.
+    """
+    
+    # Emitted when the composer appears (the page is ready for input)
+    composer_ready = Signal()
+    
+    def __init__(self, profile: QWebEngineProfile, parent: Optional[QObject] = None) -> None:
+        """Initialize the page.
+        
+        Args:
+            profile: Web engine profile to use
+            parent: Parent object
+        """
+        super().__init__(profile, parent)
+        self._composer_ready = False
+        self._loaded = False
+        self._long_chat_mode = LONG_CHAT_OFF
+        self._perf_report_ms = 0
+        
+        # Bridge for injected scripts
+        self.bridge = PageBridge(self)
+        self._channel = QWebChannel(self)
+        self._channel.registerObject(BRIDGE_OBJECT_NAME, self.bridge)
+        self.setWebChannel(self._channel, QWebEngineScript.ApplicationWorld)
+        
+        self.add_script("sidebar-bridge", _load_qwebchannel_js() + build_bridge_js())
+        self.add_script("sidebar-composer-watch", build_composer_watch_js())
+        self.add_script("sidebar-transfers", build_transfer_js())
+        self.add_script("sidebar-prompt", build_prompt_js())
+        self.add_script("sidebar-scroll", build_scroll_js())
+        self.add_script("sidebar-long-chat", build_long_chat_js())
+        self.add_script("sidebar-responses", build_response_observer_js())
+        self.add_script("sidebar-perf", build_perf_monitor_js())
+        
+        self.bridge.composer_state_changed.connect(self._on_composer_state_changed)
+        self.loadStarted.connect(self._on_load_started)
+        self.loadFinished.connect(self._on_load_finished)
+    
+    def add_script(self, name: str, source: str) -> None:
+        """Inject a script into the isolated world of every document.
+        
+        Scripts run at DOMContentLoaded in insertion order, after the bridge.
+        
+        Args:
+            name: Unique script name
+            source: JavaScript source
+        """
+        script = QWebEngineScript()
+        script.setName(name)
+        script.setSourceCode(source)
+        script.setInjectionPoint(QWebEngineScript.DocumentReady)
+        script.setWorldId(QWebEngineScript.ApplicationWorld)
+        script.setRunsOnSubFrames(False)
+        self.scripts().insert(script)
+    
+    def is_loaded(self) -> bool:
+        """Check whether the current document has finished loading.
+        
+        Returns:
+            bool: True after loadFinished until the next navigation starts
+        """
+        return self._loaded
+    
+    def is_composer_ready(self) -> bool:
+        """Check whether the composer is currently rendered.
+        
+        Returns:
+            bool: True if the page is ready for input
+        """
+        return self._composer_ready
+    
+    def set_long_chat_mode(self, mode: str) -> None:
+        """Set how long conversations are rendered (see build_long_chat_js).
+        
+        The mode is applied to the current document and again whenever the
+        composer appears in a new one.
+        
+        Args:
+            mode: LONG_CHAT_OFF, LONG_CHAT_CONTAIN or LONG_CHAT_COLLAPSE
+        """
+        self._long_chat_mode = mode
+        if self._loaded:
+            self._apply_long_chat_mode()
+    
+    def _apply_long_chat_mode(self) -> None:
+        """Pass the long conversation mode to the page script."""
+        self.runJavaScript(
+            f"window.__sidebar && window.__sidebar.longChat && window.__sidebar.longChat.setMode({json.dumps(self._long_chat_mode)})",
+            QWebEngineScript.ApplicationWorld)
+    
+    def set_perf_monitor(self, report_ms: int) -> None:
+        """Start or stop the in-page performance monitor (see build_perf_monitor_js).
+        
+        Like the long conversation mode, the setting is applied to the
+        current document and to every new one once its composer appears.
+        
+        Args:
+            report_ms: Interval between reports (0 stops the monitor)
+        """
+        self._perf_report_ms = report_ms
+        if self._loaded:
+            self._apply_perf_monitor()
+    
+    def _apply_perf_monitor(self) -> None:
+        """Pass the performance monitor setting to the page script."""
+        if self._perf_report_ms > 0:
+            call = f"start({self._perf_report_ms}, {PERF_LAG_SAMPLE_MS})"
+        else:
+            call = "stop()"
+        self.runJavaScript(f"window.__sidebar && window.__sidebar.perf && window.__sidebar.perf.{call}",
+                           QWebEngineScript.ApplicationWorld)
+    
+    def _on_load_started(self) -> None:
+        """Reset readiness when a new document starts loading."""
+        self._loaded = False
+        self._composer_ready = False
+    
+    def _on_load_finished(self, ok: bool) -> None:
+        """Mark the document as loaded.
+        
+        Args:
+            ok: Whether the load succeeded (error pages still accept scripts)
+        """
+        self._loaded = True
+    
+    def _on_composer_state_changed(self, present: bool) -> None:
+        """Track composer presence reported by the page.
+        
+        Args:
+            present: Whether the composer is in the DOM
+        """
+        was_ready = self._composer_ready
+        self._composer_ready = present
+        if present and not was_ready:
+            logger.info("Composer ready")
+            if self._long_chat_mode != LONG_CHAT_OFF:
+                self._apply_long_chat_mode()
+            if self._perf_report_ms > 0:
+                self._apply_perf_monitor()
+            self.composer_ready.emit()
@@ -0,0 +1,591 @@
+"""JavaScript injected into every ChatGPT page.
+
+Scripts run in Qt's isolated application world, so they share the DOM with
+the page but not its JavaScript globals. They talk to Python through the
+``QWebChannel`` object registered by ``SidebarPage`` under
+``BRIDGE_OBJECT_NAME``.
+"""
+
+import json
+
+from ..constants import (
+    COMPOSER_SELECTOR,
+    ASSISTANT_MESSAGE_SELECTOR,
+    STOP_BUTTON_SELECTOR,
+    CONVERSATION_TURN_SELECTOR,
+    SEND_BUTTON_SELECTOR,
+    RESPONSE_FLUSH_MS,
+    RESPONSE_FLUSH_MAX_MS,
+    RESPONSE_CPU_BUDGET_PCT,
+    LONG_CHAT_OFF,
+    LONG_CHAT_COLLAPSE,
+    LONG_CHAT_INTRINSIC_HEIGHT_PX,
+    LONG_CHAT_COLLAPSE_VIEWPORTS,
+    LONG_CHAT_COLLAPSE_MIN_TURNS,
+    LONG_CHAT_SCAN_MS,
+)
+
+
+BRIDGE_OBJECT_NAME = "sidebar"
+
+
+def build_bridge_js() -> str:
+    """Build JavaScript that connects to the Python bridge.
+    
+    Exposes ``window.__sidebar.onReady(cb)``, which calls ``cb(bridge)`` once
+    the channel is connected. Must run after qwebchannel.js.
+    
+    Returns:
+        str: JavaScript code
+    """
+    name = json.dumps(BRIDGE_OBJECT_NAME)
+    return f"""
+    (function(){{
+      if (window.__sidebar) return;
+      const waiters = [];
+      window.__sidebar = {{
+        bridge: null,
+        onReady: function(cb) {{
+          if (this.bridge) cb(this.bridge); else waiters.push(cb);
+        }}
+      }};
+      new QWebChannel(qt.webChannelTransport, function(channel) {{
+        window.__sidebar.bridge = channel.objects[{name}];
+        waiters.splice(0).forEach(function(cb) {{ cb(window.__sidebar.bridge); }});
+      }});
+    }})();"""
+
+
+def build_composer_watch_js() -> str:
+    """Build JavaScript that reports when the composer appears or disappears.
+    
+    A MutationObserver re-queries the DOM only after the known composer
+    element has been detached, so the steady-state cost per mutation batch
+    is a single ``isConnected`` check.
+    
+    Returns:
+        str: JavaScript code
+    """
+    selector = json.dumps(COMPOSER_SELECTOR)
+    return f"""
+    (function(){{
+      let composer = null;
+      let present = null;
+      
+      function check() {{
+        if (composer && composer.isConnected) return;
+        composer = document.querySelector({selector});
+        const now = !!composer;
+        if (now !== present) {{
+          present = now;
+          window.__sidebar.onReady(function(bridge) {{ bridge.composerStateChanged(now); }});
+        }}
+      }}
+      
+      check();
+      new MutationObserver(check).observe(document.documentElement, {{ childList: true, subtree: true }});
+    }})();"""
+
+
+def build_transfer_js() -> str:
+    """Build JavaScript that assembles chunked text and file transfers.
+    
+    Exposes ``window.__sidebar.transfers`` with ``begin``, ``append``,
+    ``end`` and ``abort``. Chunks are kept in the page until ``end``, which
+    inserts text into the composer or pastes the assembled file, so no
+    single ``runJavaScript`` call has to carry the whole payload. Each call
+    returns false if the transfer is unknown (e.g. after a reload) or a
+    chunk went missing, in which case nothing is inserted.
+    
+    Returns:
+        str: JavaScript code
+    """
+    selector = json.dumps(COMPOSER_SELECTOR)
+    return f"""
+    (function(){{
+      if (window.__sidebar.transfers) return;
+      const active = {{}};
+      
+      function decode(b64) {{
+        const binary = atob(b64);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+        return bytes;
+      }}
+      
+      function pasteFile(composer, file) {{
+        const dt = new DataTransfer();
+        dt.items.add(file);
+        let evt;
+        try {{
+          evt = new ClipboardEvent('paste', {{ clipboardData: dt, bubbles: true, cancelable: true }});
+        }} catch (e) {{
+          evt = new Event('paste', {{ bubbles: true, cancelable: true }});
+          try {{ Object.defineProperty(evt, 'clipboardData', {{ value: dt }}); }} catch (e2) {{}}
+        }}
+        return composer.dispatchEvent(evt);
+      }}
+      
+      window.__sidebar.transfers = {{
+        begin: function(id, kind, name, mime) {{
+          active[id] = {{ kind: kind, name: name, mime: mime, parts: [], next: 0 }};
+          return true;
+        }},
+        append: function(id, seq, data) {{
+          const t = active[id];
+          if (!t || t.broken) return false;
+          if (seq !== t.next) {{ t.broken = true; return false; }}
+          t.parts.push(t.kind === 'file' ? decode(data) : data);
+          t.next++;
+          return true;
+        }},
+        end: function(id) {{
+          const t = active[id];
+          delete active[id];
+          const composer = document.querySelector({selector});
+          if (!t || t.broken || !composer) return false;
+          composer.focus();
+          if (t.kind === 'text') return document.execCommand('insertText', false, t.parts.join(''));
+          return pasteFile(composer, new File(t.parts, t.name, {{ type: t.mime }}));
+        }},
+        abort: function(id) {{
+          delete active[id];
+          return true;
+        }}
+      }};
+    }})();"""
+
+
+def build_prompt_js() -> str:
+    """Build JavaScript that submits the composer's contents.
+    
+    Exposes ``window.__sidebar.prompt.submit()``, which clicks the send
+    button and returns true, or returns false while the button is missing
+    or disabled (it stays disabled until the page has registered the text).
+    
+    Returns:
+        str: JavaScript code
+    """
+    selector = json.dumps(SEND_BUTTON_SELECTOR)
+    return f"""
+    (function(){{
+      if (window.__sidebar.prompt) return;
+      window.__sidebar.prompt = {{
+        submit: function() {{
+          const button = document.querySelector({selector});
+          if (!button || button.disabled) return false;
+          button.click();
+          return true;
+        }}
+      }};
+    }})();"""
+
+
+def build_scroll_js() -> str:
+    """Build JavaScript that reads and restores the conversation's scroll position.
+    
+    Exposes ``window.__sidebar.scroll`` with ``get()``, ``restore(y)`` and
+    ``container()``.
+    The scroll container is the nearest scrollable ancestor of the first
+    message (falling back to the document). ``restore`` retries until the
+    conversation is tall enough, for up to five seconds.
+    
+    Returns:
+        str: JavaScript code
+    """
+    selector = json.dumps(ASSISTANT_MESSAGE_SELECTOR)
+    return f"""
+    (function(){{
+      if (window.__sidebar.scroll) return;
+      function container() {{
+        const message = document.querySelector({selector});
+        for (let el = message ? message.parentElement : null; el && el !== document.body; el = el.parentElement) {{
+          const overflow = getComputedStyle(el).overflowY;
+          if ((overflow === 'auto' || overflow === 'scroll') && el.scrollHeight > el.clientHeight) return el;
+        }}
+        return document.scrollingElement;
+      }}
+      window.__sidebar.scroll = {{
+        container: container,
+        get: function() {{ return Math.round(container().scrollTop); }},
+        restore: function(y) {{
+          let tries = 0;
+          (function attempt() {{
+            const el = container();
+            if (el.scrollHeight - el.clientHeight >= y || ++tries > 50) {{ el.scrollTop = y; return; }}
+            setTimeout(attempt, 100);
+          }})();
+          return true;
+        }}
+      }};
+    }})();"""
+
+
+def build_long_chat_js() -> str:
+    """Build JavaScript that keeps long conversations cheap to lay out.
+    
+    Exposes ``window.__sidebar.longChat`` with ``setMode(mode)`` and
+    ``stats()``; the page starts in ``off`` mode. ``contain`` adds a
+    stylesheet giving every conversation turn ``content-visibility: auto``,
+    so off-screen turns skip layout and paint (their last rendered height
+    is remembered). ``collapse`` additionally hides the contents of turns
+    far above the viewport, leaving a placeholder of the same height, and
+    restores them when they come back within range. Turns are tracked with
+    an IntersectionObserver on the scroll container; the DOM is only
+    rescanned for new turns after a debounce, and the last two turns (the
+    one being streamed and its prompt) are never collapsed.
+    
+    Returns:
+        str: JavaScript code
+    """
+    selector = json.dumps(CONVERSATION_TURN_SELECTOR)
+    return f"""
+    (function(){{
+      if (window.__sidebar.longChat) return;
+      const TURN = {selector}, HEIGHT = {LONG_CHAT_INTRINSIC_HEIGHT_PX}, VIEWPORTS = {LONG_CHAT_COLLAPSE_VIEWPORTS};
+      const MIN_TURNS = {LONG_CHAT_COLLAPSE_MIN_TURNS}, SCAN_MS = {LONG_CHAT_SCAN_MS};
+      const COLLAPSED = 'data-sidebar-collapsed';
+      let mode = {json.dumps(LONG_CHAT_OFF)}, style = null, io = null, root = null, mutations = null, timer = null;
+      let observed = new WeakSet(), tail = new Set(), enough = false;
+      const stats = {{ turns: 0, collapses: 0, expands: 0, scans: 0, scanMs: 0 }};
+      
+      function collapse(el) {{
+        el.style.height = el.getBoundingClientRect().height + 'px';
+        el.setAttribute(COLLAPSED, '');
+        stats.collapses++;
+      }}
+      
+      function expand(el) {{
+        el.removeAttribute(COLLAPSED);
+        el.style.height = '';
+        stats.expands++;
+      }}
+      
+      function expandAll() {{
+        document.querySelectorAll('[' + COLLAPSED + ']').forEach(expand);
+      }}
+      
+      function onIntersect(entries) {{
+        for (const e of entries) {{
+          if (e.isIntersecting) {{
+            if (e.target.hasAttribute(COLLAPSED)) expand(e.target);
+          }} else if (enough && !tail.has(e.target) && e.rootBounds &&
+                     e.boundingClientRect.bottom < e.rootBounds.top && !e.target.hasAttribute(COLLAPSED)) {{
+            collapse(e.target);
+          }}
+        }}
+      }}
+      
+      function scan() {{
+        timer = null;
+        const started = performance.now();
+        stats.scans++;
+        const turns = document.querySelectorAll(TURN);
+        stats.turns = turns.length;
+        enough = turns.length >= MIN_TURNS;
+        tail = new Set(Array.prototype.slice.call(turns, -2));
+        tail.forEach(function(el) {{ if (el.hasAttribute(COLLAPSED)) expand(el); }});
+        
+        // The scroll container changes when the app navigates to another chat
+        const container = window.__sidebar.scroll.container();
+        if (container !== root) {{
+          if (io) io.disconnect();
+          root = container;
+          const margin = (VIEWPORTS * 100) + '% 0px ' + (VIEWPORTS * 100) + '% 0px';
+          io = new IntersectionObserver(onIntersect, {{ root: root === document.scrollingElement ? null : root, rootMargin: margin }});
+          observed = new WeakSet();
+        }}
+        for (const el of turns) {{
+          if (!observed.has(el)) {{ observed.add(el); io.observe(el); }}
+        }}
+        stats.scanMs += performance.now() - started;
+      }}
+      
+      function stopCollapsing() {{
+        if (mutations) {{ mutations.disconnect(); mutations = null; }}
+        if (io) {{ io.disconnect(); io = null; root = null; }}
+        clearTimeout(timer);
+        timer = null;
+        expandAll();
+      }}
+      
+      window.__sidebar.longChat = {{
+        setMode: function(next) {{
+          mode = next;
+          if (mode === {json.dumps(LONG_CHAT_OFF)}) {{
+            stopCollapsing();
+            if (style) {{ style.remove(); style = null; }}
+            return true;
+          }}
+          if (!style) {{
+            style = document.createElement('style');
+            style.textContent = TURN + '{{content-visibility:auto;contain-intrinsic-size:auto ' + HEIGHT + 'px;}}' +
+                                TURN + '[' + COLLAPSED + ']>*{{display:none !important;}}';
+            (document.head || document.documentElement).appendChild(style);
+          }}
+          if (mode === {json.dumps(LONG_CHAT_COLLAPSE)}) {{
+            if (!mutations) {{
+              mutations = new MutationObserver(function() {{ if (!timer) timer = setTimeout(scan, SCAN_MS); }});
+              mutations.observe(document.body, {{ childList: true, subtree: true }});
+              scan();
+            }}
+          }} else {{
+            stopCollapsing();
+          }}
+          return true;
+        }},
+        stats: function() {{
+          return {{
+            mode: mode,
+            turns: stats.turns || document.querySelectorAll(TURN).length,
+            collapsed: document.querySelectorAll('[' + COLLAPSED + ']').length,
+            collapses: stats.collapses,
+            expands: stats.expands,
+            scans: stats.scans,
+            scan_ms: Math.round(stats.scanMs * 10) / 10
+          }};
+        }}
+      }};
+    }})();"""
+
+
+def build_perf_monitor_js() -> str:
+    """Build JavaScript that reports long tasks, JS heap and event-loop delay.
+    
+    Dormant until ``window.__sidebar.perf.start(reportMs, sampleMs)``. While
+    running, a ``PerformanceObserver`` counts long tasks (over 50 ms) and a
+    timer probe every ``sampleMs`` measures how late it fires (event-loop
+    delay; skipped while the page is hidden, where timers are throttled).
+    Every ``reportMs`` the window's aggregates and the current JS heap size
+    are sent via ``perfReport`` as a JSON string, and the window is reset.
+    The monitor times its own callbacks and reports them as ``overhead_pct``.
+    
+    Returns:
+        str: JavaScript code
+    """
+    return """
+    (function(){
+      if (window.__sidebar.perf) return;
+      let observer = null, probeTimer = null, reportTimer = null, sampleMs = 0, expected = 0, w = null;
+      
+      function reset() {
+        w = { start: performance.now(), longTasks: 0, longTaskMs: 0, longTaskMaxMs: 0, lags: [], busyMs: 0 };
+      }
+      
+      function round(value) {
+        return Math.round(value * 10) / 10;
+      }
+      
+      function pick(sorted, pct) {
+        return sorted.length ? round(sorted[Math.min(sorted.length - 1, Math.floor(sorted.length * pct))]) : null;
+      }
+      
+      function onLongTasks(list) {
+        const started = performance.now();
+        for (const entry of list.getEntries()) {
+          w.longTasks++;
+          w.longTaskMs += entry.duration;
+          w.longTaskMaxMs = Math.max(w.longTaskMaxMs, entry.duration);
+        }
+        w.busyMs += performance.now() - started;
+      }
+      
+      function probe() {
+        const now = performance.now();
+        if (!document.hidden && w.lags.length < 10000) w.lags.push(Math.max(0, now - expected));
+        expected = now + sampleMs;
+        probeTimer = setTimeout(probe, sampleMs);
+        w.busyMs += performance.now() - now;
+      }
+      
+      function report() {
+        const started = performance.now();
+        const lags = w.lags.slice().sort(function(a, b) { return a - b; });
+        const memory = performance.memory;
+        const payload = {
+          window_ms: Math.round(started - w.start),
+          hidden: document.hidden,
+          long_tasks: w.longTasks,
+          long_task_ms: round(w.longTaskMs),
+          long_task_max_ms: round(w.longTaskMaxMs),
+          lag_samples: lags.length,
+          lag_p50_ms: pick(lags, 0.5),
+          lag_p95_ms: pick(lags, 0.95),
+          lag_max_ms: lags.length ? round(lags[lags.length - 1]) : null,
+          heap_used: memory ? memory.usedJSHeapSize : null,
+          heap_total: memory ? memory.totalJSHeapSize : null,
+          heap_limit: memory ? memory.jsHeapSizeLimit : null
+        };
+        w.busyMs += performance.now() - started;
+        payload.overhead_pct = payload.window_ms ? Math.round(w.busyMs / payload.window_ms * 10000) / 100 : 0;
+        reset();
+        const json = JSON.stringify(payload);
+        window.__sidebar.onReady(function(bridge) { bridge.perfReport(json); });
+      }
+      
+      function stop() {
+        if (observer) { observer.disconnect(); observer = null; }
+        clearTimeout(probeTimer);
+        clearInterval(reportTimer);
+        probeTimer = reportTimer = null;
+      }
+      
+      window.__sidebar.perf = {
+        start: function(reportMs, probeMs) {
+          stop();
+          reset();
+          sampleMs = probeMs;
+          if (window.PerformanceObserver && (PerformanceObserver.supportedEntryTypes || []).indexOf('longtask') >= 0) {
+            observer = new PerformanceObserver(onLongTasks);
+            observer.observe({ type: 'longtask', buffered: true });
+          }
+          expected = performance.now() + sampleMs;
+          probeTimer = setTimeout(probe, sampleMs);
+          reportTimer = setInterval(report, reportMs);
+          return true;
+        },
+        stop: function() {
+          stop();
+          return true;
+        }
+      };
+    })();"""
+
+
+def build_response_observer_js() -> str:
+    """Build JavaScript that streams the active assistant message as deltas.
+    
+    Dormant until ``window.__sidebar.responses.enable(true)``. While enabled,
+    a MutationObserver batches DOM changes and, after a short flush delay,
+    compares the last assistant message's text with what was already sent.
+    Appended text goes to Python as a ``delta`` event; rewritten text as a
+    ``reset`` event with the full text; ``done`` follows when the stop
+    button disappears. Events are JSON strings sent via ``responseEvent``.
+    
+    Mutations inside the known message don't trigger a DOM query, so the
+    cost per flush is one ``textContent`` read. Time spent in the observer
+    is measured; if it exceeds the CPU budget over a one-second window the
+    flush delay doubles (up to a maximum), and it recovers when usage drops.
+    
+    Returns:
+        str: JavaScript code
+    """
+    message_selector = json.dumps(ASSISTANT_MESSAGE_SELECTOR)
+    stop_selector = json.dumps(STOP_BUTTON_SELECTOR)
+    return f"""
+    (function(){{
+      if (window.__sidebar.responses) return;
+      const BASE_MS = {RESPONSE_FLUSH_MS}, MAX_MS = {RESPONSE_FLUSH_MAX_MS}, BUDGET_PCT = {RESPONSE_CPU_BUDGET_PCT};
+      let observer = null, timer = null, requery = true, interval = BASE_MS;
+      let current = null, currentId = null, sent = '', seq = 0, streaming = false, anonymous = 0;
+      const stats = {{ busyMs: 0, flushes: 0, events: 0, windowStart: 0, windowBusyMs: 0, lastPct: 0, enabledAt: 0 }};
+      
+      function send(event) {{
+        stats.events++;
+        const payload = JSON.stringify(event);
+        window.__sidebar.onReady(function(bridge) {{ bridge.responseEvent(payload); }});
+      }}
+      
+      function messageId(el) {{
+        if (!el.dataset.sidebarId) el.dataset.sidebarId = el.getAttribute('data-message-id') || ('m' + (++anonymous));
+        return el.dataset.sidebarId;
+      }}
+      
+      function account(started) {{
+        const now = performance.now();
+        const spent = now - started;
+        stats.busyMs += spent;
+        stats.windowBusyMs += spent;
+        const span = now - stats.windowStart;
+        if (span < 1000) return;
+        stats.lastPct = stats.windowBusyMs / span * 100;
+        if (stats.lastPct > BUDGET_PCT) interval = Math.min(interval * 2, MAX_MS);
+        else if (stats.lastPct < BUDGET_PCT / 2) interval = Math.max(interval / 2, BASE_MS);
+        stats.windowStart = now;
+        stats.windowBusyMs = 0;
+      }}
+      
+      function track(el) {{
+        current = el;
+        currentId = el ? messageId(el) : null;
+        sent = el ? el.textContent : '';
+        seq = 0;
+      }}
+      
+      function flush() {{
+        timer = null;
+        const started = performance.now();
+        stats.flushes++;
+        
+        if (requery) {{
+          requery = false;
+          const all = document.querySelectorAll({message_selector});
+          const last = all.length ? all[all.length - 1] : null;
+          if (last !== current) {{
+            if (current && streaming) send({{ type: 'done', message: currentId, seq: seq++, length: sent.length }});
+            current = last;
+            currentId = last ? messageId(last) : null;
+            sent = '';
+            seq = 0;
+          }}
+        }}
+        
+        if (current) {{
+          const text = current.textContent;
+          if (text !== sent) {{
+            if (text.startsWith(sent)) send({{ type: 'delta', message: currentId, seq: seq++, delta: text.slice(sent.length) }});
+            else send({{ type: 'reset', message: currentId, seq: seq++, text: text }});
+            sent = text;
+          }}
+        }}
+        
+        const nowStreaming = !!document.querySelector({stop_selector});
+        if (streaming && !nowStreaming && current) send({{ type: 'done', message: currentId, seq: seq++, length: sent.length }});
+        streaming = nowStreaming;
+        account(started);
+      }}
+      
+      function onMutations(records) {{
+        const started = performance.now();
+        if (!requery) {{
+          for (const r of records) {{
+            if (!current || !current.contains(r.target)) {{ requery = true; break; }}
+          }}
+        }}
+        if (!timer) timer = setTimeout(flush, interval);
+        account(started);
+      }}
+      
+      window.__sidebar.responses = {{
+        enable: function(on) {{
+          if (on && !observer) {{
+            const all = document.querySelectorAll({message_selector});
+            track(all.length ? all[all.length - 1] : null);
+            streaming = !!document.querySelector({stop_selector});
+            requery = false;
+            stats.windowStart = stats.enabledAt = performance.now();
+            observer = new MutationObserver(onMutations);
+            observer.observe(document.body, {{ childList: true, subtree: true, characterData: true }});
+          }} else if (!on && observer) {{
+            observer.disconnect();
+            observer = null;
+            clearTimeout(timer);
+            timer = null;
+          }}
+          return true;
+        }},
+        stats: function() {{
+          const enabledMs = observer ? performance.now() - stats.enabledAt : 0;
+          return {{
+            enabled: !!observer,
+            flush_ms: interval,
+            budget_pct: BUDGET_PCT,
+            last_window_pct: Math.round(stats.lastPct * 100) / 100,
+            average_pct: enabledMs ? Math.round(stats.busyMs / enabledMs * 10000) / 100 : 0,
+            busy_ms: Math.round(stats.busyMs * 10) / 10,
+            flushes: stats.flushes,
+            events: stats.events
+          }};
+        }}
+      }};
+    }})();"""
@@ -0,0 +1,377 @@
+"""Chat tabs backed by pages on the shared profile.
+
+Each tab owns at most one ``SidebarPage``. Pages are created lazily the
+first time a tab is shown, and only ``max_live`` of them are kept: when
+the limit is exceeded, the least recently used background tab is
+discarded to its URL and scroll position, and its page (and renderer) is
+released. Showing a discarded tab loads the URL again and restores the
+scroll position once the conversation has rendered.
+"""
+
+import itertools
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+from PySide6.QtCore import QObject, QTimer, QUrl, Signal
+from PySide6.QtWebEngineCore import QWebEngineScript
+
+from .page import SidebarPage
+from ..constants import MAX_LIVE_TABS, TAB_SCROLL_CAPTURE_TIMEOUT_MS
+from ..utils.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class ChatTab:
+    """One conversation tab."""
+    
+    def __init__(self, tab_id: int, url: str, title: str = "", scroll_y: int = 0) -> None:
+        self.id = tab_id
+        self.url = url
+        self.title = title
+        self.scroll_y = scroll_y
+        self.page: Optional[SidebarPage] = None
+        self.last_used = time.monotonic()
+
+
+class TabSet(QObject):
+    """Ordered set of chat tabs with an LRU limit on live pages."""
+    
+    # Emitted when tabs are added, removed, renamed or activated
+    changed = Signal()
+    
+    def __init__(self, new_page: Callable[[], SidebarPage], show_page: Callable[[SidebarPage], None],
+                 parent: Optional[QObject] = None) -> None:
+        """Initialize an empty tab set.
+        
+        Args:
+            new_page: Creates an unconnected page on the shared profile
+            show_page: Puts a page into the view
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self._new_page = new_page
+        self._show_page = show_page
+        self._tabs: List[ChatTab] = []
+        self._active: Optional[ChatTab] = None
+        self._ids = itertools.count(1)
+        self._max_live = MAX_LIVE_TABS
+        self._discards = 0
+    
+    def adopt(self, page: SidebarPage) -> ChatTab:
+        """Make an already visible page the first tab.
+        
+        Args:
+            page: Page currently in the view
+            
+        Returns:
+            ChatTab: New active tab
+        """
+        tab = ChatTab(next(self._ids), page.url().toString())
+        self._attach(tab, page)
+        self._tabs.append(tab)
+        self._active = tab
+        self.changed.emit()
+        return tab
+    
+    def open(self, url: str, activate: bool = True) -> ChatTab:
+        """Add a tab.
+        
+        Args:
+            url: URL of the tab
+            activate: Show the tab now (otherwise its page is created on first activation)
+            
+        Returns:
+            ChatTab: New tab
+        """
+        tab = ChatTab(next(self._ids), url)
+        self._tabs.append(tab)
+        if activate:
+            self.activate(tab.id)
+        else:
+            self.changed.emit()
+        return tab
+    
+    def restore(self, url: str, title: str, scroll_y: int) -> ChatTab:
+        """Add a discarded tab from a saved session.
+        
+        Args:
+            url: Saved URL
+            title: Saved title
+            scroll_y: Saved scroll position
+            
+        Returns:
+            ChatTab: New tab (no page until it is activated)
+        """
+        tab = ChatTab(next(self._ids), url, title, scroll_y)
+        self._tabs.append(tab)
+        self.changed.emit()
+        return tab
+    
+    def activate(self, tab_id: int) -> None:
+        """Show a tab, recreating its page if it was discarded.
+        
+        Args:
+            tab_id: Tab to show
+        """
+        tab = self._get(tab_id)
+        if tab is None or tab is self._active:
+            return
+        # Remember where the tab being switched away from was scrolled to
+        if self._active is not None and self._active.page is not None:
+            self._remember_scroll(self._active)
+        if tab.page is None:
+            page = self._new_page()
+            self._attach(tab, page)
+            if tab.scroll_y:
+                self._restore_scroll(page, tab.scroll_y)
+            page.load(QUrl(tab.url))
+        
+        tab.last_used = time.monotonic()
+        self._active = tab
+        self._show_page(tab.page)
+        self._enforce_limit()
+        self.changed.emit()
+    
+    def close(self, tab_id: int) -> None:
+        """Close a tab (the last tab can't be closed).
+        
+        Args:
+            tab_id: Tab to close
+        """
+        tab = self._get(tab_id)
+        if tab is None or len(self._tabs) == 1:
+            return
+        index = self._tabs.index(tab)
+        self._tabs.remove(tab)
+        if tab is self._active:
+            # Show the neighbour first so the closing page is out of the view
+            self._active = None
+            self.activate(self._tabs[min(index, len(self._tabs) - 1)].id)
+        if tab.page is not None:
+            tab.page.deleteLater()
+            tab.page = None
+        self.changed.emit()
+    
+    def replace_active_page(self, page: SidebarPage) -> Optional[SidebarPage]:
+        """Swap the active tab's page (renderer recovery, standby page).
+        
+        The tab takes over the new page's URL and title, which a preloaded
+        page reported before it was attached.
+        
+        Args:
+            page: New page for the active tab
+            
+        Returns:
+            Optional[SidebarPage]: The previous page, for the caller to dispose of
+        """
+        tab = self._active
+        old_page = tab.page
+        self._attach(tab, page)
+        self._on_url_changed(tab, page, page.url())
+        if page.title():
+            tab.title = page.title()
+        self.changed.emit()
+        return old_page
+    
+    def active(self) -> Optional[ChatTab]:
+        """Get the active tab.
+        
+        Returns:
+            Optional[ChatTab]: Active tab
+        """
+        return self._active
+    
+    def tabs(self) -> List[ChatTab]:
+        """Get all tabs in display order.
+        
+        Returns:
+            List[ChatTab]: Tabs
+        """
+        return list(self._tabs)
+    
+    def capture_scroll(self, callback: Callable[[], None]) -> None:
+        """Read the scroll position of every live tab.
+        
+        Args:
+            callback: Called once every live page has answered (or timed out)
+        """
+        live = [tab for tab in self._tabs if tab.page is not None]
+        if not live:
+            callback()
+            return
+        
+        pending = [len(live)]
+        
+        def on_captured() -> None:
+            pending[0] -= 1
+            if pending[0] == 0:
+                callback()
+        
+        for tab in live:
+            self._remember_scroll(tab, on_captured)
+    
+    def set_max_live(self, max_live: int) -> None:
+        """Set how many tabs may keep a live page.
+        
+        Args:
+            max_live: Maximum live pages (at least 1, the active tab)
+        """
+        self._max_live = max(1, max_live)
+        self._enforce_limit()
+    
+    def get_diagnostics(self) -> Dict[str, Any]:
+        """Report tabs with their renderer process and its memory use.
+        
+        Returns:
+            Dict[str, Any]: Limit, discard count and per-tab details
+        """
+        # Lazy import memory_win (Win32 only)
+        try:
+            from ..platform.memory_win import get_process_memory
+        except (ImportError, AttributeError, OSError):
+            get_process_memory = None
+        
+        pids = [tab.page.renderProcessPid() for tab in self._tabs if tab.page is not None]
+        now = time.monotonic()
+        tabs = []
+        for tab in self._tabs:
+            entry = {
+                "id": tab.id,
+                "title": tab.title,
+                "url": tab.url,
+                "active": tab is self._active,
+                "live": tab.page is not None,
+                "idle_s": round(now - tab.last_used, 1),
+            }
+            if tab.page is not None:
+                pid = tab.page.renderProcessPid()
+                entry["renderer_pid"] = pid
+                entry["shared_renderer"] = pids.count(pid) > 1
+                if get_process_memory and pid > 0:
+                    entry["memory"] = get_process_memory(pid)
+            tabs.append(entry)
+        return {"max_live": self._max_live, "discards": self._discards, "tabs": tabs}
+    
+    def _get(self, tab_id: int) -> Optional[ChatTab]:
+        """Find a tab by id.
+        
+        Args:
+            tab_id: Tab id
+            
+        Returns:
+            Optional[ChatTab]: The tab, or None
+        """
+        return next((tab for tab in self._tabs if tab.id == tab_id), None)
+    
+    def _attach(self, tab: ChatTab, page: SidebarPage) -> None:
+        """Give a tab its page and track the page's title and URL.
+        
+        Args:
+            tab: Tab
+            page: Page to attach
+        """
+        tab.page = page
+        page.titleChanged.connect(lambda title: self._on_title_changed(tab, page, title))
+        page.urlChanged.connect(lambda url: self._on_url_changed(tab, page, url))
+    
+    def _on_title_changed(self, tab: ChatTab, page: SidebarPage, title: str) -> None:
+        """Rename a tab after its page's title.
+        
+        Args:
+            tab: Tab
+            page: Page that reported the title
+            title: New title
+        """
+        if tab.page is page and title != tab.title:
+            tab.title = title
+            self.changed.emit()
+    
+    def _on_url_changed(self, tab: ChatTab, page: SidebarPage, url: QUrl) -> None:
+        """Remember a tab's URL for discarding and session restore.
+        
+        Args:
+            tab: Tab
+            page: Page that navigated
+            url: New URL
+        """
+        if tab.page is page and url.scheme() in ("http", "https"):
+            tab.url = url.toString()
+    
+    def _enforce_limit(self) -> None:
+        """Discard least recently used background tabs above the live limit."""
+        live = [tab for tab in self._tabs if tab.page is not None and tab is not self._active]
+        live.sort(key=lambda tab: tab.last_used)
+        while len(live) + 1 > self._max_live:
+            self._discard(live.pop(0))
+    
+    def _discard(self, tab: ChatTab) -> None:
+        """Release a background tab's page, keeping its URL and scroll position.
+        
+        Args:
+            tab: Tab to discard
+        """
+        page, tab.page = tab.page, None
+        self._discards += 1
+        logger.info(f"Discarding tab {tab.id} ({tab.url})")
+        
+        def release(scroll_y) -> None:
+            if isinstance(scroll_y, (int, float)):
+                tab.scroll_y = int(scroll_y)
+            page.deleteLater()
+        
+        self._read_scroll(page, release)
+        self.changed.emit()
+    
+    def _remember_scroll(self, tab: ChatTab, callback: Optional[Callable[[], None]] = None) -> None:
+        """Update a live tab's saved scroll position from its page.
+        
+        Args:
+            tab: Tab with a page
+            callback: Called once the position is read (or timed out)
+        """
+        page = tab.page
+        
+        def on_scroll(scroll_y) -> None:
+            # Ignore the answer if the tab was discarded or got a new page meanwhile
+            if tab.page is page and isinstance(scroll_y, (int, float)):
+                tab.scroll_y = int(scroll_y)
+            if callback:
+                callback()
+        
+        self._read_scroll(page, on_scroll)
+    
+    def _read_scroll(self, page: SidebarPage, callback: Callable[[Any], None]) -> None:
+        """Ask a page for its chat scroll position.
+        
+        Args:
+            page: Page to query
+            callback: Called exactly once with the position, or None if the page doesn't answer
+        """
+        answered = []
+        
+        def reply(scroll_y) -> None:
+            if answered:
+                return
+            answered.append(True)
+            callback(scroll_y)
+        
+        # A hung (or frozen) renderer never answers, so don't wait for it forever
+        QTimer.singleShot(TAB_SCROLL_CAPTURE_TIMEOUT_MS, lambda: reply(None))
+        page.runJavaScript("window.__sidebar && window.__sidebar.scroll ? window.__sidebar.scroll.get() : 0",
+                           QWebEngineScript.ApplicationWorld, reply)
+    
+    def _restore_scroll(self, page: SidebarPage, scroll_y: int) -> None:
+        """Scroll a recreated page back to where it was once the chat has rendered.
+        
+        Args:
+            page: Recreated page
+            scroll_y: Saved scroll position
+        """
+        def on_ready() -> None:
+            page.composer_ready.disconnect(on_ready)
+            page.runJavaScript(f"window.__sidebar.scroll.restore({json.dumps(scroll_y)})",
+                               QWebEngineScript.ApplicationWorld)
+        
+        page.composer_ready.connect(on_ready)
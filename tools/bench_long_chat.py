@@ -0,0 +1,299 @@
+"""Layout and scroll benchmark for long conversations.
+
+Loads ``tools/standin/long_chat.html`` (a synthetic conversation of
+``--turns`` messages) into a sidebar-sized ``SidebarPage`` under
+``QT_QPA_PLATFORM=offscreen``, once per long conversation mode, and
+measures inside the page:
+
+- resize: forced relayout after the thread's width changes (narrow sidebar drag)
+- scroll: frame intervals while scrolling from the bottom to the top
+- input: forced relayout after typing a character into the composer
+
+Each mode runs in a fresh off-the-record page. Results are printed with
+the change against ``off`` and can be written to JSON.
+
+Usage:
+    python tools/bench_long_chat.py --turns 500 --runs 3 --output long_chat.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEventLoop, QTimer, QUrl
+from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEngineScript
+from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWidgets import QApplication
+
+from benchmark_startup import ROOT, percentile, start_standin_server
+
+sys.path.insert(0, str(ROOT / "src"))
+from chatgpt_sidebar.constants import LONG_CHAT_OFF, LONG_CHAT_CONTAIN, LONG_CHAT_COLLAPSE, LONG_CHAT_SCAN_MS
+from chatgpt_sidebar.web.page import SidebarPage
+
+
+MODES = [LONG_CHAT_OFF, LONG_CHAT_CONTAIN, LONG_CHAT_COLLAPSE]
+METRICS = ["resize_ms", "scroll_frame_ms", "input_ms"]
+POLL_INTERVAL_MS = 100
+
+# Runs in the page's main world with (resizes, inputs); leaves its result in window.__bench
+HARNESS_JS = """
+(async function(resizes, inputs) {
+  const thread = document.getElementById('thread');
+  const box = document.getElementById('prompt-textarea');
+  const frame = () => new Promise(resolve => requestAnimationFrame(resolve));
+  const result = { resize_ms: [], scroll_frame_ms: [], input_ms: [] };
+  const width = thread.clientWidth;
+
+  for (let i = 0; i < resizes; i++) {
+    const started = performance.now();
+    thread.style.width = (width - 20 + (i % 2) * 40) + 'px';
+    void thread.scrollHeight;
+    result.resize_ms.push(performance.now() - started);
+    await frame();
+  }
+  thread.style.width = '';
+  thread.scrollTop = thread.scrollHeight;
+  await frame();
+
+  let last = await frame();
+  const step = Math.max(1, thread.clientHeight / 2);
+  const scrollStarted = performance.now();
+  while (thread.scrollTop > 0) {
+    thread.scrollTop = Math.max(0, thread.scrollTop - step);
+    const now = await frame();
+    result.scroll_frame_ms.push(now - last);
+    last = now;
+  }
+  result.scroll_total_ms = performance.now() - scrollStarted;
+  thread.scrollTop = thread.scrollHeight;
+  await frame();
+
+  for (let i = 0; i < inputs; i++) {
+    const started = performance.now();
+    box.textContent += 'x';
+    void box.offsetHeight;
+    result.input_ms.push(performance.now() - started);
+    await frame();
+  }
+  box.textContent = '';
+
+  result.elements = document.getElementsByTagName('*').length;
+  window.__bench = result;
+})
+"""
+
+
+def run_js(page: SidebarPage, js: str, world: int = QWebEngineScript.MainWorld, timeout_ms: int = 10000) -> Any:
+    """Run JavaScript and wait for its result.
+    
+    Args:
+        page: Page to run it in
+        js: JavaScript expression
+        world: World to run it in
+        timeout_ms: Time to wait for the result
+        
+    Returns:
+        Any: Result (None on timeout)
+    """
+    loop = QEventLoop()
+    result = []
+    
+    def on_result(value) -> None:
+        result.append(value)
+        loop.quit()
+    
+    QTimer.singleShot(timeout_ms, loop.quit)
+    page.runJavaScript(js, world, on_result)
+    if not result:
+        loop.exec()
+    return result[0] if result else None
+
+
+def wait_until(condition: Callable[[], bool], timeout_ms: int) -> bool:
+    """Process events until a condition holds.
+    
+    Args:
+        condition: Checked every poll interval
+        timeout_ms: Give up after this long
+        
+    Returns:
+        bool: Whether the condition was met
+    """
+    deadline = time.monotonic() + timeout_ms / 1000
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        loop = QEventLoop()
+        QTimer.singleShot(POLL_INTERVAL_MS, loop.quit)
+        loop.exec()
+    return True
+
+
+def wait_ms(ms: int) -> None:
+    """Process events for a while.
+    
+    Args:
+        ms: Time to wait
+    """
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def run_mode(url: str, mode: str, width: int, height: int, resizes: int, inputs: int,
+             timeout_ms: int) -> Optional[Dict[str, Any]]:
+    """Load the long conversation in one mode and measure it.
+    
+    Args:
+        url: Stand-in page URL
+        mode: Long conversation mode
+        width: View width in pixels
+        height: View height in pixels
+        resizes: Number of width changes
+        inputs: Number of typed characters
+        timeout_ms: Time allowed for loading and for the measurement
+        
+    Returns:
+        Optional[Dict[str, Any]]: Raw samples and page statistics, or None on timeout
+    """
+    profile = QWebEngineProfile()
+    view = QWebEngineView()
+    page = SidebarPage(profile, view)
+    view.setPage(page)
+    view.resize(width, height)
+    page.set_long_chat_mode(mode)
+    view.show()
+    try:
+        page.load(QUrl(url))
+        if not wait_until(page.is_composer_ready, timeout_ms):
+            return None
+        
+        # Let the long chat script scan the turns and collapse the ones out of range
+        wait_ms(LONG_CHAT_SCAN_MS + 500)
+        
+        run_js(page, f"{HARNESS_JS}({resizes}, {inputs});")
+        samples = {}
+        
+        def finished() -> bool:
+            samples["value"] = run_js(page, "JSON.stringify(window.__bench || null)")
+            return samples["value"] not in (None, "null")
+        
+        if not wait_until(finished, timeout_ms):
+            return None
+        result = json.loads(samples["value"])
+        result["long_chat"] = run_js(page, "window.__sidebar.longChat.stats()", QWebEngineScript.ApplicationWorld)
+        return result
+    finally:
+        view.close()
+        page.deleteLater()
+        view.deleteLater()
+        profile.deleteLater()
+
+
+def summarize(samples: List[float]) -> Optional[Dict[str, float]]:
+    """Summarize samples of one metric.
+    
+    Args:
+        samples: Values in ms
+        
+    Returns:
+        Optional[Dict[str, float]]: n, p50, p95, max and mean, or None without samples
+    """
+    if not samples:
+        return None
+    return {
+        "n": len(samples),
+        "p50": round(percentile(samples, 50), 2),
+        "p95": round(percentile(samples, 95), 2),
+        "max": round(max(samples), 2),
+        "mean": round(sum(samples) / len(samples), 2),
+    }
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark long conversation rendering modes")
+    parser.add_argument("--turns", type=int, default=500, help="Messages in the synthetic conversation (default: 500)")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per mode (default: 3)")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=MODES, help="Modes to measure")
+    parser.add_argument("--width", type=int, default=420, help="View width in pixels (default: 420)")
+    parser.add_argument("--height", type=int, default=900, help="View height in pixels (default: 900)")
+    parser.add_argument("--resizes", type=int, default=40, help="Width changes per run (default: 40)")
+    parser.add_argument("--inputs", type=int, default=40, help="Characters typed per run (default: 40)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-run timeout in seconds")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    app = QApplication(sys.argv[:1])
+    server = start_standin_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/long_chat.html?turns={args.turns}"
+    
+    raw: Dict[str, Dict[str, List[float]]] = {mode: {metric: [] for metric in METRICS} for mode in args.modes}
+    runs: Dict[str, List[Dict[str, Any]]] = {mode: [] for mode in args.modes}
+    try:
+        for i in range(1, args.runs + 1):
+            for mode in args.modes:
+                result = run_mode(url, mode, args.width, args.height, args.resizes, args.inputs,
+                                  int(args.timeout * 1000))
+                if result is None:
+                    print(f"Run {i}/{args.runs} {mode}: timed out")
+                    continue
+                for metric in METRICS:
+                    raw[mode][metric].extend(result[metric])
+                runs[mode].append({
+                    "scroll_total_ms": round(result["scroll_total_ms"], 1),
+                    "elements": result["elements"],
+                    "long_chat": result["long_chat"],
+                })
+                collapsed = (result["long_chat"] or {}).get("collapsed", 0)
+                print(f"Run {i}/{args.runs} {mode}: scroll {result['scroll_total_ms']:.0f} ms, "
+                      f"{collapsed} turns collapsed")
+    finally:
+        server.shutdown()
+    
+    summary = {mode: {metric: summarize(raw[mode][metric]) for metric in METRICS} for mode in args.modes}
+    
+    print("=" * 80)
+    print(f"{'Mode':<10} {'Metric':<16} {'p50':>9} {'p95':>9} {'max':>9} {'p50 vs off':>12}")
+    print("-" * 80)
+    for mode in args.modes:
+        for metric in METRICS:
+            stats = summary[mode][metric]
+            if stats is None:
+                print(f"{mode:<10} {metric:<16} {'n/a':>9}")
+                continue
+            base = (summary.get(LONG_CHAT_OFF) or {}).get(metric)
+            delta = ""
+            if base and base["p50"] and mode != LONG_CHAT_OFF:
+                delta = f"{(stats['p50'] - base['p50']) / base['p50'] * 100:+.1f}%"
+            print(f"{mode:<10} {metric:<16} {stats['p50']:>9.2f} {stats['p95']:>9.2f} {stats['max']:>9.2f} {delta:>12}")
+    print("=" * 80)
+    
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "turns": args.turns,
+                "runs": args.runs,
+                "width": args.width,
+                "height": args.height,
+            },
+            "runs": runs,
+            "summary": summary,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Benchmark the precompiled startup bundle against the normal module layout.
+
+Starts fresh interpreters that import the modules needed before the first
+window, once from the source tree and once with ``CHATGPT_SIDEBAR_BUNDLE``
+pointing at a bundle (see ``build_startup_bundle.py``), each cold and warm:
+
+- cold: every run gets an empty ``PYTHONPYCACHEPREFIX``, so no module is
+  loaded from a ``.pyc`` cache (a first launch after installing or updating)
+- warm: the runs share a bytecode cache primed by one discarded run
+
+The OS file cache is not flushed, so "cold" isolates Python's own work.
+Each run reports the import time measured inside the interpreter and the
+process time from launch to exit. With ``--full`` every run launches the
+app against the stand-in page instead (as ``benchmark_startup.py`` does)
+and first paint and composer-ready are reported.
+
+Usage:
+    python tools/bench_startup_bundle.py --runs 10
+    python tools/bench_startup_bundle.py --bundle build/startup.bundle --full --output bundle_bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmark_startup import ROOT, percentile, run_once, start_standin_server
+from report_imports import STARTUP_IMPORT
+
+
+BUNDLE_ENV = "CHATGPT_SIDEBAR_BUNDLE"
+
+LAYOUTS = ["source", "bundle"]
+MODES = ["cold", "warm"]
+
+# Prints the import time of the first-window modules in ms
+IMPORT_SCRIPT = f"import time; t0 = time.perf_counter(); {STARTUP_IMPORT}; print((time.perf_counter() - t0) * 1000)"
+
+
+def build_bundle(path: Path) -> None:
+    """Build a bundle with build_startup_bundle.py.
+    
+    Args:
+        path: Bundle file to write
+    """
+    subprocess.run([sys.executable, str(Path(__file__).resolve().parent / "build_startup_bundle.py"),
+                    "--output", str(path)], check=True)
+
+
+def import_once(env: Dict[str, str]) -> Dict[str, float]:
+    """Import the first-window modules in a fresh interpreter.
+    
+    Args:
+        env: Environment of the interpreter
+        
+    Returns:
+        Dict[str, float]: Import time and process time in ms
+    """
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True, env=env)
+    process_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "Import failed")
+        sys.exit(1)
+    return {"import_ms": float(proc.stdout.strip().splitlines()[-1]), "process_ms": process_ms}
+
+
+def run_series(layout: str, mode: str, runs: int, bundle: Path, url: Optional[str], timeout_s: float) -> List[Dict]:
+    """Measure one layout in one mode.
+    
+    Args:
+        layout: "source" or "bundle"
+        mode: "cold" or "warm"
+        runs: Number of measured runs
+        bundle: Bundle file (used by the bundle layout)
+        url: Stand-in page URL for full app launches (None for import-only runs)
+        timeout_s: Per-run timeout of full app launches
+        
+    Returns:
+        List[Dict]: Per-run results
+    """
+    extra_env = {}
+    if layout == "bundle":
+        extra_env[BUNDLE_ENV] = str(bundle)
+    
+    results = []
+    with tempfile.TemporaryDirectory(prefix="sidebar-bench-pycache-") as cache_root:
+        # Warm runs share one primed cache; cold runs each start from an empty one
+        for i in range(runs + (1 if mode == "warm" else 0)):
+            cache = Path(cache_root) / ("shared" if mode == "warm" else str(i))
+            run_env = dict(extra_env, PYTHONPYCACHEPREFIX=str(cache))
+            if url is not None:
+                result = run_once(url, timeout_s, None, ["--no-single-instance"], run_env)
+                result = {"first_paint": result["first_paint"], "composer_ready": result["composer_ready"]}
+            else:
+                env = dict(os.environ, **run_env)
+                env.pop("PYTHONDONTWRITEBYTECODE", None)
+                env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+                result = import_once(env)
+            if mode == "warm" and i == 0:
+                continue  # Priming run
+            results.append(result)
+    return results
+
+
+def summarize(runs: List[Dict]) -> Dict[str, Optional[Dict[str, float]]]:
+    """Compute p50 and p90 for each metric.
+    
+    Args:
+        runs: Per-run results
+        
+    Returns:
+        Dict: Metric name to {p50, p90, n}, or None if never reached
+    """
+    summary = {}
+    for metric in runs[0]:
+        values = [r[metric] for r in runs if r[metric] is not None]
+        summary[metric] = {
+            "n": len(values),
+            "p50": round(percentile(values, 50), 1),
+            "p90": round(percentile(values, 90), 1),
+        } if values else None
+    return summary
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Compare cold and warm start with and without the startup bundle")
+    parser.add_argument("--runs", type=int, default=10, help="Measured runs per layout and mode (default: 10)")
+    parser.add_argument("--bundle", type=Path, help="Bundle to test (default: build a temporary one)")
+    parser.add_argument("--full", action="store_true",
+                        help="Launch the app against the stand-in page instead of only importing it")
+    parser.add_argument("--delay-ms", type=int, default=300,
+                        help="Simulated composer hydration delay of the stand-in page (--full)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-run timeout in seconds (--full)")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    args = parser.parse_args()
+    
+    tmp = tempfile.TemporaryDirectory(prefix="sidebar-bench-bundle-")
+    bundle = args.bundle
+    if bundle is None:
+        bundle = Path(tmp.name) / "startup.bundle"
+        build_bundle(bundle)
+    
+    server = start_standin_server() if args.full else None
+    url = f"http://127.0.0.1:{server.server_address[1]}/index.html?delay={args.delay_ms}" if server else None
+    
+    results = {}
+    try:
+        for mode in MODES:
+            for layout in LAYOUTS:
+                print(f"{layout} / {mode}: {args.runs} runs...")
+                runs = run_series(layout, mode, args.runs, bundle, url, args.timeout)
+                results[f"{layout}/{mode}"] = {"runs": runs, "summary": summarize(runs)}
+    finally:
+        if server:
+            server.shutdown()
+        tmp.cleanup()
+    
+    metrics = list(next(iter(results.values()))["summary"])
+    print("=" * 80)
+    print(f"{'Layout / mode':<16}" + "".join(f"{metric + ' p50':>20}{'p90':>9}" for metric in metrics))
+    print("-" * 80)
+    for name, result in results.items():
+        cells = ""
+        for metric in metrics:
+            stats = result["summary"][metric]
+            cells += f"{stats['p50']:>20.1f}{stats['p90']:>9.1f}" if stats else f"{'n/a':>20}{'':>9}"
+        print(f"{name:<16}{cells}")
+    print("-" * 80)
+    for mode in MODES:
+        source = results[f"source/{mode}"]["summary"][metrics[-1]]
+        bundled = results[f"bundle/{mode}"]["summary"][metrics[-1]]
+        if source and bundled and source["p50"]:
+            delta = (bundled["p50"] - source["p50"]) / source["p50"] * 100
+            print(f"{mode}: bundle {delta:+.1f}% {metrics[-1]} p50 vs. source")
+    print("=" * 80)
+    
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "runs": args.runs,
+                "full": args.full,
+                "bundle": str(args.bundle) if args.bundle else None,
+            },
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""Widget construction and style polish benchmark.
+
+Builds the themed widgets (control bar, tab strip, settings and
+diagnostics pages) under ``QT_QPA_PLATFORM=offscreen`` and measures, per
+widget:
+
+- construct: creating the widget tree
+- polish: resolving every widget's style (``ensurePolished``) and laying it out
+
+With the compiled application stylesheet (``ui/stylesheet.py``) the sheet
+is applied once before the first widget, and that time is reported as
+``apply_stylesheet``. ``--src`` runs against another source tree, e.g. a
+worktree of an older revision that still styled each widget separately, so
+the two can be compared with ``--output`` / ``--compare``.
+
+Usage:
+    python tools/bench_styles.py --runs 20 --output styles.json
+    git worktree add ../sidebar-before HEAD~1
+    python tools/bench_styles.py --src ../sidebar-before/src --output before.json
+    python tools/bench_styles.py --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+from benchmark_startup import ROOT, percentile
+
+
+METRICS = ["construct_ms", "polish_ms"]
+
+
+def polish(widget: QWidget) -> None:
+    """Resolve the styles and layout of a widget tree as the first show would.
+    
+    Args:
+        widget: Top-level widget of the tree
+    """
+    widget.ensurePolished()
+    for child in widget.findChildren(QWidget):
+        child.ensurePolished()
+    if widget.layout() is not None:
+        widget.layout().activate()
+
+
+def measure(factory: Callable[[], QWidget], app: QApplication) -> Dict[str, float]:
+    """Build and polish one widget tree.
+    
+    Args:
+        factory: Creates the widget
+        app: Application (used to flush deferred deletes)
+        
+    Returns:
+        Dict[str, float]: Construct and polish time in ms
+    """
+    t0 = time.perf_counter()
+    widget = factory()
+    t1 = time.perf_counter()
+    polish(widget)
+    t2 = time.perf_counter()
+    widget.deleteLater()
+    app.processEvents()
+    return {"construct_ms": (t1 - t0) * 1000, "polish_ms": (t2 - t1) * 1000}
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    """Compute the first run and percentiles of the later runs.
+    
+    Args:
+        values: Per-run times in ms (first run first)
+        
+    Returns:
+        Dict[str, float]: first, p50, p90 and n
+    """
+    rest = values[1:] or values
+    return {
+        "n": len(values),
+        "first": round(values[0], 2),
+        "p50": round(percentile(rest, 50), 2),
+        "p90": round(percentile(rest, 90), 2),
+    }
+
+
+def compare(summary: Dict, baseline_file: Path) -> None:
+    """Print p50 deltas against a baseline result file.
+    
+    Args:
+        summary: Current summary
+        baseline_file: Earlier JSON output of this script
+    """
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))["summary"]
+    print(f"{'Widget / metric':<32} {'Baseline p50':>14} {'Current p50':>14} {'Delta':>9}")
+    print("-" * 72)
+    for name, stats in summary.items():
+        base = baseline.get(name)
+        if not base or not base["p50"]:
+            continue
+        delta = (stats["p50"] - base["p50"]) / base["p50"] * 100
+        print(f"{name:<32} {base['p50']:>14.2f} {stats['p50']:>14.2f} {delta:>+8.1f}%")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark widget construction and style polish")
+    parser.add_argument("--runs", type=int, default=20, help="Builds per widget (default: 20)")
+    parser.add_argument("--theme", choices=["light", "dark"], default="dark", help="Palette (default: dark)")
+    parser.add_argument("--src", type=Path, default=ROOT / "src", help="Source tree to import the app from")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Compare p50s against an earlier JSON result")
+    args = parser.parse_args()
+    
+    sys.path.insert(0, str(args.src.resolve()))
+    from chatgpt_sidebar.settings.config import Config
+    from chatgpt_sidebar.ui.diagnostics_view import DiagnosticsView
+    from chatgpt_sidebar.ui.settings_view import SettingsView
+    from chatgpt_sidebar.ui.tabbar import ChatTabBar
+    from chatgpt_sidebar.ui.theme import ThemeManager
+    from chatgpt_sidebar.ui.topbar import TopBar
+    try:
+        from chatgpt_sidebar.ui.stylesheet import apply_stylesheet
+    except ImportError:
+        apply_stylesheet = None  # Tree without the compiled stylesheet
+    
+    app = QApplication(sys.argv[:1])
+    colors = ThemeManager.detect_theme_colors(args.theme)
+    icons = ThemeManager.get_control_icons(colors)
+    config = Config()
+    
+    apply_ms: Optional[float] = None
+    if apply_stylesheet is not None:
+        t0 = time.perf_counter()
+        apply_stylesheet(colors)
+        apply_ms = (time.perf_counter() - t0) * 1000
+    
+    factories: Dict[str, Callable[[], QWidget]] = {
+        "topbar": lambda: TopBar(colors),
+        "tabbar": lambda: ChatTabBar(colors, icons),
+        "settings": lambda: SettingsView(colors, icons, config),
+        "diagnostics": lambda: DiagnosticsView(colors, icons),
+    }
+    raw: Dict[str, Dict[str, List[float]]] = {name: {metric: [] for metric in METRICS} for name in factories}
+    for _ in range(args.runs):
+        for name, factory in factories.items():
+            for metric, value in measure(factory, app).items():
+                raw[name][metric].append(value)
+    
+    summary = {f"{name}/{metric}": summarize(values) for name, metrics in raw.items() for metric, values in metrics.items()}
+    
+    print("=" * 72)
+    print(f"Compiled stylesheet: {'applied in ' + format(apply_ms, '.2f') + ' ms' if apply_ms is not None else 'no'}")
+    print(f"{'Widget / metric':<32} {'first':>12} {'p50':>12} {'p90':>12}")
+    print("-" * 72)
+    for name, stats in summary.items():
+        print(f"{name:<32} {stats['first']:>12.2f} {stats['p50']:>12.2f} {stats['p90']:>12.2f}")
+    print("=" * 72)
+    
+    if args.compare:
+        compare(summary, args.compare)
+    
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "runs": args.runs,
+                "theme": args.theme,
+                "src": str(args.src),
+                "apply_stylesheet_ms": round(apply_ms, 2) if apply_ms is not None else None,
+            },
+            "raw": raw,
+            "summary": summary,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
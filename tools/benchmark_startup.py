@@ -0,0 +1,324 @@
+"""Headless startup and time-to-interactive benchmark.
+
+Launches ``python -m chatgpt_sidebar`` under ``QT_QPA_PLATFORM=offscreen``
+against a local HTTP server that serves ``tools/standin/index.html``, a
+static imitation of the ChatGPT composer DOM. The app reports milestones
+through ``chatgpt_sidebar.utils.milestones``; this script turns them into
+per-run timings and percentiles and writes everything to JSON.
+
+Peak RSS of the process tree (Python + QtWebEngineProcess children) is
+sampled with ``psutil`` when it is installed and reported as null otherwise.
+
+Windows only: the offscreen platform only makes the runs headless. The app
+itself refuses to start on other platforms, and the main window registers
+its AppBar through Win32 calls.
+
+Usage:
+    python tools/benchmark_startup.py --runs 10 --output startup.json
+    python tools/benchmark_startup.py --runs 10 --compare startup.json
+"""
+
+import argparse
+import functools
+import http.server
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import psutil
+except ImportError:  # Optional: only needed for memory figures
+    psutil = None
+
+
+ROOT = Path(__file__).resolve().parent.parent
+STANDIN_DIR = Path(__file__).resolve().parent / "standin"
+
+MILESTONES = ["qapplication", "first_paint", "engine_created", "load_finished", "composer_ready"]
+MILESTONES_ENV = "CHATGPT_SIDEBAR_MILESTONES"
+POLL_INTERVAL_S = 0.05
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    """Static file handler that doesn't log every request."""
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def start_standin_server() -> http.server.ThreadingHTTPServer:
+    """Serve the stand-in page on an ephemeral localhost port.
+    
+    Returns:
+        http.server.ThreadingHTTPServer: Running server (call shutdown() when done)
+    """
+    handler = functools.partial(_QuietHandler, directory=str(STANDIN_DIR))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _tree_rss(proc: "psutil.Process") -> int:
+    """Sum the RSS of a process and all of its descendants.
+    
+    Args:
+        proc: Root process
+        
+    Returns:
+        int: Resident set size in bytes
+    """
+    total = 0
+    for p in [proc] + proc.children(recursive=True):
+        try:
+            total += p.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    return total
+
+
+def _kill_tree(proc: subprocess.Popen) -> None:
+    """Terminate the app and any QtWebEngine helper processes.
+    
+    Args:
+        proc: Launched app process
+    """
+    if psutil is not None:
+        try:
+            for child in psutil.Process(proc.pid).children(recursive=True):
+                child.kill()
+        except psutil.NoSuchProcess:
+            pass
+    proc.kill()
+    proc.wait()
+
+
+def _read_milestones(path: Path) -> Dict[str, int]:
+    """Read milestone records written by the app.
+    
+    Args:
+        path: Milestone file
+        
+    Returns:
+        Dict[str, int]: Milestone name to wall-clock timestamp (ns)
+    """
+    marks = {}
+    if path.exists():
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # Partially written line; picked up on the next poll
+            marks.setdefault(record["name"], record["t_ns"])
+    return marks
+
+
+def run_once(url: str, timeout_s: float, profile_dir: Optional[Path], extra_args: List[str],
+             extra_env: Optional[Dict[str, str]] = None) -> Dict:
+    """Launch the app once and collect its milestones.
+    
+    Args:
+        url: Stand-in page URL
+        timeout_s: Give up waiting for the composer after this many seconds
+        profile_dir: LOCALAPPDATA to use (None for a fresh temporary one)
+        extra_args: Extra command-line arguments for the app
+        extra_env: Extra environment variables for the app
+        
+    Returns:
+        Dict: Milestone offsets in ms (None if not reached), peak RSS in MB and
+            the exit code if the app quit on its own
+    """
+    with tempfile.TemporaryDirectory(prefix="sidebar-bench-") as tmp:
+        marks_path = Path(tmp) / "milestones.jsonl"
+        env = dict(os.environ)
+        env["QT_QPA_PLATFORM"] = "offscreen"
+        env[MILESTONES_ENV] = str(marks_path)
+        env["LOCALAPPDATA"] = str(profile_dir or Path(tmp))
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+        env.update(extra_env or {})
+        
+        cmd = [sys.executable, "-m", "chatgpt_sidebar", "--url", url, "--no-single-instance"] + extra_args
+        start_ns = time.time_ns()
+        proc = subprocess.Popen(cmd, env=env, cwd=str(ROOT),
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        
+        peak_rss = 0
+        ps_proc = psutil.Process(proc.pid) if psutil is not None else None
+        deadline = time.monotonic() + timeout_s
+        marks: Dict[str, int] = {}
+        early_exit: Optional[int] = None
+        try:
+            while time.monotonic() < deadline and proc.poll() is None:
+                if ps_proc is not None:
+                    peak_rss = max(peak_rss, _tree_rss(ps_proc))
+                marks = _read_milestones(marks_path)
+                if "composer_ready" in marks:
+                    break
+                time.sleep(POLL_INTERVAL_S)
+            early_exit = proc.poll()
+        finally:
+            _kill_tree(proc)
+        
+        result = {name: None for name in MILESTONES}
+        for name, t_ns in marks.items():
+            result[name] = (t_ns - start_ns) / 1e6
+        result["peak_rss_mb"] = round(peak_rss / (1024 * 1024), 1) if ps_proc is not None else None
+        result["early_exit_code"] = early_exit
+        return result
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile.
+    
+    Args:
+        values: Sample values (non-empty)
+        pct: Percentile in [0, 100]
+        
+    Returns:
+        float: Percentile value
+    """
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(runs: List[Dict]) -> Dict[str, Optional[Dict[str, float]]]:
+    """Compute percentiles for each metric across runs.
+    
+    Args:
+        runs: Per-run results
+        
+    Returns:
+        Dict: Metric name to {min, p50, p90, p95, max, mean, n}, or None if never reached
+    """
+    summary = {}
+    for metric in MILESTONES + ["peak_rss_mb"]:
+        values = [r[metric] for r in runs if r.get(metric) is not None]
+        if not values:
+            summary[metric] = None
+            continue
+        summary[metric] = {
+            "n": len(values),
+            "min": round(min(values), 1),
+            "p50": round(percentile(values, 50), 1),
+            "p90": round(percentile(values, 90), 1),
+            "p95": round(percentile(values, 95), 1),
+            "max": round(max(values), 1),
+            "mean": round(sum(values) / len(values), 1),
+        }
+    return summary
+
+
+def compare(summary: Dict, baseline_file: Path, tolerance_pct: float) -> bool:
+    """Print p50 deltas against a baseline result file.
+    
+    Args:
+        summary: Current summary
+        baseline_file: Earlier JSON output of this script
+        tolerance_pct: Allowed p50 regression in percent
+        
+    Returns:
+        bool: True if no metric regressed beyond the tolerance
+    """
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))["summary"]
+    ok = True
+    print(f"{'Metric':<18} {'Baseline p50':>14} {'Current p50':>14} {'Delta':>9}")
+    print("-" * 58)
+    for metric, stats in summary.items():
+        base = baseline.get(metric)
+        if not stats or not base:
+            continue
+        delta = (stats["p50"] - base["p50"]) / base["p50"] * 100 if base["p50"] else 0.0
+        flag = ""
+        if delta > tolerance_pct:
+            flag = "  REGRESSION"
+            ok = False
+        print(f"{metric:<18} {base['p50']:>14.1f} {stats['p50']:>14.1f} {delta:>+8.1f}%{flag}")
+    return ok
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark ChatGPT Sidebar startup headlessly")
+    parser.add_argument("--runs", type=int, default=5, help="Number of launches (default: 5)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-run timeout in seconds")
+    parser.add_argument("--delay-ms", type=int, default=300,
+                        help="Simulated composer hydration delay of the stand-in page")
+    parser.add_argument("--warm", action="store_true",
+                        help="Reuse one profile directory across runs instead of a fresh one each time")
+    parser.add_argument("--output", type=Path, help="Write results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Compare p50s against an earlier JSON result")
+    parser.add_argument("--tolerance", type=float, default=10.0,
+                        help="Allowed p50 regression in percent when comparing (default: 10)")
+    parser.add_argument("app_args", nargs=argparse.REMAINDER,
+                        help="Extra arguments passed to the app after '--'")
+    args = parser.parse_args()
+    
+    extra_args = [a for a in args.app_args if a != "--"]
+    if sys.platform != "win32":
+        print("The app only runs on Windows; run this benchmark there.")
+        sys.exit(1)
+    if psutil is None:
+        print("psutil not installed: peak RSS will not be reported (pip install psutil)")
+    
+    server = start_standin_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/index.html?delay={args.delay_ms}"
+    
+    warm_dir = tempfile.TemporaryDirectory(prefix="sidebar-bench-profile-") if args.warm else None
+    runs = []
+    try:
+        for i in range(1, args.runs + 1):
+            result = run_once(url, args.timeout, Path(warm_dir.name) if warm_dir else None, extra_args)
+            runs.append(result)
+            reached = result["composer_ready"]
+            status = f"{reached:.0f} ms" if reached is not None else "not reached"
+            print(f"Run {i}/{args.runs}: composer ready {status}")
+    finally:
+        server.shutdown()
+        if warm_dir:
+            warm_dir.cleanup()
+    
+    summary = summarize(runs)
+    
+    print("=" * 80)
+    print(f"{'Metric':<18} {'p50':>9} {'p90':>9} {'p95':>9} {'min':>9} {'max':>9}")
+    print("-" * 80)
+    for metric, stats in summary.items():
+        if stats is None:
+            print(f"{metric:<18} {'n/a':>9}")
+        else:
+            print(f"{metric:<18} {stats['p50']:>9.1f} {stats['p90']:>9.1f} {stats['p95']:>9.1f} "
+                  f"{stats['min']:>9.1f} {stats['max']:>9.1f}")
+    print("=" * 80)
+    
+    if args.output:
+        report = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "runs": args.runs,
+                "warm": args.warm,
+                "delay_ms": args.delay_ms,
+                "app_args": extra_args,
+            },
+            "runs": runs,
+            "summary": summary,
+        }
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results saved to: {args.output}")
+    
+    if args.compare and not compare(summary, args.compare, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
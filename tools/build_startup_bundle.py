@@ -0,0 +1,143 @@
+"""Build the precompiled startup bundle.
+
+Compiles every module of the package plus the standard library modules
+that a startup import trace shows being imported, and writes them into one
+bundle file (see ``src/chatgpt_sidebar/startup_bundle.py``). Run it with
+the interpreter the app is packaged with: a bundle built by another Python
+version is ignored at runtime.
+
+The trace is recorded by importing the modules needed before the first
+window with ``-X importtime`` (as ``report_imports.py --measure`` does), or
+read from a log of a full run (``tools/profile_startup.bat``).
+
+Usage:
+    python tools/build_startup_bundle.py
+    python tools/build_startup_bundle.py --trace tools/import_profile.log --output build/startup.bundle
+"""
+
+import argparse
+import importlib.util
+import os
+import subprocess
+import sys
+import sysconfig
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from report_imports import STARTUP_IMPORT, parse_import_lines
+
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+PACKAGE_DIR = SRC / "chatgpt_sidebar"
+
+# Loaded before the bundle is installed, so never served from it
+PRELOADED = {"chatgpt_sidebar", "chatgpt_sidebar.startup_bundle"}
+
+os.environ.pop("CHATGPT_SIDEBAR_BUNDLE", None)
+sys.path.insert(0, str(SRC))
+from chatgpt_sidebar.startup_bundle import BUNDLE_FILE_NAME, write_bundle  # noqa: E402
+
+
+def record_trace() -> List[str]:
+    """Import the first-window modules in a fresh interpreter and list what was imported.
+    
+    Returns:
+        List[str]: Imported module names in import order
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", STARTUP_IMPORT],
+                          capture_output=True, text=True, env=env)
+    if proc.returncode != 0:
+        print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "Import failed")
+        sys.exit(1)
+    return [module for _, _, module in parse_import_lines(proc.stderr.splitlines())]
+
+
+def package_modules() -> Dict[str, Tuple[Path, bool, str]]:
+    """List every module of the package.
+    
+    Returns:
+        Dict[str, Tuple[Path, bool, str]]: Module name to (source, is_package, path relative to src)
+    """
+    modules = {}
+    for source in sorted(PACKAGE_DIR.rglob("*.py")):
+        relative = source.relative_to(SRC)
+        parts = list(relative.with_suffix("").parts)
+        is_package = parts[-1] == "__init__"
+        if is_package:
+            parts.pop()
+        name = ".".join(parts)
+        if name not in PRELOADED:
+            modules[name] = (source, is_package, relative.as_posix())
+    return modules
+
+
+def stdlib_modules(names: List[str]) -> Dict[str, Tuple[Path, bool, str]]:
+    """Select the pure-Python standard library modules of a trace.
+    
+    Built-in, frozen and extension modules and anything from site-packages
+    are left to the normal finders.
+    
+    Args:
+        names: Module names from the trace
+        
+    Returns:
+        Dict[str, Tuple[Path, bool, str]]: Module name to (source, is_package, path relative to the stdlib)
+    """
+    stdlib = Path(sysconfig.get_path("stdlib")).resolve()
+    site_packages = Path(sysconfig.get_path("purelib")).resolve()
+    modules = {}
+    for name in names:
+        if name in modules or name.split(".")[0] == "chatgpt_sidebar":
+            continue
+        try:
+            spec = importlib.util.find_spec(name)
+        except (ImportError, ValueError):
+            continue
+        if spec is None or not spec.has_location or not spec.origin or not spec.origin.endswith(".py"):
+            continue
+        source = Path(spec.origin).resolve()
+        if stdlib not in source.parents or site_packages in source.parents:
+            continue
+        modules[name] = (source, spec.submodule_search_locations is not None, source.relative_to(stdlib).as_posix())
+    return modules
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build the precompiled startup bundle")
+    parser.add_argument("--trace", type=Path,
+                        help="-X importtime log to take stdlib modules from (default: record one)")
+    parser.add_argument("--output", type=Path, default=ROOT / "build" / BUNDLE_FILE_NAME,
+                        help=f"Bundle file to write (default: build/{BUNDLE_FILE_NAME})")
+    parser.add_argument("--optimize", type=int, default=0, choices=[0, 1, 2],
+                        help="Optimization level passed to compile() (default: 0)")
+    args = parser.parse_args()
+    
+    if args.trace:
+        with open(args.trace, "r", encoding="utf-8") as f:
+            names = [module for _, _, module in parse_import_lines(f)]
+    else:
+        names = record_trace()
+    
+    sources = {name: (source, is_package, "package", relative)
+               for name, (source, is_package, relative) in package_modules().items()}
+    stdlib = stdlib_modules(names)
+    sources.update((name, (source, is_package, "stdlib", relative))
+                   for name, (source, is_package, relative) in stdlib.items())
+    
+    modules = {}
+    for name, (source, is_package, root, relative) in sources.items():
+        code = compile(source.read_bytes(), str(source), "exec", dont_inherit=True, optimize=args.optimize)
+        modules[name] = (code, is_package, root, relative)
+    
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    size = write_bundle(str(args.output), modules)
+    print(f"Bundled {len(sources) - len(stdlib)} package and {len(stdlib)} stdlib modules "
+          f"({size / 1024:.0f} KB) into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,66 @@
-"""Parse Python import profiling output and report slowest imports."""
+"""Parse Python import profiling output and report slowest imports.
 
-import sys
+Besides printing the slowest imports of a ``-X importtime`` log, the script
+can measure the imports needed before the first window (``chatgpt_sidebar.app``
+and ``chatgpt_sidebar.main_window``) in fresh interpreters, save them as a
+machine-readable baseline and fail when startup imports regress:
+
+- against per-module budgets and a list of modules that must stay lazy
+  (``tools/import_budgets.json``)
+- against an earlier baseline (total self time and per-module cumulative
+  time, plus any package module that wasn't imported at startup before)
+
+Usage:
+    python tools/report_imports.py tools/import_profile.log
+    python tools/report_imports.py --measure --runs 5 --output imports.json
+    python tools/report_imports.py --measure --budgets tools/import_budgets.json --baseline imports.json
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
 import re
-from typing import List, Tuple
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
 from pathlib import Path
 
 
+ROOT = Path(__file__).resolve().parent.parent
+
+# Modules imported before the first window is created
+STARTUP_IMPORT = "import chatgpt_sidebar.app, chatgpt_sidebar.main_window"
+
+PACKAGE = "chatgpt_sidebar"
+
+# Per-module cumulative increases below this are noise (microseconds)
+NOISE_FLOOR_US = 5000
+
+# Pattern: import time: self [us] | cumulative | imported package
+# Example: import time:       123 |        456 | module.name
+IMPORT_LINE = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.+)')
+
+
+def parse_import_lines(lines) -> List[Tuple[int, int, str]]:
+    """Extract self and cumulative times from ``-X importtime`` output.
+    
+    Args:
+        lines: Lines of the output
+        
+    Returns:
+        List of (self_time, cumulative_time, module_name) tuples in microseconds
+    """
+    imports = []
+    for line in lines:
+        match = IMPORT_LINE.search(line)
+        if match:
+            imports.append((int(match.group(1)), int(match.group(2)), match.group(3).strip()))
+    return imports
+
+
 def parse_import_log(log_file: Path) -> List[Tuple[float, str]]:
     """Parse import log file and extract cumulative times.
     
@@ -15,22 +70,8 @@ def parse_import_log(log_file: Path) -> List[Tuple[float, str]]:
     Returns:
         List of (cumulative_time, module_name) tuples
     """
-    imports = []
-    
-    # Pattern: import time: self [us] | cumulative | imported package
-    # Example: import time:       123 |        456 | module.name
-    pattern = re.compile(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.+)')
-    
     with open(log_file, 'r', encoding='utf-8') as f:
-        for line in f:
-            match = pattern.search(line)
-            if match:
-                self_time = int(match.group(1))
-                cumulative_time = int(match.group(2))
-                module_name = match.group(3).strip()
-                imports.append((cumulative_time, module_name))
-    
-    return imports
+        return [(cumulative, module) for _, cumulative, module in parse_import_lines(f)]
 
 
 def format_time(microseconds: float) -> str:
@@ -50,27 +91,14 @@ def format_time(microseconds: float) -> str:
         return f"{microseconds:.0f}μs"
 
 
-def main():
-    """Main entry point."""
-    if len(sys.argv) < 2:
-        print("Usage: python report_imports.py <import_profile.log>")
-        sys.exit(1)
-    
-    log_file = Path(sys.argv[1])
-    
-    if not log_file.exists():
-        print(f"Error: Log file not found: {log_file}")
-        sys.exit(1)
-    
-    # Parse imports
-    imports = parse_import_log(log_file)
-    
-    if not imports:
-        print("No import data found in log file.")
-        sys.exit(1)
+def print_report(imports: List[Tuple[float, str]]) -> None:
+    """Print the 25 slowest imports by cumulative time.
     
+    Args:
+        imports: (cumulative_time, module_name) tuples
+    """
     # Sort by cumulative time (descending)
-    imports.sort(reverse=True)
+    imports = sorted(imports, reverse=True)
     
     # Display top 25
     print("=" * 80)
@@ -95,6 +123,174 @@ def main():
     print("=" * 80)
 
 
+def _median(values: List[int]) -> int:
+    """Median of a non-empty list (lower middle for even lengths)."""
+    values = sorted(values)
+    return values[(len(values) - 1) // 2]
+
+
+def measure(runs: int) -> Dict:
+    """Import the first-window modules in fresh interpreters and take per-module medians.
+    
+    Args:
+        runs: Number of interpreters to start
+        
+    Returns:
+        Dict: Machine-readable report with total self time and per-module times (microseconds)
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    
+    samples: Dict[str, Dict[str, List[int]]] = {}
+    totals = []
+    for i in range(1, runs + 1):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", STARTUP_IMPORT],
+                              capture_output=True, text=True, env=env)
+        if proc.returncode != 0:
+            print(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else "Import failed")
+            sys.exit(1)
+        imports = parse_import_lines(proc.stderr.splitlines())
+        totals.append(sum(self_us for self_us, _, _ in imports))
+        for self_us, cumulative_us, module in imports:
+            entry = samples.setdefault(module, {"self_us": [], "cumulative_us": []})
+            entry["self_us"].append(self_us)
+            entry["cumulative_us"].append(cumulative_us)
+        print(f"Run {i}/{runs}: {format_time(totals[-1])} in {len(imports)} modules")
+    
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "runs": runs,
+            "import": STARTUP_IMPORT,
+        },
+        "total_us": _median(totals),
+        "modules": {
+            module: {"self_us": _median(entry["self_us"]), "cumulative_us": _median(entry["cumulative_us"])}
+            for module, entry in samples.items()
+        },
+    }
+
+
+def check_budgets(report: Dict, budgets_file: Path) -> List[str]:
+    """Check a measurement against the budgets file.
+    
+    Args:
+        report: Output of measure()
+        budgets_file: JSON with total_ms, package_module_ms, modules and lazy
+        
+    Returns:
+        List[str]: Violations (empty if within budget)
+    """
+    budgets = json.loads(budgets_file.read_text(encoding="utf-8"))
+    modules = report["modules"]
+    problems = []
+    
+    total_ms = report["total_us"] / 1000
+    if total_ms > budgets["total_ms"]:
+        problems.append(f"total import time {total_ms:.1f} ms > budget {budgets['total_ms']} ms")
+    
+    # Self time of every package module, with explicit per-module overrides
+    for module, times in modules.items():
+        if module != PACKAGE and not module.startswith(PACKAGE + "."):
+            continue
+        limit_ms = budgets["modules"].get(module, budgets["package_module_ms"])
+        if times["self_us"] / 1000 > limit_ms:
+            problems.append(f"{module}: self {times['self_us'] / 1000:.1f} ms > budget {limit_ms} ms")
+    
+    for pattern in budgets["lazy"]:
+        for module in fnmatch.filter(modules, pattern):
+            problems.append(f"{module} is imported at startup but must stay lazy ({pattern})")
+    return problems
+
+
+def check_baseline(report: Dict, baseline_file: Path, tolerance_pct: float) -> List[str]:
+    """Compare a measurement with an earlier one.
+    
+    Args:
+        report: Output of measure()
+        baseline_file: Earlier JSON output of --output
+        tolerance_pct: Allowed regression in percent
+        
+    Returns:
+        List[str]: Regressions (empty if none)
+    """
+    baseline = json.loads(baseline_file.read_text(encoding="utf-8"))
+    factor = 1 + tolerance_pct / 100
+    problems = []
+    
+    if report["total_us"] > baseline["total_us"] * factor:
+        problems.append(f"total import time {format_time(baseline['total_us'])} -> "
+                        f"{format_time(report['total_us'])}")
+    
+    for module, times in sorted(report["modules"].items()):
+        if module != PACKAGE and not module.startswith(PACKAGE + "."):
+            continue
+        base = baseline["modules"].get(module)
+        if base is None:
+            problems.append(f"{module} is now imported at startup")
+            continue
+        grown_us = times["cumulative_us"] - base["cumulative_us"]
+        if times["cumulative_us"] > base["cumulative_us"] * factor and grown_us > NOISE_FLOOR_US:
+            problems.append(f"{module}: cumulative {format_time(base['cumulative_us'])} -> "
+                            f"{format_time(times['cumulative_us'])}")
+    return problems
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Report and check Python import times")
+    parser.add_argument("log", nargs="?", type=Path, help="-X importtime log to report on")
+    parser.add_argument("--measure", action="store_true",
+                        help="Measure the imports needed before the first window instead of reading a log")
+    parser.add_argument("--runs", type=int, default=5, help="Interpreters to start with --measure (default: 5)")
+    parser.add_argument("--output", type=Path, help="Write the measurement to this JSON file (a baseline)")
+    parser.add_argument("--budgets", type=Path, help="Fail if the measurement exceeds these budgets")
+    parser.add_argument("--baseline", type=Path, help="Fail if the measurement regressed against this baseline")
+    parser.add_argument("--tolerance", type=float, default=20.0,
+                        help="Allowed regression against the baseline in percent (default: 20)")
+    args = parser.parse_args()
+    
+    if not args.measure:
+        if args.log is None:
+            parser.error("give an import log or --measure")
+        if not args.log.exists():
+            print(f"Error: Log file not found: {args.log}")
+            sys.exit(1)
+        
+        # Parse imports
+        imports = parse_import_log(args.log)
+        
+        if not imports:
+            print("No import data found in log file.")
+            sys.exit(1)
+        
+        print_report(imports)
+        return
+    
+    report = measure(args.runs)
+    print_report([(times["cumulative_us"], module) for module, times in report["modules"].items()])
+    print(f"Startup import time (sum of self times, median): {format_time(report['total_us'])}")
+    
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Results saved to: {args.output}")
+    
+    problems = []
+    if args.budgets:
+        problems += check_budgets(report, args.budgets)
+    if args.baseline:
+        problems += check_baseline(report, args.baseline, args.tolerance)
+    if problems:
+        print("Startup import regressions:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    if args.budgets or args.baseline:
+        print("Startup imports within budget")
+
+
 if __name__ == "__main__":
     main()
-